@@ -0,0 +1,179 @@
+"""
+Times every GameOfLife engine on seeded random oceans over a grid of board sizes,
+creature densities and rock ratios, reporting generations/s, cells/s and peak memory.
+Every engine, the reference one included, is stepped through GameOfLife in the same way,
+and the best of several timed repeats is kept to damp scheduling noise.
+
+Results can be stored as a JSON baseline and later runs compared against it:
+    PYTHONPATH=. python benchmarks/game_of_life.py --save-baseline baseline.json
+    PYTHONPATH=. python benchmarks/game_of_life.py --baseline baseline.json --tolerance 0.2
+The comparison exits with status 1 when an engine got slower than the tolerance allows.
+"""
+import argparse
+import gc
+import itertools
+import json
+import sys
+import time
+import tracemalloc
+import typing as tp
+from dataclasses import asdict, dataclass
+
+import numpy as np
+
+from tasks.game_of_life.game_of_life import ENGINES, GameOfLife
+
+
+@dataclass(frozen=True)
+class Result:
+    engine: str
+    size: int
+    density: float
+    rocks: float
+    generations_per_second: float
+    cells_per_second: float
+    peak_bytes: int
+
+    @property
+    def key(self) -> str:
+        return f'{self.engine}/{self.size}/{self.density}/{self.rocks}'
+
+
+def random_ocean(size: int, density: float, rocks: float, seed: int) -> list[list[int]]:
+    """
+    :param density: Fraction of cells holding a creature, split evenly between fish and shrimp.
+    :param rocks: Fraction of cells holding a rock.
+    """
+    rng = np.random.default_rng(seed)
+    p = [1 - density - rocks, rocks, density / 2, density / 2]
+    return rng.choice(4, size=(size, size), p=p).astype(np.uint8).tolist()
+
+
+def make_game(engine: str, ocean: list[list[int]]) -> tuple[GameOfLife, tp.Callable[[], None]]:
+    """
+    Every engine, the reference one included, is driven through GameOfLife the same way.
+    :return: The game and a function releasing its engine.
+    """
+    if engine == 'python':
+        return GameOfLife([row[:] for row in ocean]), lambda: None
+
+    steppers: list[tp.Any] = []
+
+    def build(ocean: list[list[int]]) -> tp.Any:
+        steppers.append(ENGINES[engine](ocean))
+        return steppers[-1]
+
+    game = GameOfLife([row[:] for row in ocean], engine=build)
+    return game, getattr(steppers[0], 'close', lambda: None)
+
+
+def time_generations(engine: str, ocean: list[list[int]], generations: int) -> float:
+    """
+    Steps a fresh engine once to warm it up (caches, worker processes), then times `generations` more.
+    The garbage collector is paused meanwhile, as timeit does.
+    :return: Seconds per generation.
+    """
+    game, close = make_game(engine, ocean)
+    try:
+        stats = game.generations(mode='stats')
+        next(stats)
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            for _ in range(generations):
+                next(stats)
+            return (time.perf_counter() - start) / generations
+        finally:
+            gc.enable()
+    finally:
+        close()
+
+
+def peak_memory(engine: str, ocean: list[list[int]]) -> int:
+    """
+    Allocation tracing slows stepping down, so memory is measured apart from the timings.
+    :return: Peak bytes allocated while building the engine and stepping once.
+    """
+    tracemalloc.start()
+    try:
+        game, close = make_game(engine, ocean)
+        next(game.generations(mode='stats'))
+        close()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run(engines: list[str], sizes: list[int], densities: list[float], rock_ratios: list[float],
+        generations: int, repeats: int, seed: int) -> list[Result]:
+    """
+    Generations are stepped with GameOfLife.generations(mode='stats'), which keeps the population counts
+    but builds no 2D list, so no engine pays for converting its state.
+    Every repeat replays the same generations from a fresh engine, and the repeats of the engines are
+    interleaved so that a slow spell of the machine hits them alike; the best repeat is kept.
+    """
+    results = []
+    print(f"{'engine':>12} {'size':>6} {'density':>8} {'rocks':>6} {'gen/s':>10} {'Mcells/s':>10} {'peak MiB':>9}")
+    for size, density, rocks in itertools.product(sizes, densities, rock_ratios):
+        ocean = random_ocean(size, density, rocks, seed)
+        timings: dict[str, list[float]] = {engine: [] for engine in engines}
+        for _ in range(repeats):
+            for engine in engines:
+                timings[engine].append(time_generations(engine, ocean, generations))
+        for engine in engines:
+            seconds, peak = min(timings[engine]), peak_memory(engine, ocean)
+            result = Result(engine, size, density, rocks, 1 / seconds, size * size / seconds, peak)
+            results.append(result)
+            print(f"{engine:>12} {size:>6} {density:>8} {rocks:>6} {result.generations_per_second:>10.2f} "
+                  f"{result.cells_per_second / 1e6:>10.2f} {peak / 2 ** 20:>9.2f}")
+    return results
+
+
+def compare(results: list[Result], baseline: dict[str, dict[str, float]], tolerance: float) -> bool:
+    """
+    Prints the speed of every result relative to the baseline.
+    :return: True when no result is slower than the baseline by more than `tolerance`.
+    """
+    ok = True
+    print(f"\n{'benchmark':>32} {'speed':>8} {'memory':>8}")
+    for result in results:
+        if result.key not in baseline:
+            continue
+        reference = baseline[result.key]
+        speed = result.generations_per_second / reference['generations_per_second']
+        memory = result.peak_bytes / max(reference['peak_bytes'], 1)
+        regressed = speed < 1 - tolerance
+        ok = ok and not regressed
+        print(f"{result.key:>32} {speed:>7.2f}x {memory:>7.2f}x{'  REGRESSION' if regressed else ''}")
+    return ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--engines', nargs='+', default=['python', *ENGINES], choices=['python', *ENGINES])
+    parser.add_argument('--sizes', nargs='+', type=int, default=[32, 128, 512])
+    parser.add_argument('--densities', nargs='+', type=float, default=[0.2, 0.5])
+    parser.add_argument('--rocks', nargs='+', type=float, default=[0.0, 0.1])
+    parser.add_argument('--generations', type=int, default=20, help='generations timed per repeat')
+    parser.add_argument('--repeats', type=int, default=5, help='timed runs per benchmark; the best one is kept')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--baseline', help='JSON file of a previous run to compare against')
+    parser.add_argument('--save-baseline', help='write the results to this JSON file')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='allowed relative slowdown')
+    args = parser.parse_args()
+
+    results = run(args.engines, args.sizes, args.densities, args.rocks, args.generations, args.repeats, args.seed)
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as f:
+            json.dump({result.key: asdict(result) for result in results}, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if not compare(results, baseline, args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""
+Measures the memory taken by Item, CountedPosition and WeightedPosition objects,
+comparing the slotted classes of tasks.orders with equivalent dict-backed dataclasses.
+
+Run from the repository root:
+    PYTHONPATH=. python benchmarks/orders_memory.py --count 100000
+"""
+import argparse
+import gc
+import tracemalloc
+import typing as tp
+from dataclasses import dataclass
+
+from tasks.orders.orders import CountedPosition, Item, Position, WeightedPosition
+
+
+@dataclass(frozen=True)
+class DictItem:
+    item_id: int
+    title: str
+    cost: int
+
+
+@dataclass
+class DictCountedPosition(Position):
+    item: Item
+    count: int = 1
+
+    @property
+    def cost(self) -> float:
+        return self.item.cost * self.count
+
+
+@dataclass
+class DictWeightedPosition(Position):
+    item: Item
+    weight: float = 1.0
+
+    @property
+    def cost(self) -> float:
+        return self.item.cost * self.weight
+
+
+def bytes_per_object(make: tp.Callable[[], object], count: int) -> float:
+    """
+    :param make: Builds one object; whatever it shares with the others is allocated beforehand.
+    :param count: Number of objects to build.
+    :return: Traced memory growth divided by the number of objects.
+    """
+    objects: list[object] = [None] * count  # allocated up front so that the list is not measured
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        for i in range(count):
+            objects[i] = make()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return (after - before) / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=100_000)
+    args = parser.parse_args()
+
+    # Field values are shared, so only the objects themselves are measured
+    title, weight = 'Spoon', 0.5
+    shared = Item(item_id=0, title=title, cost=10)
+    cases: list[tuple[str, tp.Callable[[], object], tp.Callable[[], object]]] = [
+        ('Item', lambda: DictItem(0, title, 10), lambda: Item(0, title, 10)),
+        ('CountedPosition', lambda: DictCountedPosition(shared, 3), lambda: CountedPosition(shared, 3)),
+        ('WeightedPosition', lambda: DictWeightedPosition(shared, weight), lambda: WeightedPosition(shared, weight)),
+    ]
+
+    print(f"{'class':>18} {'dict B/obj':>11} {'slots B/obj':>12} {'saved':>7}")
+    for name, before, after in cases:
+        with_dict = bytes_per_object(before, args.count)
+        with_slots = bytes_per_object(after, args.count)
+        print(f"{name:>18} {with_dict:>11.1f} {with_slots:>12.1f} {1 - with_slots / with_dict:>6.0%}")
+
+
+if __name__ == '__main__':
+    main()
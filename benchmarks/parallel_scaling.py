@@ -0,0 +1,56 @@
+"""
+Measures how ParallelOcean scales with the number of worker processes.
+
+Run from the repository root:
+    PYTHONPATH=. python benchmarks/parallel_scaling.py --size 2000 --generations 10
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+
+from tasks.game_of_life.parallel import ParallelOcean
+from tasks.game_of_life.vectorized import VectorizedOcean
+
+
+def random_ocean(size: int, seed: int) -> list[list[int]]:
+    rng = np.random.default_rng(seed)
+    grid = rng.choice(4, size=(size, size), p=[0.55, 0.05, 0.2, 0.2]).astype(np.uint8)
+    return grid.tolist()
+
+
+def time_steps(stepper: VectorizedOcean | ParallelOcean, generations: int) -> float:
+    stepper.step()  # warm-up: workers attach shared memory on their first task
+    start = time.perf_counter()
+    for _ in range(generations):
+        stepper.step()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--size', type=int, default=2000)
+    parser.add_argument('--generations', type=int, default=10)
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    ocean = random_ocean(args.size, args.seed)
+    serial = VectorizedOcean(ocean)
+    serial_time = time_steps(serial, args.generations)
+    print(f"{args.size}x{args.size}, {args.generations} generations")
+    print(f"{'workers':>8} {'seconds':>10} {'gen/s':>10} {'speedup':>8}")
+    print(f"{'serial':>8} {serial_time:>10.3f} {args.generations / serial_time:>10.2f} {1.0:>8.2f}")
+
+    workers = 1
+    while workers <= args.max_workers:
+        with ParallelOcean(ocean, workers=workers) as parallel:
+            elapsed = time_steps(parallel, args.generations)
+            assert parallel.to_bytes() == serial.to_bytes(), 'parallel result differs from serial'
+        print(f"{workers:>8} {elapsed:>10.3f} {args.generations / elapsed:>10.2f} {serial_time / elapsed:>8.2f}")
+        workers *= 2
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+import typing as tp
+from collections import defaultdict
+
+import numpy as np
+import numpy.typing as npt
+
+from .neighbourhood import Boundary, check_boundary
+from .rules import CLASSIC, RuleSpec
+from .vectorized import next_generation
+
+
+Stack = npt.NDArray[np.uint8]
+
+
+class BatchOcean(object):
+    """
+    Many independent oceans of the same shape stacked into one (boards, rows, cols) array
+    and advanced together, one vectorized step for the whole batch.
+    """
+    def __init__(self, oceans: tp.Sequence[list[list[int]]], rules: RuleSpec = CLASSIC,
+                 boundary: Boundary = 'fixed') -> None:
+        """
+        :param oceans: 2D lists of the same shape.
+        :param rules: The rules applied to every ocean.
+        :param boundary: What lies beyond the edges of every ocean.
+        """
+        self.rules = rules
+        self.boundary = check_boundary(boundary)
+        shapes = {(len(ocean), len(ocean[0]) if ocean else 0) for ocean in oceans}
+        if len(shapes) > 1:
+            raise ValueError(f"All oceans of a batch must have the same shape, got {sorted(shapes)}")
+        rows, cols = shapes.pop() if shapes else (0, 0)
+        self.grids: Stack = np.array(oceans, dtype=np.uint8).reshape(len(oceans), rows, cols)
+
+    def step(self) -> None:
+        """
+        Advances every ocean of the batch by one generation.
+        """
+        self.grids = next_generation(self.grids, self.rules, self.boundary)
+
+    def advance(self, n: int) -> None:
+        """
+        Advances every ocean of the batch by n generations.
+        """
+        for _ in range(n):
+            self.step()
+
+    def to_oceans(self) -> list[list[list[int]]]:
+        """
+        :return: The current state of every ocean as 2D lists, in input order.
+        """
+        return self.grids.tolist()
+
+
+def simulate_batch(oceans: tp.Sequence[list[list[int]]], generations: int,
+                   rules: RuleSpec = CLASSIC, boundary: Boundary = 'fixed') -> list[list[list[int]]]:
+    """
+    Advances a ragged batch: oceans are grouped by shape, each group is stepped as one BatchOcean.
+    :param oceans: 2D lists of any shapes.
+    :param generations: Number of generations to advance every ocean.
+    :param rules: The rules applied to every ocean.
+    :param boundary: What lies beyond the edges of every ocean.
+    :return: The resulting oceans, in input order.
+    """
+    groups: defaultdict[tuple[int, int], list[int]] = defaultdict(list)
+    for position, ocean in enumerate(oceans):
+        groups[len(ocean), len(ocean[0]) if ocean else 0].append(position)
+
+    results: list[list[list[int]]] = [[] for _ in oceans]
+    for positions in groups.values():
+        batch = BatchOcean([oceans[position] for position in positions], rules, boundary)
+        batch.advance(generations)
+        for position, result in zip(positions, batch.to_oceans()):
+            results[position] = result
+    return results
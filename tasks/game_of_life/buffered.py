@@ -0,0 +1,81 @@
+from .neighbourhood import CELL_WEIGHTS, Boundary, neighbourhood
+from .observer import Census
+from .rules import CLASSIC, EMPTY, FISH, ROCK, SHRIMP, RuleSpec, compile_rules
+
+
+class BufferedOcean(object):
+    """
+    Ocean kept in two preallocated bytearrays (one byte per cell, row by row).
+    Each step writes the next generation into the back buffer and swaps the two,
+    so no memory is allocated per generation.
+    """
+    def __init__(self, ocean: list[list[int]], rules: RuleSpec = CLASSIC, boundary: Boundary = 'fixed') -> None:
+        """
+        :param ocean: A 2D list representing the initial state of the ocean.
+        :param rules: The rules to apply.
+        :param boundary: What lies beyond the edges, resolved once in the neighbour tables.
+        """
+        self.rows = len(ocean)
+        self.cols = len(ocean[0]) if ocean else 0
+        self._front = bytearray(cell for row in ocean for cell in row)
+        self._back = bytearray(len(self._front))
+        self._neighbourhood = neighbourhood(self.rows, self.cols, boundary)
+        self._census = Census.of(bytes(self._front))
+        self._table = compile_rules(rules)
+
+    def view(self) -> memoryview:
+        """
+        Borrows the current generation without copying.
+        The view is indexed as view[i, j] and stays valid only until the next step.
+        :return: A read-only memoryview of shape (rows, cols).
+        """
+        return memoryview(self._front).toreadonly().cast('B', (self.rows, self.cols))
+
+    def step(self) -> None:
+        """
+        Writes the next generation into the back buffer and swaps the buffers.
+        """
+        current, new, table = self._front, self._back, self._table
+        cols = self.cols
+        transitions = [0] * 16  # changed cells, indexed by old state << 2 | new state
+        for i, row_offsets in enumerate(self._neighbourhood.by_row):
+            for j in range(cols):
+                index = i * cols + j
+                cell = current[index]
+                if cell == ROCK:
+                    new[index] = ROCK
+                    continue
+
+                histogram = 0
+                for offset in row_offsets[j]:
+                    histogram += CELL_WEIGHTS[current[index + offset]]
+                value = table[cell << 8 | histogram & 0xFF]
+                new[index] = value
+                if value != cell:
+                    transitions[cell << 2 | value] += 1
+
+        self._front, self._back = new, current
+        self._census = self._census.next(
+            fish_born=transitions[EMPTY << 2 | FISH],
+            fish_died=transitions[FISH << 2 | EMPTY],
+            shrimp_born=transitions[EMPTY << 2 | SHRIMP],
+            shrimp_died=transitions[SHRIMP << 2 | EMPTY],
+        )
+
+    def census(self) -> Census:
+        """
+        :return: Population of the current generation and its births and deaths.
+        """
+        return self._census
+
+    def to_ocean(self) -> list[list[int]]:
+        """
+        :return: The current state as a 2D list.
+        """
+        return [list(self._front[i * self.cols:(i + 1) * self.cols]) for i in range(self.rows)]
+
+    def to_bytes(self) -> bytes:
+        """
+        :return: The current state serialized row by row, one byte per cell.
+        """
+        return bytes(self._front)
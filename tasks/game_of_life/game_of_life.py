@@ -1,17 +1,217 @@
+import hashlib
+import typing as tp
+
+import numpy as np
+
+from .buffered import BufferedOcean
+from .hashlife import HashLifeOcean
+from .incremental import IncrementalOcean
+from .neighbourhood import CELL_WEIGHTS, Boundary, check_boundary, neighbourhood
+from .observer import Census, CellEvent, GenerationSummary, OceanObserver
+from .packed import PackedOcean
+from .parallel import ParallelOcean
+from .rules import CLASSIC, EMPTY, FISH, SHRIMP, RuleSpec, compile_rules
+from .sparse import Cell, SparseOcean
+from .vectorized import VectorizedOcean
+
+
+class Stepper(tp.Protocol):
+    """
+    Alternate engine holding the ocean in its own representation
+    """
+    def step(self) -> None:
+        """
+        Advances the held ocean by one generation.
+        """
+
+    def to_ocean(self) -> list[list[int]]:
+        """
+        :return: The current state as a freshly built 2D list.
+        """
+
+    def to_bytes(self) -> bytes:
+        """
+        :return: The current state serialized row by row, one byte per cell.
+        """
+
+
+@tp.runtime_checkable
+class JumpingStepper(Stepper, tp.Protocol):
+    """
+    Engine able to advance many generations at once
+    """
+    def advance(self, n: int) -> None:
+        """
+        Advances the held ocean by n generations.
+        """
+
+
+@tp.runtime_checkable
+class CensusStepper(Stepper, tp.Protocol):
+    """
+    Engine keeping population counts up to date while stepping
+    """
+    def census(self) -> Census:
+        """
+        :return: Population of the current generation and its births and deaths.
+        """
+
+
+@tp.runtime_checkable
+class ViewStepper(Stepper, tp.Protocol):
+    """
+    Engine able to lend its current state without copying it
+    """
+    def view(self) -> memoryview:
+        """
+        :return: A read-only view of shape (rows, cols), valid until the next step.
+        """
+
+
+@tp.runtime_checkable
+class KeyedStepper(Stepper, tp.Protocol):
+    """
+    Engine able to digest its state more cheaply than through to_bytes
+    """
+    def state_key(self) -> bytes:
+        """
+        :return: A digest equal for equal states of this engine and, in practice, different otherwise.
+        """
+
+
+CellChange = tuple[int, int, int]  # row, column, new value
+
+EngineFactory = tp.Callable[[list[list[int]]], Stepper]
+
+
+class RuledEngineFactory(tp.Protocol):
+    """
+    Builds a Stepper applying the given rules and boundary
+    """
+    def __call__(self, ocean: list[list[int]], rules: RuleSpec = ..., boundary: Boundary = ...) -> Stepper:
+        """
+        :param ocean: A 2D list representing the initial state of the ocean.
+        :param rules: The rules to apply.
+        :param boundary: What lies beyond the edges; engines raise ValueError for boundaries they cannot handle.
+        """
+
+
+ENGINES: dict[str, RuledEngineFactory] = {
+    'numpy': VectorizedOcean,
+    'incremental': IncrementalOcean,
+    'sparse': SparseOcean.from_dense,
+    'hashlife': HashLifeOcean,
+    'parallel': ParallelOcean,
+    'buffered': BufferedOcean,
+    'packed': PackedOcean,
+}
+
+
 class GameOfLife(object):
     """
     Class for the Game of Life
     """
-    def __init__(self, ocean: list[list[int]]) -> None:  # Initialize the ocean attribute in__init__
+    def __init__(
+            self,
+            ocean: list[list[int]] | SparseOcean,
+            engine: str | EngineFactory = 'python',
+            observer: OceanObserver | None = None,
+            rules: RuleSpec = CLASSIC,
+            boundary: Boundary = 'fixed',
+            engine_options: dict[str, tp.Any] | None = None
+    ) -> None:
 
         """
        Initializes the Game of Life with the initial ocean state.
        :param ocean: A 2D list representing the initial state of the ocean.
                      0 = empty cell, 1 = rock, 2 = fish, 3 = shrimp.
+                     A SparseOcean is stepped as it is by the 'sparse' engine, so no dense board is built
+                     until a generation is asked for as a list (see from_cells).
+       :param engine: 'python' for the reference cell-by-cell stepper, a name from ENGINES
+                      or a callable building a Stepper from the ocean.
+       :param observer: Optional OceanObserver receiving per-generation summaries
+                        (and per-cell events when it sets `trace_cells`).
+       :param rules: Birth and survival rules, passed on to named engines;
+                     a callable engine is expected to apply them itself.
+       :param boundary: What lies beyond the edges: 'fixed' (nothing), 'torus' (the opposite edge)
+                        or 'reflect' (a mirror image of the edge); passed on like the rules.
+       :param engine_options: Keyword arguments for a named engine, such as max_nodes for 'hashlife'
+                              or workers for 'parallel'.
+        """
+        if isinstance(ocean, SparseOcean):
+            self.ocean: list[list[int]] = []
+            self.rows, self.cols = ocean.rows, ocean.cols
+        else:
+            self.ocean = ocean
+            self.rows = len(ocean)
+            self.cols = len(ocean[0]) if ocean else 0
+        self.generation = 0
+        self._observer = observer
+        self.rules = rules
+        self._table = compile_rules(rules)
+        self.boundary = check_boundary(boundary)
+        self._neighbourhood = neighbourhood(self.rows, self.cols, self.boundary)
+        if isinstance(ocean, SparseOcean):
+            if engine != 'sparse' or engine_options:
+                raise ValueError(f"A SparseOcean is stepped by the 'sparse' engine, not {engine!r}")
+            if ocean.rules != self.rules or ocean.boundary != self.boundary:
+                raise ValueError("The SparseOcean applies other rules or another boundary than the game")
+            self._stepper: Stepper | None = ocean
+        else:
+            self._stepper = self._make_stepper(engine, engine_options or {})
+
+        # The reference stepper and engines implementing CensusStepper count as they go;
+        # for other engines the state before each step is kept to find births and deaths
+        self._counts_natively = self._stepper is None or isinstance(self._stepper, CensusStepper)
+        self._census = Census.of(self._state_bytes()) if self._stepper is None else None
+        self._previous_bytes: bytes | None = None
+
+    @classmethod
+    def from_cells(
+            cls,
+            rows: int,
+            cols: int,
+            rocks: tp.Iterable[Cell] = (),
+            fish: tp.Iterable[Cell] = (),
+            shrimp: tp.Iterable[Cell] = (),
+            observer: OceanObserver | None = None,
+            rules: RuleSpec = CLASSIC,
+            boundary: Boundary = 'fixed'
+    ) -> 'GameOfLife':
+        """
+        Builds a game on the 'sparse' engine from the coordinates of its creatures, for boards too large
+        for a dense list. Memory then depends on the number of creatures; only the methods returning
+        the ocean as a 2D list (get_next_generation, advance, generations in 'state' mode) build the board.
+        :param rows: Number of rows of the board.
+        :param cols: Number of columns of the board.
+        :param rocks: Coordinates of rocks.
+        :param fish: Coordinates of fish.
+        :param shrimp: Coordinates of shrimp.
+        :param observer: Optional OceanObserver, as for the constructor.
+        :param rules: Birth and survival rules.
+        :param boundary: What lies beyond the edges.
+        :return: The game at generation 0.
+        """
+        sparse = SparseOcean(rows, cols, rocks, fish, shrimp, rules, boundary)
+        return cls(sparse, engine='sparse', observer=observer, rules=rules, boundary=boundary)
+
+    def _make_stepper(self, engine: str | EngineFactory, options: dict[str, tp.Any]) -> Stepper | None:
         """
-        self.ocean = ocean
-        self.rows = len(ocean)
-        self.cols = len(ocean[0]) if ocean else 0
+        Builds the alternate engine, or returns None for the reference Python stepper.
+        :param engine: Engine name or factory.
+        :param options: Keyword arguments for a named engine.
+        :return: The stepper holding the ocean state.
+        """
+        if options and not (isinstance(engine, str) and engine in ENGINES):
+            raise TypeError(f"engine_options are only accepted by the engines in ENGINES, not {engine!r}")
+        if engine == 'python':
+            return None
+        if isinstance(engine, str):
+            if engine not in ENGINES:
+                raise ValueError(f"Unknown engine {engine!r}, expected 'python' or one of {sorted(ENGINES)}")
+            factory: tp.Callable[..., Stepper] = ENGINES[engine]
+            return factory(self.ocean, self.rules, self.boundary, **options)
+        return engine(self.ocean)
 
     def _get_neighbours(self, i: int, j: int) -> list[tuple[int, int]]:
         """
@@ -20,84 +220,327 @@ class GameOfLife(object):
         :param j: Column index of the current cell.
         :return: A list of tuples representing the coordinates of valid neighbours.
         """
-        directions = [
-            (-1, -1), (-1, 0), (-1, 1),
-            (0, -1),
-            (1, -1), (1, 0), (1, 1)
-        ]
-        neighbours = []
-        for di, dj in directions:
-            ni, nj = i + di, j + dj
-            if 0 <= ni < self.rows and 0 <= nj < self.cols:
-                neighbours.append((ni, nj))
-        return neighbours
-
-    def _count_neighbours(self, i: int, j: int, value: int) -> int:
-        """
-        Counts the number of neighbors of a specific type (fish or shrimp) around a given cell.
-        :param i: Row index of the current cell
-        :param j: Column index of the current cell
-        :param value: The type of cell to count (2 for fish, 3 for shrimp)
-        :return: The number of neighbors matching the given type
-        """
-        neighbour_count = 0
-
-        # Iterate over the 8 neighboring cells around (i, j)
-        for x in range(i - 1, i + 2):
-            for y in range(j - 1, j + 2):
-                # Check if the neighbor is within bounds
-                if 0 <= x < self.rows and 0 <= y < self.cols:
-                    # Check if it's not the current cell and matches the given value (fish or shrimp)
-                    if (x != i or y != j) and self.ocean[x][y] == value:
-                        neighbour_count += 1
-
-        return neighbour_count
+        index = i * self.cols + j
+        return [divmod(index + offset, self.cols) for offset in self._neighbourhood.by_row[i][j]]
+
+    def _count_neighbours(self, weights: list[int], index: int) -> int:
+        """
+        Counts fish, shrimp and rock neighbours of a cell in a single pass over its neighbourhood.
+        :param weights: CELL_WEIGHTS of the ocean cells, flattened row by row
+        :param index: Flat index of the current cell (i * cols + j)
+        :return: The neighbour histogram: fish count in bits 0-3, shrimp in bits 4-7, rocks in bits 8-11
+        """
+        histogram = 0
+
+        # Border cells have fewer offsets, so no bounds checks are needed
+        for offset in self._neighbourhood.offsets(index):
+            histogram += weights[index + offset]
+
+        return histogram
+
+    def _flatten(self) -> list[int]:
+        """
+        :return: The ocean flattened row by row.
+        """
+        return [cell for row in self.ocean for cell in row]
+
+    def _state_key(self) -> bytes:
+        """
+        Digests the current state so equal generations get equal keys.
+        :return: A short hash of the ocean contents.
+        """
+        if isinstance(self._stepper, KeyedStepper):
+            return self._stepper.state_key()
+        return hashlib.blake2b(self._state_bytes(), digest_size=16).digest()
+
+    def _state_bytes(self) -> bytes:
+        """
+        :return: The current state serialized row by row, one byte per cell.
+        """
+        if self._stepper is not None:
+            return self._stepper.to_bytes()
+        return b''.join(bytes(row) for row in self.ocean)
+
+    def _sync_ocean(self) -> list[list[int]]:
+        """
+        Refreshes the ocean attribute from the engine state.
+        :return: A 2D list representing the current ocean.
+        """
+        if self._stepper is not None:
+            self.ocean = self._stepper.to_ocean()
+        return self.ocean
+
+    @property
+    def stats(self) -> GenerationSummary:
+        """
+        Population of the current generation and its births and deaths since the previous one.
+        Cheap for engines counting while stepping; other engines pay a scan of the state.
+        """
+        return self._summarize()
 
     def get_next_generation(self) -> list[list[int]]:
         """
         Calculates the next generation of the ocean state based on the rules of the game.
+        Every generation is a newly built list that the game never modifies afterwards,
+        so it can be kept as a snapshot without copying (as long as the caller does not modify it either).
         :return: A 2D list representing the next generation of the ocean.
         """
+        self._step()
+        return self._sync_ocean()
+
+    def next_view(self) -> memoryview:
+        """
+        Calculates the next generation like get_next_generation, but lends the engine's own buffer
+        instead of building a 2D list, so no memory is allocated per generation.
+        Only engines implementing ViewStepper (such as 'buffered') support it. The view is indexed as view[i, j]
+        and stays valid only until the next step; the ocean attribute is not refreshed.
+        :return: A read-only memoryview of shape (rows, cols) over the next generation.
+        """
+        if not isinstance(self._stepper, ViewStepper):
+            raise TypeError("next_view needs an engine lending views of its state, such as 'buffered'")
+        self._step()
+        return self._stepper.view()
+
+    @tp.overload
+    def generations(self, every: int = ..., mode: tp.Literal['state'] = ...,
+                    limit: int | None = ...) -> tp.Iterator[list[list[int]]]:
+        ...
+
+    @tp.overload
+    def generations(self, every: int = ..., *, mode: tp.Literal['diff'],
+                    limit: int | None = ...) -> tp.Iterator[list[CellChange]]:
+        ...
+
+    @tp.overload
+    def generations(self, every: int = ..., *, mode: tp.Literal['stats'],
+                    limit: int | None = ...) -> tp.Iterator[GenerationSummary]:
+        ...
+
+    def generations(
+            self,
+            every: int = 1,
+            mode: str = 'state',
+            limit: int | None = None
+    ) -> tp.Iterator[list[list[int]] | list[CellChange] | GenerationSummary]:
+        """
+        Lazily yields the upcoming generations; nothing but the latest state is kept.
+        :param every: Yield only every k-th generation.
+        :param mode: 'state' yields the ocean as a 2D list,
+                     'diff' yields the (row, column, new value) changes since the previously yielded generation,
+                     'stats' yields a GenerationSummary.
+        :param limit: Stop after this many items; None to iterate forever.
+        :return: An iterator over the requested views of the generations.
+        """
+        if every < 1:
+            raise ValueError(f"every must be positive, got {every}")
+        if mode not in ('state', 'diff', 'stats'):
+            raise ValueError(f"Unknown mode {mode!r}, expected 'state', 'diff' or 'stats'")
+
+        previous = self._state_bytes() if mode == 'diff' else b''
+        produced = 0
+        while limit is None or produced < limit:
+            for _ in range(every):
+                self._step()
+            produced += 1
+
+            if mode == 'state':
+                yield self._sync_ocean()
+            elif mode == 'stats':
+                yield self._summarize()
+            else:
+                current = self._state_bytes()
+                yield self._diff(previous, current)
+                previous = current
+
+    def _diff(self, previous: bytes, current: bytes) -> list[CellChange]:
+        """
+        :param previous: A state serialized row by row.
+        :param current: A later state serialized the same way.
+        :return: The (row, column, new value) of every cell that differs.
+        """
+        before = np.frombuffer(previous, dtype=np.uint8)
+        after = np.frombuffer(current, dtype=np.uint8)
+        changes = []
+        for index in np.flatnonzero(before != after).tolist():
+            i, j = divmod(index, self.cols)
+            changes.append((i, j, current[index]))
+        return changes
+
+    def advance(self, n: int) -> list[list[int]]:
+        """
+        Calculates the generation n steps ahead of the current one.
+        Every generation is hashed; once a state repeats (a still life or a periodic cycle)
+        the remaining steps are skipped modulo the cycle period.
+        Engines that can jump by themselves (see JumpingStepper) are asked to advance directly.
+        :param n: Number of generations to advance.
+        :return: A 2D list representing the ocean after n generations.
+        """
+        for _ in self.advancing(n):
+            pass
+        return self._sync_ocean()
+
+    def advancing(self, n: int) -> tp.Iterator[int]:
+        """
+        Advances n generations like advance, but lazily: the game only moves on while the iterator is consumed,
+        and it is left at a whole generation whenever iteration pauses or stops. The cycle detection spans
+        the whole iteration, so a caller advancing in chunks still skips repeating states.
+        The ocean attribute is not refreshed; advance(0) returns the state reached.
+        :param n: Number of generations to advance.
+        :return: An iterator over the number of generations done so far, ending with n;
+                 skipped generations are not yielded one by one.
+        """
+        if n < 0:
+            raise ValueError(f"Cannot advance a negative number of generations: {n}")
+        return self._advancing(n)
+
+    def _advancing(self, n: int) -> tp.Iterator[int]:
+        if isinstance(self._stepper, JumpingStepper) and n > 0:
+            # Jump to the generation before the last one, so births and deaths cover a single generation
+            if n > 1:
+                self._stepper.advance(n - 1)
+            self._remember_state()
+            self._stepper.step()
+            self.generation += n
+            if self._observer is not None:
+                self._observer.on_generation(self._summarize())
+            yield n
+            return
+
+        seen: dict[bytes, int] = {}
+        generation = 0
+        while generation < n:
+            key = self._state_key()
+            if key in seen:
+                # The current state equals the one at generation seen[key]
+                period = generation - seen[key]
+                remainder = (n - generation) % period
+                self.generation += n - generation - remainder
+                generation = n - remainder
+                if remainder == 0:
+                    if self._observer is not None:
+                        # The skipped generations are not reported, but the one reached is
+                        self._observer.on_generation(self._summarize())
+                    yield generation
+                for _ in range(remainder):
+                    self._step()
+                    generation += 1
+                    yield generation
+                return
+            seen[key] = generation
+            self._step()
+            generation += 1
+            yield generation
+
+    def _step(self) -> None:
+        """
+        Replaces the current state with the next generation and notifies the observer.
+        """
+        if self._stepper is not None:
+            tracing = self._observer is not None and self._observer.trace_cells
+            if tracing:
+                self._sync_ocean()
+            self._remember_state()
+            self._stepper.step()
+            if tracing:
+                self._trace_cells(self._stepper.to_ocean())
+        else:
+            self._step_python()
+
+        self.generation += 1
+        if self._observer is not None:
+            self._observer.on_generation(self._summarize())
+
+    def _remember_state(self) -> None:
+        """
+        Keeps the state about to be replaced when the engine cannot count births and deaths itself.
+        """
+        if not self._counts_natively:
+            assert self._stepper is not None
+            self._previous_bytes = self._stepper.to_bytes()
+
+    def _current_census(self) -> Census:
+        """
+        :return: The census kept while stepping, or one rebuilt by scanning the state.
+        """
+        if self._census is not None:
+            return self._census
+        if isinstance(self._stepper, CensusStepper):
+            return self._stepper.census()
+
+        raw = self._state_bytes()
+        census = Census.of(raw)
+        if self._previous_bytes is None:
+            return census
+        before = np.frombuffer(self._previous_bytes, dtype=np.uint8) >= 2
+        after = np.frombuffer(raw, dtype=np.uint8) >= 2
+        return census._replace(
+            births=int(np.count_nonzero(after & ~before)),
+            deaths=int(np.count_nonzero(before & ~after)),
+        )
+
+    def _summarize(self) -> GenerationSummary:
+        """
+        :return: The summary of the current generation.
+        """
+        return GenerationSummary(self.generation, *self._current_census())
+
+    def _trace_cells(self, new_ocean: list[list[int]]) -> None:
+        """
+        Reports every cell update to the observer. Must run while self.ocean still holds the previous state.
+        :param new_ocean: The next generation computed from self.ocean.
+        """
+        assert self._observer is not None
+        cells = self._flatten()
+        weights = [CELL_WEIGHTS[cell] for cell in cells]
+        for i in range(self.rows):
+            for j in range(self.cols):
+                index = i * self.cols + j
+                histogram = self._count_neighbours(weights, index)
+                self._observer.on_cell(CellEvent(
+                    generation=self.generation + 1,
+                    i=i,
+                    j=j,
+                    cell=cells[index],
+                    fish_count=histogram & 0xF,
+                    shrimp_count=histogram >> 4 & 0xF,
+                    new_cell=new_ocean[i][j],
+                ))
+
+    def _step_python(self) -> None:
+        """
+        Reference cell-by-cell implementation of the rules.
+        """
+
+        cells = self._flatten()
+        weights = [CELL_WEIGHTS[cell] for cell in cells]
+        table = self._table
+
         # Create a new ocean grid for the next generation
         new_ocean = [[0] * self.cols for _ in range(self.rows)]
+        transitions = [0] * 16  # indexed by old state << 2 | new state
 
         # Iterate through each cell of the ocean grid
         for i in range(self.rows):
+            new_row = new_ocean[i]
             for j in range(self.cols):
-                cell = self.ocean[i][j]  # Get the current cell value
-                fish_count = self._count_neighbours(i, j, value=2)  # Count fish neighbors
-                shrimp_count = self._count_neighbours(i, j, value=3)  # Count shrimp neighbors
-
-                # Debug: print the current state
-                print(f"Cell ({i}, {j}): Current={cell}, FishCount={fish_count}, ShrimpCount={shrimp_count}")
-
-                # Apply rules for different cell types
-                if cell == 1:  # Rock stays unchanged
-                    new_ocean[i][j] = 1
-                elif cell == 2:  # Fish rules
-                    if fish_count < 2 or fish_count >= 4:
-                        new_ocean[i][j] = 0  # Fish dies
-                    else:
-                        new_ocean[i][j] = 2  # Fish survives
-                elif cell == 3:  # Shrimp rules
-                    if shrimp_count < 2 or shrimp_count >= 4:
-                        new_ocean[i][j] = 0  # Shrimp dies
-                    else:
-                        new_ocean[i][j] = 3  # Shrimp survives
-                elif cell == 0:  # Empty cell rules
-                    if fish_count == 3:
-                        new_ocean[i][j] = 2  # New fish born
-                    elif shrimp_count == 3:
-                        new_ocean[i][j] = 3  # New shrimp born
-
-                # Debug: print the new value of the cell
-                print(f"New Cell ({i}, {j}): NewValue={new_ocean[i][j]}")
-
-        # Debug: print the next generation ocean
-        print("Next Generation:")
-        for row in new_ocean:
-            print(row)
-
-        # Update the ocean to the new generation and return it
+                index = i * self.cols + j
+                cell = cells[index]  # Get the current cell value
+                histogram = self._count_neighbours(weights, index)  # Count all neighbours at once
+
+                # Apply the rules with a single lookup and count the transition
+                new_cell = table[cell << 8 | histogram & 0xFF]
+                new_row[j] = new_cell
+                transitions[cell << 2 | new_cell] += 1
+
+        if self._observer is not None and self._observer.trace_cells:
+            self._trace_cells(new_ocean)
+
+        # Update the ocean to the new generation
         self.ocean = new_ocean
-        return self.ocean
+        assert self._census is not None
+        self._census = self._census.next(
+            fish_born=transitions[EMPTY << 2 | FISH],
+            fish_died=transitions[FISH << 2 | EMPTY],
+            shrimp_born=transitions[EMPTY << 2 | SHRIMP],
+            shrimp_died=transitions[SHRIMP << 2 | EMPTY],
+        )
@@ -0,0 +1,333 @@
+from .neighbourhood import CELL_WEIGHTS, Boundary, check_boundary, neighbourhood
+from .observer import Census
+from .rules import CLASSIC, EMPTY, FISH, ROCK, SHRIMP, RuleSpec, compile_rules
+
+
+class Node(object):
+    """
+    Immutable square block of 2**level x 2**level cells made of four quadrants.
+    Leaves (level 0) hold a single cell state; their quadrants point to themselves.
+    Nodes are hash-consed by HashLifeOcean, so equal blocks are the same object.
+    Every node counts the fish and shrimp it holds.
+    """
+    __slots__ = ('level', 'nw', 'ne', 'sw', 'se', 'state', 'fish', 'shrimp')
+
+    def __init__(self, level: int, nw: 'Node | None', ne: 'Node | None', sw: 'Node | None', se: 'Node | None',
+                 state: int = EMPTY) -> None:
+        self.level = level
+        self.nw: Node = nw or self
+        self.ne: Node = ne or self
+        self.sw: Node = sw or self
+        self.se: Node = se or self
+        self.state = state
+        if level == 0:
+            self.fish = int(state == FISH)
+            self.shrimp = int(state == SHRIMP)
+        else:
+            self.fish = self.nw.fish + self.ne.fish + self.sw.fish + self.se.fish
+            self.shrimp = self.nw.shrimp + self.ne.shrimp + self.sw.shrimp + self.se.shrimp
+
+
+class HashLifeOcean(object):
+    """
+    HashLife engine: the ocean is a quadtree of canonical nodes and the future of every node
+    is memoized, so repetitive oceans advance 2**k generations in one recursive call.
+    The board is embedded in a universe padded with rocks, which never change and are not counted
+    as neighbours, reproducing the bounded edges of GameOfLife.
+    Nodes count their own creatures, and births and deaths are found by comparing the quadtree with the one
+    before the last jump, skipping the blocks both share; so the census costs nothing until it is read.
+    """
+    def __init__(self, ocean: list[list[int]], rules: RuleSpec = CLASSIC, boundary: Boundary = 'fixed',
+                 max_nodes: int | None = 1_000_000) -> None:
+        """
+        :param ocean: A 2D list representing the initial state of the ocean.
+        :param rules: The rules to apply.
+        :param boundary: Only 'fixed' is supported: the universe around the board is made of rocks.
+        :param max_nodes: When the node table grows beyond this size, even in the middle of a jump, all caches
+                          are dropped; once the jump is over only the current quadtree is kept. A bound smaller
+                          than the working set of a jump makes it recompute blocks instead of reusing them.
+                          None disables eviction.
+        """
+        if check_boundary(boundary) != 'fixed':
+            raise ValueError(f"HashLifeOcean only supports the fixed boundary, got {boundary!r}")
+        self.rows = len(ocean)
+        self.cols = len(ocean[0]) if ocean else 0
+        self.max_nodes = max_nodes
+        self.evictions = 0
+        self._evicted = False
+        self._cells = self.rows * self.cols
+        self._rock_count = sum(row.count(ROCK) for row in ocean)
+
+        self._nodes: dict[tuple[Node, Node, Node, Node], Node] = {}
+        self._results: dict[tuple[Node, int], Node] = {}
+        self._leaves = [Node(0, None, None, None, None, state) for state in range(4)]
+        self._rocks = [self._leaves[ROCK]]
+        self._block = neighbourhood(4, 4)
+        self._table = compile_rules(rules)
+
+        level = 3
+        while 1 << (level - 1) < max(self.rows, self.cols):
+            level += 1
+        # The board starts at the top-left corner of the central quadrant of the universe
+        self._origin = 1 << (level - 2)
+        self.root = self._build(ocean, level, -self._origin, -self._origin)
+        self._previous: Node | None = None
+
+    def _join(self, nw: Node, ne: Node, sw: Node, se: Node) -> Node:
+        """
+        :return: The canonical node made of the given quadrants.
+        """
+        key = (nw, ne, sw, se)
+        node = self._nodes.get(key)
+        if node is None:
+            node = self._nodes[key] = Node(nw.level + 1, nw, ne, sw, se)
+        return node
+
+    def _rock(self, level: int) -> Node:
+        """
+        :return: The canonical node of the given level filled with rocks.
+        """
+        while len(self._rocks) <= level:
+            block = self._rocks[-1]
+            self._rocks.append(self._join(block, block, block, block))
+        return self._rocks[level]
+
+    def _build(self, ocean: list[list[int]], level: int, top: int, left: int) -> Node:
+        """
+        Builds the node covering the square with the given board coordinates of its top-left cell.
+        """
+        size = 1 << level
+        if top >= self.rows or left >= self.cols or top + size <= 0 or left + size <= 0:
+            return self._rock(level)
+        if level == 0:
+            return self._leaves[ocean[top][left]]
+        half = size >> 1
+        return self._join(
+            self._build(ocean, level - 1, top, left),
+            self._build(ocean, level - 1, top, left + half),
+            self._build(ocean, level - 1, top + half, left),
+            self._build(ocean, level - 1, top + half, left + half),
+        )
+
+    def _centre(self, node: Node) -> Node:
+        """
+        :return: A node one level higher with `node` in its middle and rocks around it.
+        """
+        rock = self._rock(node.level - 1)
+        return self._join(
+            self._join(rock, rock, rock, node.nw),
+            self._join(rock, rock, node.ne, rock),
+            self._join(rock, node.sw, rock, rock),
+            self._join(node.se, rock, rock, rock),
+        )
+
+    def _life_4x4(self, node: Node) -> Node:
+        """
+        Applies the rules once to a 4x4 block.
+        :return: The central 2x2 block of the next generation.
+        """
+        nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+        cells = (
+            nw.nw.state, nw.ne.state, ne.nw.state, ne.ne.state,
+            nw.sw.state, nw.se.state, ne.sw.state, ne.se.state,
+            sw.nw.state, sw.ne.state, se.nw.state, se.ne.state,
+            sw.sw.state, sw.se.state, se.sw.state, se.se.state,
+        )
+        new_cells = []
+        for index in (5, 6, 9, 10):
+            histogram = 0
+            for offset in self._block.offsets(index):
+                histogram += CELL_WEIGHTS[cells[index + offset]]
+            new_cell = self._table[cells[index] << 8 | histogram & 0xFF]
+            new_cells.append(self._leaves[new_cell])
+        return self._join(*new_cells)
+
+    def _successor(self, node: Node, j: int) -> Node:
+        """
+        Advances the central half of a node by 2**j generations, j <= node.level - 2.
+        :return: The memoized node one level lower.
+        """
+        key = (node, j)
+        result = self._results.get(key)
+        if result is not None:
+            return result
+
+        if node.level == 2:
+            result = self._life_4x4(node)
+        else:
+            # At full speed (j == level - 2) the jump is split into two halves of 2**(j - 1)
+            inner = min(j, node.level - 3)
+            nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+            c1 = self._successor(nw, inner)
+            c2 = self._successor(self._join(nw.ne, ne.nw, nw.se, ne.sw), inner)
+            c3 = self._successor(ne, inner)
+            c4 = self._successor(self._join(nw.sw, nw.se, sw.nw, sw.ne), inner)
+            c5 = self._successor(self._join(nw.se, ne.sw, sw.ne, se.nw), inner)
+            c6 = self._successor(self._join(ne.sw, ne.se, se.nw, se.ne), inner)
+            c7 = self._successor(sw, inner)
+            c8 = self._successor(self._join(sw.ne, se.nw, sw.se, se.sw), inner)
+            c9 = self._successor(se, inner)
+            if inner == j:
+                # The nine sub-results are already 2**j generations ahead, keep their centres
+                result = self._join(
+                    self._join(c1.se, c2.sw, c4.ne, c5.nw),
+                    self._join(c2.se, c3.sw, c5.ne, c6.nw),
+                    self._join(c4.se, c5.sw, c7.ne, c8.nw),
+                    self._join(c5.se, c6.sw, c8.ne, c9.nw),
+                )
+            else:
+                # The second half of the jump is taken on the four overlapping blocks
+                result = self._join(
+                    self._successor(self._join(c1, c2, c4, c5), inner),
+                    self._successor(self._join(c2, c3, c5, c6), inner),
+                    self._successor(self._join(c4, c5, c7, c8), inner),
+                    self._successor(self._join(c5, c6, c8, c9), inner),
+                )
+
+        self._results[key] = result
+        if self.max_nodes is not None and len(self._nodes) > self.max_nodes:
+            self._evict()
+        return result
+
+    def _evict(self) -> None:
+        """
+        Drops every memoized result and canonical node; nodes still in use stay valid, only no longer shared.
+        """
+        self._results.clear()
+        self._nodes.clear()
+        self._rocks = [self._leaves[ROCK]]
+        self.evictions += 1
+        self._evicted = True
+
+    def _expand(self) -> None:
+        """
+        Doubles the universe, keeping the board in the central quadrant.
+        """
+        self._origin += 1 << (self.root.level - 1)
+        self.root = self._centre(self.root)
+
+    def advance(self, n: int) -> None:
+        """
+        Advances n generations, jumping by the largest powers of two first.
+        :param n: Number of generations.
+        """
+        self._previous = self.root
+        while n > 0:
+            j = n.bit_length() - 1
+            while j > self.root.level - 2:
+                self._expand()
+            self.root = self._centre(self._successor(self.root, j))
+            n -= 1 << j
+            if self._evicted:
+                # Share equal blocks of the new quadtree again
+                self.clear_cache()
+                self._evicted = False
+
+    def step(self) -> None:
+        """
+        Advances the held ocean by one generation.
+        """
+        self.advance(1)
+
+    def census(self) -> Census:
+        """
+        :return: Population of the current generation, with the births and deaths since the state
+                 before the last call to advance or step.
+        """
+        fish, shrimp = self.root.fish, self.root.shrimp
+        births = deaths = 0
+        if self._previous is not None:
+            births, deaths = self._changes(self._previous, self.root)
+        return Census(
+            empty=self._cells - self._rock_count - fish - shrimp,
+            rocks=self._rock_count,
+            fish=fish,
+            shrimp=shrimp,
+            births=births,
+            deaths=deaths,
+        )
+
+    def _changes(self, before: Node, after: Node) -> tuple[int, int]:
+        """
+        Compares two states of the universe, the earlier one possibly not yet expanded to the later size.
+        :return: The number of cells that came alive and of those that died in between.
+        """
+        while before.level < after.level:
+            before = self._centre(before)
+        seen: dict[tuple[Node, Node], tuple[int, int]] = {}
+
+        def compare(old: Node, new: Node) -> tuple[int, int]:
+            if old is new or old.fish + old.shrimp + new.fish + new.shrimp == 0:
+                return 0, 0
+            if old.level == 0:
+                was_alive, is_alive = old.state >= FISH, new.state >= FISH
+                return int(is_alive and not was_alive), int(was_alive and not is_alive)
+            key = (old, new)
+            counts = seen.get(key)
+            if counts is None:
+                counts = (0, 0)
+                for old_part, new_part in ((old.nw, new.nw), (old.ne, new.ne), (old.sw, new.sw), (old.se, new.se)):
+                    born, died = compare(old_part, new_part)
+                    counts = (counts[0] + born, counts[1] + died)
+                seen[key] = counts
+            return counts
+
+        return compare(before, after)
+
+    def cache_info(self) -> dict[str, int]:
+        """
+        :return: Sizes of the canonical node table and of the memoized results.
+        """
+        return {'nodes': len(self._nodes), 'results': len(self._results), 'evictions': self.evictions}
+
+    def clear_cache(self) -> None:
+        """
+        Drops all memoized results and every node not reachable from the current root.
+        """
+        self._results.clear()
+        self._nodes.clear()
+        self._rocks = [self._leaves[ROCK]]
+
+        interned: dict[int, Node] = {}
+
+        def intern(node: Node) -> Node:
+            if node.level == 0:
+                return node
+            canonical = interned.get(id(node))
+            if canonical is None:
+                canonical = interned[id(node)] = self._join(
+                    intern(node.nw), intern(node.ne), intern(node.sw), intern(node.se)
+                )
+            return canonical
+
+        self.root = intern(self.root)
+
+    def _fill(self, node: Node, top: int, left: int, ocean: list[list[int]]) -> None:
+        """
+        Writes the cells of a node that fall onto the board.
+        """
+        size = 1 << node.level
+        if top >= self.rows or left >= self.cols or top + size <= 0 or left + size <= 0:
+            return
+        if node.level == 0:
+            ocean[top][left] = node.state
+            return
+        half = size >> 1
+        self._fill(node.nw, top, left, ocean)
+        self._fill(node.ne, top, left + half, ocean)
+        self._fill(node.sw, top + half, left, ocean)
+        self._fill(node.se, top + half, left + half, ocean)
+
+    def to_ocean(self) -> list[list[int]]:
+        """
+        :return: The current state as a 2D list.
+        """
+        ocean = [[EMPTY] * self.cols for _ in range(self.rows)]
+        self._fill(self.root, -self._origin, -self._origin, ocean)
+        return ocean
+
+    def to_bytes(self) -> bytes:
+        """
+        :return: The current state serialized row by row, one byte per cell.
+        """
+        return b''.join(bytes(row) for row in self.to_ocean())
@@ -0,0 +1,188 @@
+import os
+import struct
+import typing as tp
+from array import array
+
+from .game_of_life import CellChange, GameOfLife
+
+
+MAGIC = b'OCEANHST'
+HEADER = struct.Struct('<8sQQQQ')  # magic, rows, cols, keyframe interval, generations
+
+PathLike = str | os.PathLike[str]
+
+
+class History(object):
+    """
+    A recorded run: the initial ocean and, for every generation, the cells that changed.
+    Each change is packed into one integer, `index << 2 | value` with index = i * cols + j,
+    and all changes share one flat array; a full state is kept every `keyframe_every`
+    generations so any generation is rebuilt from at most that many change lists.
+    """
+    def __init__(self, rows: int, cols: int, initial: bytes, keyframe_every: int = 64) -> None:
+        """
+        :param rows: Number of rows of the board.
+        :param cols: Number of columns of the board.
+        :param initial: The initial state serialized row by row, one byte per cell.
+        :param keyframe_every: Number of generations between two stored full states.
+        """
+        if keyframe_every < 1:
+            raise ValueError(f"keyframe_every must be positive, got {keyframe_every}")
+        if len(initial) != rows * cols:
+            raise ValueError(f"Expected {rows * cols} cells, got {len(initial)}")
+        self.rows = rows
+        self.cols = cols
+        self.keyframe_every = keyframe_every
+        self.changes = array('I' if rows * cols < 1 << 30 else 'Q')
+        self.starts = array('Q', [0])  # changes of generation g are changes[starts[g - 1]:starts[g]]
+        self.keyframes: list[bytes] = [bytes(initial)]
+        self._state = bytearray(initial)
+
+    @property
+    def generations(self) -> int:
+        """
+        Number of recorded generations after the initial one.
+        """
+        return len(self.starts) - 1
+
+    def append(self, changes: tp.Iterable[CellChange]) -> None:
+        """
+        Records the next generation.
+        :param changes: The (row, column, new value) of every cell that changed.
+        """
+        for i, j, value in changes:
+            index = i * self.cols + j
+            self.changes.append(index << 2 | value)
+            self._state[index] = value
+        self.starts.append(len(self.changes))
+        if self.generations % self.keyframe_every == 0:
+            self.keyframes.append(bytes(self._state))
+
+    def delta(self, generation: int) -> list[CellChange]:
+        """
+        :param generation: A recorded generation, from 1 to `generations`.
+        :return: The (row, column, new value) changes leading to it from the previous generation.
+        """
+        if not 1 <= generation <= self.generations:
+            raise IndexError(f"Generation {generation} is out of the recorded range 1..{self.generations}")
+        return [
+            (*divmod(packed >> 2, self.cols), packed & 3)
+            for packed in self.changes[self.starts[generation - 1]:self.starts[generation]]
+        ]
+
+    def state(self, generation: int) -> bytes:
+        """
+        Rebuilds a generation from the closest keyframe before it.
+        :param generation: A recorded generation, from 0 to `generations`.
+        :return: Its state serialized row by row, one byte per cell.
+        """
+        if not 0 <= generation <= self.generations:
+            raise IndexError(f"Generation {generation} is out of the recorded range 0..{self.generations}")
+        keyframe = generation // self.keyframe_every
+        cells = bytearray(self.keyframes[keyframe])
+        for packed in self.changes[self.starts[keyframe * self.keyframe_every]:self.starts[generation]]:
+            cells[packed >> 2] = packed & 3
+        return bytes(cells)
+
+    def save(self, path: PathLike) -> None:
+        """
+        Writes the history to a binary file: a 40-byte header, the initial state,
+        the per-generation change counts and the packed changes. Keyframes are not stored.
+        :param path: Destination file.
+        """
+        counts = array('Q', (self.starts[g + 1] - self.starts[g] for g in range(self.generations)))
+        with open(path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, self.rows, self.cols, self.keyframe_every, self.generations))
+            f.write(self.keyframes[0])
+            f.write(counts.tobytes())
+            f.write(self.changes.tobytes())
+
+    @classmethod
+    def load(cls, path: PathLike) -> 'History':
+        """
+        Reads a file written by `save`; keyframes are rebuilt in a single pass over the changes.
+        :param path: A history file.
+        :return: The recorded history.
+        """
+        with open(path, 'rb') as f:
+            raw = f.read(HEADER.size)
+            if len(raw) != HEADER.size:
+                raise ValueError(f"{path} is too short to be a history file")
+            magic, rows, cols, keyframe_every, generations = HEADER.unpack(raw)
+            if magic != MAGIC:
+                raise ValueError(f"{path} is not a history file")
+
+            history = cls(rows, cols, f.read(rows * cols), keyframe_every)
+            counts = array('Q')
+            counts.frombytes(f.read(generations * counts.itemsize))
+            changes = array(history.changes.typecode)
+            changes.frombytes(f.read())
+
+        start = 0
+        for count in counts:
+            history.append(
+                (*divmod(packed >> 2, cols), packed & 3) for packed in changes[start:start + count]
+            )
+            start += count
+        return history
+
+
+class HistoryRecorder(object):
+    """
+    Runs a GameOfLife and records every generation into a History
+    """
+    def __init__(self, game: GameOfLife, keyframe_every: int = 64) -> None:
+        """
+        :param game: The game to record, from its current generation on.
+        :param keyframe_every: Number of generations between two stored full states.
+        """
+        self.game = game
+        # The ocean attribute lags behind engines stepped through advancing, generations or next_view
+        initial = b''.join(bytes(row) for row in game.advance(0))
+        self.history = History(game.rows, game.cols, initial, keyframe_every)
+
+    def record(self, generations: int) -> History:
+        """
+        Advances the game, keeping only the cells that changed in each generation.
+        :param generations: Number of generations to record.
+        :return: The history recorded so far.
+        """
+        for changes in self.game.generations(mode='diff', limit=generations):
+            self.history.append(changes)
+        return self.history
+
+
+class HistoryReplayer(object):
+    """
+    Replays a History without applying the rules again
+    """
+    def __init__(self, history: History) -> None:
+        """
+        :param history: A recorded history.
+        """
+        self.history = history
+        self.generation = 0
+
+    def seek(self, generation: int) -> list[list[int]]:
+        """
+        Jumps to any recorded generation.
+        :param generation: A recorded generation, from 0 to `history.generations`.
+        :return: A 2D list representing the ocean at that generation.
+        """
+        cells = self.history.state(generation)
+        self.generation = generation
+        cols = self.history.cols
+        return [list(cells[i * cols:(i + 1) * cols]) for i in range(self.history.rows)]
+
+    def replay(self) -> tp.Iterator[list[list[int]]]:
+        """
+        Yields every generation from the current one to the last recorded, applying one change list at a time.
+        :return: An iterator over 2D lists, each a fresh copy.
+        """
+        ocean = self.seek(self.generation)
+        yield [row[:] for row in ocean]
+        while self.generation < self.history.generations:
+            self.generation += 1
+            for i, j, value in self.history.delta(self.generation):
+                ocean[i][j] = value
+            yield [row[:] for row in ocean]
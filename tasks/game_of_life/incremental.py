@@ -0,0 +1,94 @@
+from .neighbourhood import CELL_WEIGHTS, Boundary, neighbourhood
+from .observer import Census
+from .rules import CLASSIC, FISH, ROCK, SHRIMP, RuleSpec, compile_rules
+
+
+class IncrementalOcean(object):
+    """
+    Ocean stepped incrementally: only cells that changed in the last generation
+    and their neighbours are recomputed, so a step costs O(activity) rather than O(rows * cols)
+    """
+    def __init__(self, ocean: list[list[int]], rules: RuleSpec = CLASSIC, boundary: Boundary = 'fixed') -> None:
+        """
+        :param ocean: A 2D list representing the initial state of the ocean.
+        :param rules: The rules to apply.
+        :param boundary: What lies beyond the edges, resolved once in the neighbour tables.
+        """
+        self.rows = len(ocean)
+        self.cols = len(ocean[0]) if ocean else 0
+        self.cells = bytearray(cell for row in ocean for cell in row)
+        self._neighbourhood = neighbourhood(self.rows, self.cols, boundary)
+        self._census = Census.of(bytes(self.cells))
+        self._table = compile_rules(rules)
+
+        # Only creatures and their neighbours can change in the first generation,
+        # unless empty cells can come alive with no creature around
+        self.active: set[int] = set()
+        if rules.births_from_nothing:
+            self.active.update(range(len(self.cells)))
+        for index, cell in enumerate(self.cells):
+            if cell == FISH or cell == SHRIMP:
+                self._activate(index)
+
+    def _activate(self, index: int) -> None:
+        """
+        Marks a cell and its neighbours for recomputation in the next step.
+        :param index: Flat index of a cell.
+        """
+        self.active.add(index)
+        for offset in self._neighbourhood.offsets(index):
+            self.active.add(index + offset)
+
+    def _next_value(self, index: int) -> int:
+        """
+        Applies the rules to a single cell.
+        :param index: Flat index of a cell.
+        :return: The value of the cell in the next generation.
+        """
+        cell = self.cells[index]
+        if cell == ROCK:
+            return ROCK
+
+        histogram = 0
+        for offset in self._neighbourhood.offsets(index):
+            histogram += CELL_WEIGHTS[self.cells[index + offset]]
+        return self._table[cell << 8 | histogram & 0xFF]
+
+    def step(self) -> None:
+        """
+        Recomputes the active cells and makes the changed ones (with their neighbours) active next time.
+        """
+        changes = []
+        for index in self.active:
+            value = self._next_value(index)
+            if value != self.cells[index]:
+                changes.append((index, value))
+
+        # Every change is a birth (into an empty cell) or a death (leaving it empty)
+        born = [0, 0, 0, 0]
+        died = [0, 0, 0, 0]
+        self.active = set()
+        for index, value in changes:
+            died[self.cells[index]] += 1
+            born[value] += 1
+            self.cells[index] = value
+            self._activate(index)
+        self._census = self._census.next(born[FISH], died[FISH], born[SHRIMP], died[SHRIMP])
+
+    def census(self) -> Census:
+        """
+        :return: Population of the current generation and its births and deaths, updated from the changes only.
+        """
+        return self._census
+
+    def to_ocean(self) -> list[list[int]]:
+        """
+        :return: The current state as a 2D list.
+        """
+        return [list(self.cells[i * self.cols:(i + 1) * self.cols]) for i in range(self.rows)]
+
+    def to_bytes(self) -> bytes:
+        """
+        :return: The current state serialized row by row, one byte per cell.
+        """
+        return bytes(self.cells)
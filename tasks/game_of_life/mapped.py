@@ -0,0 +1,212 @@
+import hashlib
+import os
+import shutil
+import struct
+import typing as tp
+from pathlib import Path
+
+import numpy as np
+
+from .neighbourhood import Boundary, check_boundary
+from .observer import Census
+from .rules import CLASSIC, RuleSpec
+from .vectorized import Grid, apply_rules, with_ghost_rows
+
+
+MAGIC = b'OCEAN\x00\x00\x01'
+HEADER = struct.Struct('<8sQQQ')  # magic, rows, cols, generation
+
+PathLike = str | os.PathLike[str]
+
+
+def _read_header(path: PathLike) -> tuple[int, int, int]:
+    """
+    :return: Rows, columns and generation stored in an ocean file.
+    """
+    with open(path, 'rb') as f:
+        raw = f.read(HEADER.size)
+    if len(raw) != HEADER.size:
+        raise ValueError(f"{path} is too short to be an ocean file")
+    magic, rows, cols, generation = HEADER.unpack(raw)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not an ocean file")
+    return rows, cols, generation
+
+
+def _create_file(path: PathLike, rows: int, cols: int, generation: int) -> Grid:
+    """
+    Creates an ocean file with the given header and maps its cells for writing.
+    """
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, rows, cols, generation))
+        f.truncate(HEADER.size + rows * cols)
+    return _map(path, rows, cols, 'r+')
+
+
+def _map(path: PathLike, rows: int, cols: int, mode: tp.Literal['r', 'r+']) -> Grid:
+    if rows * cols == 0:
+        return np.zeros((rows, cols), dtype=np.uint8)
+    return np.memmap(path, dtype=np.uint8, mode=mode, offset=HEADER.size, shape=(rows, cols))
+
+
+def save_ocean(path: PathLike, ocean: list[list[int]] | Grid, generation: int = 0) -> None:
+    """
+    Writes an ocean to a binary file: a 32-byte header followed by one byte per cell, row by row.
+    :param path: Destination file.
+    :param ocean: A 2D list or uint8 array.
+    :param generation: Generation number recorded in the header.
+    """
+    grid = np.asarray(ocean, dtype=np.uint8)
+    rows = grid.shape[0]
+    cols = grid.shape[1] if grid.ndim == 2 else 0
+    cells = _create_file(path, rows, cols, generation)
+    cells[:] = grid.reshape(rows, cols)
+    if isinstance(cells, np.memmap):
+        cells.flush()
+
+
+def load_ocean(path: PathLike) -> list[list[int]]:
+    """
+    :param path: An ocean file written by save_ocean or MappedOcean.
+    :return: The ocean as a 2D list, ready for GameOfLife.
+    """
+    rows, cols, _ = _read_header(path)
+    return _map(path, rows, cols, 'r').tolist()
+
+
+class MappedOcean(object):
+    """
+    Ocean living in a memory-mapped file, so boards larger than RAM can be simulated.
+    Each generation is computed stripe by stripe into a scratch file that then atomically
+    replaces the original, so the file on disk is always a complete generation and can be
+    reopened after a restart.
+    Population counts are kept while stepping and state keys are hashed stripe by stripe,
+    so driving it from GameOfLife does not copy the board each generation.
+    """
+    def __init__(self, path: PathLike, stripe_rows: int = 1024, rules: RuleSpec = CLASSIC,
+                 boundary: Boundary = 'fixed') -> None:
+        """
+        Opens an existing ocean file; only the header is read, the cells are mapped.
+        :param path: An ocean file written by save_ocean or MappedOcean.
+        :param stripe_rows: Number of rows computed at once while stepping.
+        :param rules: The rules to apply.
+        :param boundary: What lies beyond the edges.
+        """
+        self.path = Path(path)
+        self.rules = rules
+        self.boundary = check_boundary(boundary)
+        self.stripe_rows = stripe_rows
+        self.rows, self.cols, self.generation = _read_header(self.path)
+        self.grid = _map(self.path, self.rows, self.cols, 'r')
+        counts = np.zeros(4, dtype=np.int64)
+        for start, stop in self._stripes():
+            counts += np.bincount(self.grid[start:stop].ravel(), minlength=4)[:4]
+        self._census = Census(*(int(count) for count in counts))
+
+    @classmethod
+    def opener(cls, path: PathLike, stripe_rows: int = 1024, rules: RuleSpec = CLASSIC,
+               boundary: Boundary = 'fixed') -> tp.Callable[[list[list[int]]], 'MappedOcean']:
+        """
+        Builds a GameOfLife engine opening an existing ocean file instead of rewriting it:
+            GameOfLife(load_ocean(path), engine=MappedOcean.opener(path))
+        :return: A factory opening `path` and checking it has the shape of the ocean given to GameOfLife.
+        """
+        def open_file(ocean: list[list[int]]) -> 'MappedOcean':
+            mapped = cls(path, stripe_rows, rules, boundary)
+            shape = (len(ocean), len(ocean[0]) if ocean else 0)
+            if shape != (mapped.rows, mapped.cols):
+                raise ValueError(f"{path} holds a {mapped.rows}x{mapped.cols} ocean, not {shape[0]}x{shape[1]}")
+            return mapped
+
+        return open_file
+
+    @classmethod
+    def create(cls, path: PathLike, ocean: list[list[int]], stripe_rows: int = 1024,
+               rules: RuleSpec = CLASSIC, boundary: Boundary = 'fixed') -> 'MappedOcean':
+        """
+        Writes the ocean to `path` and opens it.
+        """
+        save_ocean(path, ocean)
+        return cls(path, stripe_rows, rules, boundary)
+
+    def step(self) -> None:
+        """
+        Computes the next generation stripe by stripe and replaces the file with it.
+        """
+        scratch = self.path.with_name(self.path.name + '.next')
+        new_grid = _create_file(scratch, self.rows, self.cols, self.generation + 1)
+        totals = [0, 0, 0, 0]
+        for start, stop in self._stripes():
+            stripe = np.asarray(with_ghost_rows(self.grid, start, stop, self.boundary))
+            new_grid[start:stop], transitions = apply_rules(stripe, self.rules, self.boundary, ghost_rows=True)
+            for k, count in enumerate(transitions.tally()):
+                totals[k] += count
+        if isinstance(new_grid, np.memmap):
+            new_grid.flush()
+        del new_grid
+
+        # Drop the old mapping before the file under it is replaced
+        del self.grid
+        os.replace(scratch, self.path)
+        self.generation += 1
+        self.grid = _map(self.path, self.rows, self.cols, 'r')
+        self._census = self._census.next(*totals)
+
+    def _stripes(self) -> tp.Iterator[tuple[int, int]]:
+        """
+        :return: The [start, stop) row ranges of the stripes.
+        """
+        for start in range(0, self.rows, self.stripe_rows):
+            yield start, min(start + self.stripe_rows, self.rows)
+
+    def census(self) -> Census:
+        """
+        :return: Population of the current generation and its births and deaths, summed over the stripes.
+        """
+        return self._census
+
+    def state_key(self) -> bytes:
+        """
+        Digests the current state one stripe at a time, without copying the whole board.
+        :return: A short hash of the cells, equal to hashing to_bytes().
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for start, stop in self._stripes():
+            digest.update(self.grid[start:stop].tobytes())
+        return digest.digest()
+
+    def checkpoint(self, path: PathLike) -> None:
+        """
+        Copies the current generation to another ocean file, byte for byte.
+        :param path: Destination of the checkpoint; reopen it with MappedOcean(path).
+        """
+        shutil.copyfile(self.path, path)
+
+    def run(self, generations: int, checkpoint_every: int | None = None,
+            checkpoint_dir: PathLike | None = None) -> None:
+        """
+        Advances several generations, optionally checkpointing periodically.
+        :param generations: Number of generations to compute.
+        :param checkpoint_every: Save a checkpoint whenever the generation number is a multiple of this.
+        :param checkpoint_dir: Directory receiving `generation-<number>.ocean` checkpoints.
+        """
+        if checkpoint_every is not None and checkpoint_dir is None:
+            raise ValueError("checkpoint_dir is required together with checkpoint_every")
+        for _ in range(generations):
+            self.step()
+            if checkpoint_every is not None and self.generation % checkpoint_every == 0:
+                assert checkpoint_dir is not None
+                self.checkpoint(Path(checkpoint_dir) / f'generation-{self.generation:012d}.ocean')
+
+    def to_ocean(self) -> list[list[int]]:
+        """
+        Materializes the whole board, so it is meant for boards that also fit in RAM.
+        :return: The current state as a 2D list.
+        """
+        return self.grid.tolist()
+
+    def to_bytes(self) -> bytes:
+        """
+        :return: The current state serialized row by row, one byte per cell.
+        """
+        return self.grid.tobytes()
@@ -0,0 +1,106 @@
+import functools
+import typing as tp
+
+
+Offsets = tuple[int, ...]
+
+# What lies beyond the edges: nothing ('fixed'), the opposite edge ('torus')
+# or a mirror image of the edge row or column ('reflect')
+Boundary = tp.Literal['fixed', 'torus', 'reflect']
+BOUNDARIES: tuple[Boundary, ...] = ('fixed', 'torus', 'reflect')
+
+# Summing these weights over a neighbourhood yields all counts in one int:
+# fish in bits 0-3, shrimp in bits 4-7, rocks in bits 8-11 (indexed by cell value)
+CELL_WEIGHTS = (0, 1 << 8, 1, 1 << 4)
+
+
+def check_boundary(boundary: str) -> Boundary:
+    """
+    :return: The boundary, once checked to be one of BOUNDARIES.
+    """
+    if boundary not in BOUNDARIES:
+        raise ValueError(f"Unknown boundary {boundary!r}, expected one of {BOUNDARIES}")
+    return boundary
+
+
+def axis_steps(position: int, length: int, boundary: Boundary) -> tuple[tuple[int, int], ...]:
+    """
+    Resolves the neighbouring positions along one axis, so callers never check bounds themselves.
+    :param position: A row or column index.
+    :param length: Number of rows or columns.
+    :param boundary: What lies beyond the edges.
+    :return: (direction, position) pairs for directions -1, 0 and 1; with a fixed boundary
+             the directions leaving the board are left out.
+    """
+    steps = []
+    for direction in (-1, 0, 1):
+        target = position + direction
+        if boundary == 'torus':
+            target %= length
+        elif boundary == 'reflect':
+            target = min(max(target, 0), length - 1)
+        elif not 0 <= target < length:
+            continue
+        steps.append((direction, target))
+    return tuple(steps)
+
+
+class Neighbourhood(object):
+    """
+    Flat-index neighbour offsets for one board shape, with the border cases resolved up front.
+    Cells are numbered row by row (index = i * cols + j); the neighbours of a cell are
+    `index + offset` for every offset in `offsets(index)`. Cells sharing a border situation
+    share the same offsets tuple, so the table costs O(rows + cols) memory.
+    With a torus or reflecting boundary, border cells get offsets to the wrapped or mirrored cells
+    (a mirrored neighbour may be the cell itself, or the same cell twice).
+    """
+    def __init__(self, rows: int, cols: int, boundary: Boundary = 'fixed') -> None:
+        """
+        :param rows: Number of rows of the board.
+        :param cols: Number of columns of the board.
+        :param boundary: What lies beyond the edges.
+        """
+        self.rows = rows
+        self.cols = cols
+        self.boundary = check_boundary(boundary)
+
+        # (direction, distance to the neighbour) pairs along each axis
+        row_steps = [
+            tuple((di, x - i) for di, x in axis_steps(i, rows, boundary)) for i in range(rows)
+        ]
+        col_steps = [
+            tuple((dj, y - j) for dj, y in axis_steps(j, cols, boundary)) for j in range(cols)
+        ]
+
+        # One list of per-column offsets for each kind of row (first, middle, last, only)
+        row_tables: dict[tuple[tuple[int, int], ...], list[Offsets]] = {}
+        offsets_cache: dict[tuple[tuple[tuple[int, int], ...], tuple[tuple[int, int], ...]], Offsets] = {}
+        for steps in row_steps:
+            if steps in row_tables:
+                continue
+            table = []
+            for col in col_steps:
+                key = (steps, col)
+                if key not in offsets_cache:
+                    offsets_cache[key] = tuple(
+                        dx * cols + dy for di, dx in steps for dj, dy in col if di or dj
+                    )
+                table.append(offsets_cache[key])
+            row_tables[steps] = table
+
+        self.by_row: list[list[Offsets]] = [row_tables[steps] for steps in row_steps]
+
+    def offsets(self, index: int) -> Offsets:
+        """
+        :param index: Flat index of a cell.
+        :return: Offsets from `index` to the flat indices of its neighbours.
+        """
+        return self.by_row[index // self.cols][index % self.cols]
+
+
+@functools.lru_cache(maxsize=16)
+def neighbourhood(rows: int, cols: int, boundary: Boundary = 'fixed') -> Neighbourhood:
+    """
+    :return: The shared Neighbourhood of a board shape and boundary, built on first use.
+    """
+    return Neighbourhood(rows, cols, boundary)
@@ -0,0 +1,109 @@
+import typing as tp
+from dataclasses import dataclass
+
+
+class Census(tp.NamedTuple):
+    """
+    Population of an ocean and how it changed in the last generation.
+    Engines keep it up to date as a by-product of applying the rules.
+    """
+    empty: int
+    rocks: int
+    fish: int
+    shrimp: int
+    births: int = 0
+    deaths: int = 0
+
+    @classmethod
+    def of(cls, raw: bytes) -> 'Census':
+        """
+        Counts the cells of a state by a full scan, with no births or deaths.
+        :param raw: A state serialized one byte per cell.
+        """
+        return cls(empty=raw.count(0), rocks=raw.count(1), fish=raw.count(2), shrimp=raw.count(3))
+
+    def next(self, fish_born: int, fish_died: int, shrimp_born: int, shrimp_died: int) -> 'Census':
+        """
+        :return: The census of the next generation given the transitions counted while stepping.
+        """
+        births = fish_born + shrimp_born
+        deaths = fish_died + shrimp_died
+        return Census(
+            empty=self.empty + deaths - births,
+            rocks=self.rocks,
+            fish=self.fish + fish_born - fish_died,
+            shrimp=self.shrimp + shrimp_born - shrimp_died,
+            births=births,
+            deaths=deaths,
+        )
+
+    def next_from_survivors(self, fish_born: int, fish_survived: int, shrimp_born: int,
+                            shrimp_survived: int) -> 'Census':
+        """
+        Same as `next`, for engines that count the surviving creatures rather than the dead ones.
+        """
+        return self.next(fish_born, self.fish - fish_survived, shrimp_born, self.shrimp - shrimp_survived)
+
+
+@dataclass(frozen=True)
+class GenerationSummary:
+    """
+    Population of the ocean after a generation; births and deaths count the cells
+    that went from empty to fish or shrimp and back since the previous generation
+    """
+    generation: int
+    empty: int
+    rocks: int
+    fish: int
+    shrimp: int
+    births: int = 0
+    deaths: int = 0
+
+
+@dataclass(frozen=True)
+class CellEvent:
+    """
+    How a single cell was updated, reported only when cell tracing is requested
+    """
+    generation: int
+    i: int
+    j: int
+    cell: int
+    fish_count: int
+    shrimp_count: int
+    new_cell: int
+
+
+class OceanObserver(object):
+    """
+    Base class for GameOfLife observers; override the hooks you need.
+    Set `trace_cells` to True to receive a CellEvent for every cell of every generation.
+    """
+    trace_cells: bool = False
+
+    def on_generation(self, summary: GenerationSummary) -> None:
+        """
+        Called after every simulated generation.
+        :param summary: Population counts of the new generation.
+        """
+
+    def on_cell(self, event: CellEvent) -> None:
+        """
+        Called for every cell of a generation when `trace_cells` is set.
+        :param event: The cell update.
+        """
+
+
+class PrintObserver(OceanObserver):
+    """
+    Observer printing every cell update and generation summary, handy for debugging small oceans
+    """
+    trace_cells = True
+
+    def on_generation(self, summary: GenerationSummary) -> None:
+        print(f"Generation {summary.generation}: Fish={summary.fish}, Shrimp={summary.shrimp}, "
+              f"Rocks={summary.rocks}, Empty={summary.empty}, Births={summary.births}, Deaths={summary.deaths}")
+
+    def on_cell(self, event: CellEvent) -> None:
+        print(f"Cell ({event.i}, {event.j}): Current={event.cell}, FishCount={event.fish_count}, "
+              f"ShrimpCount={event.shrimp_count}, NewValue={event.new_cell}")
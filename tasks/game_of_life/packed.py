@@ -0,0 +1,207 @@
+import numpy as np
+import numpy.typing as npt
+
+from .neighbourhood import Boundary, check_boundary
+from .observer import Census
+from .rules import CLASSIC, RuleSpec
+
+Plane = npt.NDArray[np.uint8]
+
+_ONE, _SEVEN = np.uint8(1), np.uint8(7)
+
+
+def _bit(plane: Plane, column: int) -> Plane:
+    """
+    :return: The bit of the given column in every row, as a column of zeros and ones.
+    """
+    return (plane[:, column >> 3] >> np.uint8(column & 7)) & _ONE
+
+
+def _west_neighbours(plane: Plane, cols: int, boundary: Boundary) -> Plane:
+    """
+    :return: A plane whose bit j holds bit j - 1 of the same row; at column 0 it is zero,
+             the last column ('torus') or column 0 itself ('reflect').
+    """
+    carry = np.zeros_like(plane)
+    carry[:, 1:] = plane[:, :-1] >> _SEVEN
+    shifted = (plane << _ONE) | carry
+    if boundary != 'fixed' and plane.size:
+        shifted[:, 0] |= _bit(plane, cols - 1 if boundary == 'torus' else 0)
+    return shifted
+
+
+def _east_neighbours(plane: Plane, cols: int, boundary: Boundary) -> Plane:
+    """
+    :return: A plane whose bit j holds bit j + 1 of the same row; past the last column it is zero,
+             column 0 ('torus') or the last column itself ('reflect').
+    """
+    carry = np.zeros_like(plane)
+    carry[:, :-1] = plane[:, 1:] << _SEVEN
+    shifted = (plane >> _ONE) | carry
+    if boundary != 'fixed' and plane.size:
+        last = cols - 1
+        shifted[:, last >> 3] |= _bit(plane, 0 if boundary == 'torus' else last) << np.uint8(last & 7)
+    return shifted
+
+
+def _north_neighbours(plane: Plane, boundary: Boundary) -> Plane:
+    """
+    :return: A plane whose row i holds row i - 1; row 0 gets zeros, the last row ('torus') or itself ('reflect').
+    """
+    shifted = np.zeros_like(plane)
+    shifted[1:] = plane[:-1]
+    if boundary != 'fixed' and plane.size:
+        shifted[0] = plane[-1 if boundary == 'torus' else 0]
+    return shifted
+
+
+def _south_neighbours(plane: Plane, boundary: Boundary) -> Plane:
+    """
+    :return: A plane whose row i holds row i + 1; the last row gets zeros, row 0 ('torus') or itself ('reflect').
+    """
+    shifted = np.zeros_like(plane)
+    shifted[:-1] = plane[1:]
+    if boundary != 'fixed' and plane.size:
+        shifted[-1] = plane[0 if boundary == 'torus' else -1]
+    return shifted
+
+
+def _neighbour_counts(plane: Plane, cols: int, boundary: Boundary) -> list[Plane]:
+    """
+    Bit-parallel count of set neighbours for every cell of a plane.
+    The boundary is applied to whole edge rows and columns while shifting, never per cell.
+    :return: Four planes holding bits 0 to 3 of every cell's count.
+    """
+    west, east = _west_neighbours(plane, cols, boundary), _east_neighbours(plane, cols, boundary)
+    neighbours = [west, east]
+    for row in (plane, west, east):
+        neighbours.append(_north_neighbours(row, boundary))
+        neighbours.append(_south_neighbours(row, boundary))
+
+    # Four-bit counter per cell, summed with ripple-carry adders on whole planes
+    counter = [np.zeros_like(plane) for _ in range(4)]
+    for carry in neighbours:
+        for k in range(4):
+            counter[k], carry = counter[k] ^ carry, counter[k] & carry
+    return counter
+
+
+def _count_in(counter: list[Plane], counts: frozenset[int]) -> Plane:
+    """
+    :param counter: Planes holding the bits of every cell's count, as built by _neighbour_counts.
+    :param counts: Accepted neighbour counts.
+    :return: A plane marking the cells whose count is one of `counts`.
+    """
+    matches = np.zeros_like(counter[0])
+    for count in counts:
+        match = ~np.zeros_like(counter[0])
+        for k, bits in enumerate(counter):
+            match &= bits if count >> k & 1 else ~bits
+        matches |= match
+    return matches
+
+
+class PackedOcean(object):
+    """
+    Ocean packed at two bits per cell: a high and a low bit plane, eight cells per byte.
+    Cells are encoded as high/low bits 00 = empty, 01 = rock, 10 = fish, 11 = shrimp,
+    and generations are computed with bitwise operations on the planes directly.
+    """
+    def __init__(self, ocean: list[list[int]], rules: RuleSpec = CLASSIC, boundary: Boundary = 'fixed') -> None:
+        """
+        :param ocean: A 2D list representing the initial state of the ocean.
+        :param rules: The rules to apply, turned into count masks on the counter planes.
+        :param boundary: What lies beyond the edges.
+        """
+        self.rules = rules
+        self.boundary = check_boundary(boundary)
+        self.rows = len(ocean)
+        self.cols = len(ocean[0]) if ocean else 0
+        grid = np.array(ocean, dtype=np.uint8).reshape(self.rows, self.cols)
+        self.high: Plane = np.packbits(grid >> 1, axis=1, bitorder='little')
+        self.low: Plane = np.packbits(grid & 1, axis=1, bitorder='little')
+
+        # Bits past the last column must stay clear, or they would breed
+        self._mask: Plane = np.packbits(np.ones((1, self.cols), dtype=np.uint8), axis=1, bitorder='little')
+        self._census: Census | None = None
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Bytes used by the cell planes.
+        """
+        return self.high.nbytes + self.low.nbytes
+
+    def __getitem__(self, cell: tuple[int, int]) -> int:
+        i, j = cell
+        byte, bit = divmod(j, 8)
+        return int(((self.high[i, byte] >> bit) & 1) << 1 | ((self.low[i, byte] >> bit) & 1))
+
+    def __setitem__(self, cell: tuple[int, int], value: int) -> None:
+        i, j = cell
+        byte, bit = divmod(j, 8)
+        for plane, value_bit in ((self.high, value >> 1), (self.low, value & 1)):
+            if value_bit:
+                plane[i, byte] |= 1 << bit
+            else:
+                plane[i, byte] &= ~(1 << bit) & 0xFF
+        self._census = None
+
+    def step(self) -> None:
+        """
+        Replaces the planes with the next generation.
+        """
+        census = self.census()
+        high, low = self.high, self.low
+        fish = high & ~low
+        shrimp = high & low
+        rock = ~high & low
+        empty = ~(high | low)
+
+        fish_counts = _neighbour_counts(fish, self.cols, self.boundary)
+        shrimp_counts = _neighbour_counts(shrimp, self.cols, self.boundary)
+        fish_birth = _count_in(fish_counts, self.rules.fish_birth)
+
+        fish_survived = fish & _count_in(fish_counts, self.rules.fish_survive)
+        fish_born = empty & fish_birth & self._mask
+        shrimp_survived = shrimp & _count_in(shrimp_counts, self.rules.shrimp_survive)
+        shrimp_born = empty & ~fish_birth & _count_in(shrimp_counts, self.rules.shrimp_birth) & self._mask
+        new_fish = fish_survived | fish_born
+        new_shrimp = shrimp_survived | shrimp_born
+
+        self.high = (new_fish | new_shrimp) & self._mask
+        self.low = (rock | new_shrimp) & self._mask
+
+        self._census = census.next_from_survivors(*(
+            int(np.bitwise_count(plane).sum()) for plane in (fish_born, fish_survived, shrimp_born, shrimp_survived)
+        ))
+
+    def census(self) -> Census:
+        """
+        Population counts are popcounts of the planes computed while stepping;
+        after a cell is set by hand they are rebuilt by a scan, with no births or deaths.
+        :return: Population of the current generation and its births and deaths.
+        """
+        if self._census is None:
+            self._census = Census.of(self.to_bytes())
+        return self._census
+
+    def to_grid(self) -> npt.NDArray[np.uint8]:
+        """
+        :return: The current state unpacked into a uint8 array, one cell per byte.
+        """
+        high = np.unpackbits(self.high, axis=1, count=self.cols, bitorder='little')
+        low = np.unpackbits(self.low, axis=1, count=self.cols, bitorder='little')
+        return (high << _ONE) | low
+
+    def to_ocean(self) -> list[list[int]]:
+        """
+        :return: The current state as a 2D list.
+        """
+        return self.to_grid().tolist()
+
+    def to_bytes(self) -> bytes:
+        """
+        :return: The current state serialized row by row, one byte per cell.
+        """
+        return self.to_grid().tobytes()
@@ -0,0 +1,138 @@
+import os
+import weakref
+from concurrent.futures import ProcessPoolExecutor, wait
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from .neighbourhood import Boundary, check_boundary
+from .observer import Census
+from .rules import CLASSIC, RuleSpec
+from .vectorized import Grid, apply_rules, with_ghost_rows
+
+
+# Shared grids attached once per worker process
+_worker_memory: list[SharedMemory] = []
+_worker_grids: list[Grid] = []
+_worker_rules: list[tuple[RuleSpec, Boundary]] = []
+
+
+def _attach(names: tuple[str, str], rows: int, cols: int, rules: RuleSpec, boundary: Boundary) -> None:
+    """
+    Pool initializer: maps both shared buffers into the worker process and keeps the rules and boundary.
+    """
+    _worker_rules.append((rules, boundary))
+    for name in names:
+        memory = SharedMemory(name=name)
+        _worker_memory.append(memory)
+        _worker_grids.append(np.ndarray((rows, cols), dtype=np.uint8, buffer=memory.buf))
+
+
+def _step_band(source: int, start: int, stop: int) -> tuple[int, int, int, int]:
+    """
+    Computes rows [start, stop) of the next generation from the `source` buffer into the other one.
+    One ghost row on each side is read so the band edges see their neighbours.
+    :return: Fish born, fish died, shrimp born and shrimp died within the band.
+    """
+    current, new = _worker_grids[source], _worker_grids[1 - source]
+    rules, boundary = _worker_rules[0]
+    band = with_ghost_rows(current, start, stop, boundary)
+    new[start:stop], transitions = apply_rules(band, rules, boundary, ghost_rows=True)
+    return transitions.tally()
+
+
+def _release(pool: ProcessPoolExecutor, buffers: list[SharedMemory]) -> None:
+    pool.shutdown(wait=True, cancel_futures=True)
+    for memory in buffers:
+        try:
+            memory.close()
+        except BufferError:
+            # A view of the grid is still referenced; the mapping goes away with it
+            pass
+        memory.unlink()
+
+
+class ParallelOcean(object):
+    """
+    Ocean split into row bands stepped by a process pool.
+    The grid lives in two shared memory buffers that are swapped every generation,
+    so workers never receive it pickled; each band task only gets its row range.
+    """
+    def __init__(self, ocean: list[list[int]], rules: RuleSpec = CLASSIC, boundary: Boundary = 'fixed',
+                 workers: int | None = None) -> None:
+        """
+        :param ocean: A 2D list representing the initial state of the ocean.
+        :param rules: The rules to apply.
+        :param boundary: What lies beyond the edges.
+        :param workers: Number of worker processes, defaults to the number of CPUs.
+        """
+        self.rows = len(ocean)
+        self.cols = len(ocean[0]) if ocean else 0
+        self.boundary = check_boundary(boundary)
+        self.workers = max(1, min(workers or os.cpu_count() or 1, self.rows))
+        self.bands = [
+            (self.rows * k // self.workers, self.rows * (k + 1) // self.workers) for k in range(self.workers)
+        ]
+
+        size = max(self.rows * self.cols, 1)
+        self._buffers = [SharedMemory(create=True, size=size) for _ in range(2)]
+        self._current = 0
+        self.grid[:] = np.array(ocean, dtype=np.uint8).reshape(self.rows, self.cols)
+        self._census = Census.of(self.to_bytes())
+
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_attach,
+            initargs=((self._buffers[0].name, self._buffers[1].name), self.rows, self.cols, rules, self.boundary),
+        )
+        self._finalizer = weakref.finalize(self, _release, self._pool, self._buffers)
+
+    @property
+    def grid(self) -> Grid:
+        """
+        The current generation, a view of the shared memory buffer.
+        """
+        return np.ndarray((self.rows, self.cols), dtype=np.uint8, buffer=self._buffers[self._current].buf)
+
+    def step(self) -> None:
+        """
+        Advances the held ocean by one generation, one task per row band.
+        """
+        futures = [self._pool.submit(_step_band, self._current, start, stop) for start, stop in self.bands]
+        wait(futures)
+        totals = [0, 0, 0, 0]
+        for future in futures:
+            for k, count in enumerate(future.result()):
+                totals[k] += count
+        self._current = 1 - self._current
+        self._census = self._census.next(*totals)
+
+    def census(self) -> Census:
+        """
+        :return: Population of the current generation and its births and deaths, summed over the bands.
+        """
+        return self._census
+
+    def to_ocean(self) -> list[list[int]]:
+        """
+        :return: The current state as a 2D list.
+        """
+        return self.grid.tolist()
+
+    def to_bytes(self) -> bytes:
+        """
+        :return: The current state serialized row by row, one byte per cell.
+        """
+        return self.grid.tobytes()
+
+    def close(self) -> None:
+        """
+        Stops the workers and frees the shared memory.
+        """
+        self._finalizer()
+
+    def __enter__(self) -> 'ParallelOcean':
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
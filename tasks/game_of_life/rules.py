@@ -0,0 +1,75 @@
+import functools
+from dataclasses import dataclass
+
+
+EMPTY, ROCK, FISH, SHRIMP = 0, 1, 2, 3
+
+# A table entry for every cell state and neighbour histogram byte (fish count in bits 0-3, shrimp in bits 4-7)
+TABLE_SIZE = 4 << 8
+
+
+@dataclass(frozen=True)
+class RuleSpec:
+    """
+    Birth and survival neighbour counts of fish and shrimp; rocks never change.
+    A creature survives when the number of neighbours of its own kind is in its `survive` set,
+    otherwise the cell becomes empty. An empty cell gets a creature when the number of neighbours
+    of that kind is in its `birth` set; fish are born first when both could be.
+    """
+    fish_survive: frozenset[int] = frozenset({2, 3})
+    fish_birth: frozenset[int] = frozenset({3})
+    shrimp_survive: frozenset[int] = frozenset({2, 3})
+    shrimp_birth: frozenset[int] = frozenset({3})
+
+    def __post_init__(self) -> None:
+        for name in ('fish_survive', 'fish_birth', 'shrimp_survive', 'shrimp_birth'):
+            counts = frozenset(getattr(self, name))
+            if not counts <= frozenset(range(9)):
+                raise ValueError(f"{name} must hold neighbour counts between 0 and 8, got {sorted(counts)}")
+            object.__setattr__(self, name, counts)
+
+    @property
+    def births_from_nothing(self) -> bool:
+        """
+        Whether an empty cell with no creature neighbours can come alive.
+        """
+        return 0 in self.fish_birth or 0 in self.shrimp_birth
+
+    def next_state(self, cell: int, fish_count: int, shrimp_count: int) -> int:
+        """
+        Applies the rules to a single cell; engines use the compiled table instead.
+        :param cell: The current state of the cell.
+        :param fish_count: Number of fish neighbours.
+        :param shrimp_count: Number of shrimp neighbours.
+        :return: The state of the cell in the next generation.
+        """
+        if cell == ROCK:
+            return ROCK
+        if cell == FISH:
+            return FISH if fish_count in self.fish_survive else EMPTY
+        if cell == SHRIMP:
+            return SHRIMP if shrimp_count in self.shrimp_survive else EMPTY
+        if fish_count in self.fish_birth:
+            return FISH
+        if shrimp_count in self.shrimp_birth:
+            return SHRIMP
+        return EMPTY
+
+
+CLASSIC = RuleSpec()
+
+
+@functools.lru_cache(maxsize=32)
+def compile_rules(rules: RuleSpec = CLASSIC) -> bytes:
+    """
+    Compiles a rule spec into a lookup table, so applying the rules takes a single index per cell.
+    :param rules: The rules to compile.
+    :return: The next state of a cell at index `state << 8 | histogram & 0xFF`,
+             where the histogram holds the fish count in bits 0-3 and the shrimp count in bits 4-7.
+    """
+    table = bytearray(TABLE_SIZE)
+    for cell in (EMPTY, ROCK, FISH, SHRIMP):
+        for fish_count in range(16):
+            for shrimp_count in range(16):
+                table[cell << 8 | shrimp_count << 4 | fish_count] = rules.next_state(cell, fish_count, shrimp_count)
+    return bytes(table)
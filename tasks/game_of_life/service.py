@@ -0,0 +1,107 @@
+import asyncio
+import itertools
+import typing as tp
+from concurrent.futures import Executor
+
+from .game_of_life import GameOfLife
+
+
+Progress = tp.Callable[[int, int], None]  # generations done, generations requested
+
+
+class SimulationService(object):
+    """
+    Runs GameOfLife simulations from asyncio code without blocking the event loop.
+    Generations are computed in chunks, either in an executor (the default thread pool unless one is given)
+    or on the loop itself, yielding to other tasks between chunks. At most `max_concurrent` simulations
+    run at once; the others wait for a slot. A cancelled simulation stops at the end of the current chunk,
+    so the game is always left at a whole generation.
+    A service belongs to the event loop it is first used in.
+    """
+    def __init__(
+            self,
+            max_concurrent: int = 4,
+            chunk: int = 16,
+            executor: Executor | None = None,
+            offload: bool = True
+    ) -> None:
+        """
+        :param max_concurrent: Number of simulations allowed to run at the same time.
+        :param chunk: Number of generations computed between two checks for cancellation and progress reports.
+        :param executor: Executor running the chunks; None for the loop's default one.
+        :param offload: False to compute the chunks on the event loop, yielding to it after each one.
+        """
+        if max_concurrent < 1:
+            raise ValueError(f"max_concurrent must be positive, got {max_concurrent}")
+        if chunk < 1:
+            raise ValueError(f"chunk must be positive, got {chunk}")
+        self.max_concurrent = max_concurrent
+        self.chunk = chunk
+        self.executor = executor
+        self.offload = offload
+        self.running = 0
+        self._slots = asyncio.Semaphore(max_concurrent)
+
+    async def advance(self, game: GameOfLife, n: int, progress: Progress | None = None) -> list[list[int]]:
+        """
+        Advances a game by n generations, like GameOfLife.advance, once a slot is free.
+        Repeating states are detected across chunks; once one is found the remaining generations are skipped.
+        :param game: The game to advance; it must not be used elsewhere until this returns.
+        :param n: Number of generations to advance.
+        :param progress: Called with (generations done, n) after every chunk.
+        :return: A 2D list representing the ocean after n generations.
+        """
+        if n < 0:
+            raise ValueError(f"Cannot advance a negative number of generations: {n}")
+        if n == 0:
+            return game.advance(0)
+
+        async with self._slots:
+            self.running += 1
+            try:
+                # One iterator for the whole run, so repeating states are detected across chunks
+                steps = game.advancing(n)
+                done = 0
+                while done < n:
+                    done = await self._run_chunk(steps, done)
+                    if progress is not None:
+                        progress(done, n)
+            finally:
+                self.running -= 1
+        return game.advance(0)
+
+    async def step(self, game: GameOfLife) -> list[list[int]]:
+        """
+        Computes the next generation of a game, like GameOfLife.get_next_generation.
+        :return: A 2D list representing the next generation of the ocean.
+        """
+        return await self.advance(game, 1)
+
+    async def _run_chunk(self, steps: tp.Iterator[int], done: int) -> int:
+        """
+        Consumes up to `chunk` generations of a GameOfLife.advancing iterator
+        without holding the loop for longer than needed.
+        :param done: Generations done before this chunk.
+        :return: Generations done after it.
+        """
+        if not self.offload:
+            done = _consume(steps, self.chunk, done)
+            await asyncio.sleep(0)
+            return done
+
+        future = asyncio.get_running_loop().run_in_executor(self.executor, _consume, steps, self.chunk, done)
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            # The chunk cannot be interrupted; let it finish so the game is not mutated behind the caller's back
+            await asyncio.wait([future])
+            raise
+
+
+def _consume(steps: tp.Iterator[int], chunk: int, done: int) -> int:
+    """
+    :return: The last of the next `chunk` values of `steps`, or `done` if it is exhausted.
+    """
+    for done in itertools.islice(steps, chunk):
+        pass
+    return done
@@ -0,0 +1,177 @@
+import hashlib
+import typing as tp
+from array import array
+from collections import Counter
+
+from .neighbourhood import Boundary, axis_steps, check_boundary
+from .observer import Census
+from .rules import CLASSIC, EMPTY, FISH, ROCK, SHRIMP, RuleSpec, compile_rules
+
+Cell = tuple[int, int]
+
+
+class SparseOcean(object):
+    """
+    Ocean storing only the coordinates of rocks, fish and shrimp.
+    Memory and step time depend on the number of creatures, not on the board size,
+    with the same bounded edges as the dense grid (cells beyond the board are empty).
+    """
+    def __init__(
+            self,
+            rows: int,
+            cols: int,
+            rocks: tp.Iterable[Cell] = (),
+            fish: tp.Iterable[Cell] = (),
+            shrimp: tp.Iterable[Cell] = (),
+            rules: RuleSpec = CLASSIC,
+            boundary: Boundary = 'fixed'
+    ) -> None:
+        """
+        :param rows: Number of rows of the board.
+        :param cols: Number of columns of the board.
+        :param rocks: Coordinates of rocks.
+        :param fish: Coordinates of fish.
+        :param shrimp: Coordinates of shrimp.
+        :param rules: The rules to apply; empty cells must need creature neighbours to come alive.
+        :param boundary: What lies beyond the edges.
+        """
+        if rules.births_from_nothing:
+            raise ValueError("SparseOcean cannot apply rules giving birth with no creature neighbours")
+        self.rows = rows
+        self.cols = cols
+        self.rocks = frozenset(rocks)
+        self.fish = set(fish)
+        self.shrimp = set(shrimp)
+        for i, j in self.rocks | self.fish | self.shrimp:
+            if not (0 <= i < rows and 0 <= j < cols):
+                raise ValueError(f"Cell ({i}, {j}) is outside of the {rows}x{cols} board")
+        if self.rocks & self.fish or self.rocks & self.shrimp or self.fish & self.shrimp:
+            raise ValueError("A cell can hold only one of rock, fish or shrimp")
+        self.rules = rules
+        self.boundary = check_boundary(boundary)
+        self._table = compile_rules(rules)
+        self._births = 0
+        self._deaths = 0
+
+    @classmethod
+    def from_dense(cls, ocean: list[list[int]], rules: RuleSpec = CLASSIC,
+                   boundary: Boundary = 'fixed') -> 'SparseOcean':
+        """
+        :param ocean: A 2D list, 0 = empty cell, 1 = rock, 2 = fish, 3 = shrimp.
+        :param rules: The rules to apply.
+        :param boundary: What lies beyond the edges.
+        :return: The same ocean in sparse form.
+        """
+        cells: dict[int, list[Cell]] = {ROCK: [], FISH: [], SHRIMP: []}
+        for i, row in enumerate(ocean):
+            for j, cell in enumerate(row):
+                if cell != EMPTY:
+                    cells[cell].append((i, j))
+        return cls(len(ocean), len(ocean[0]) if ocean else 0, cells[ROCK], cells[FISH], cells[SHRIMP], rules, boundary)
+
+    def to_dense(self) -> list[list[int]]:
+        """
+        :return: The ocean as a 2D list.
+        """
+        ocean = [[EMPTY] * self.cols for _ in range(self.rows)]
+        for value, cells in ((ROCK, self.rocks), (FISH, self.fish), (SHRIMP, self.shrimp)):
+            for i, j in cells:
+                ocean[i][j] = value
+        return ocean
+
+    def __getitem__(self, cell: Cell) -> int:
+        """
+        :param cell: Coordinates of a cell on the board.
+        :return: The value of the cell: 0 = empty, 1 = rock, 2 = fish, 3 = shrimp.
+        """
+        if cell in self.fish:
+            return FISH
+        if cell in self.shrimp:
+            return SHRIMP
+        if cell in self.rocks:
+            return ROCK
+        return EMPTY
+
+    def _count_neighbours(self, cells: set[Cell]) -> Counter[Cell]:
+        """
+        Counts, for every cell on the board touching one of `cells`, how many of `cells` are adjacent to it.
+        Beyond the edges the boundary is resolved per creature, so a wrapped or mirrored neighbour
+        is counted like any other (twice if it is seen through two directions).
+        :param cells: Coordinates of creatures of one kind.
+        :return: Mapping from coordinates to the number of adjacent creatures.
+        """
+        counts: Counter[Cell] = Counter()
+        for i, j in cells:
+            col_steps = axis_steps(j, self.cols, self.boundary)
+            for di, x in axis_steps(i, self.rows, self.boundary):
+                for dj, y in col_steps:
+                    if di or dj:
+                        counts[x, y] += 1
+        return counts
+
+    def step(self) -> None:
+        """
+        Replaces the state with the next generation.
+        """
+        fish_counts = self._count_neighbours(self.fish)
+        shrimp_counts = self._count_neighbours(self.shrimp)
+
+        # Only creatures and cells next to one can change
+        fish: set[Cell] = set()
+        shrimp: set[Cell] = set()
+        for cell in self.fish | self.shrimp | fish_counts.keys() | shrimp_counts.keys():
+            value = self._table[self[cell] << 8 | shrimp_counts[cell] << 4 | fish_counts[cell]]
+            if value == FISH:
+                fish.add(cell)
+            elif value == SHRIMP:
+                shrimp.add(cell)
+
+        survived = len(fish & self.fish) + len(shrimp & self.shrimp)
+        self._births = len(fish) + len(shrimp) - survived
+        self._deaths = len(self.fish) + len(self.shrimp) - survived
+        self.fish = fish
+        self.shrimp = shrimp
+
+    def census(self) -> Census:
+        """
+        :return: Population of the current generation and its births and deaths, read off the set sizes.
+        """
+        fish, shrimp, rocks = len(self.fish), len(self.shrimp), len(self.rocks)
+        return Census(
+            empty=self.rows * self.cols - rocks - fish - shrimp,
+            rocks=rocks,
+            fish=fish,
+            shrimp=shrimp,
+            births=self._births,
+            deaths=self._deaths,
+        )
+
+    def state_key(self) -> bytes:
+        """
+        Digests the creatures without materializing the board, in time depending only on their number.
+        Rocks never change, so they are left out.
+        :return: A short hash of the fish and shrimp coordinates.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for cells in (self.fish, self.shrimp):
+            indices = array('Q', sorted(i * self.cols + j for i, j in cells))
+            digest.update(len(indices).to_bytes(8, 'little'))
+            digest.update(indices.tobytes())
+        return digest.digest()
+
+    def to_ocean(self) -> list[list[int]]:
+        """
+        :return: The current state as a 2D list.
+        """
+        return self.to_dense()
+
+    def to_bytes(self) -> bytes:
+        """
+        Materializes the whole board, so it is meant for boards that also fit in dense form.
+        :return: The current state serialized row by row, one byte per cell.
+        """
+        cells = bytearray(self.rows * self.cols)
+        for value, coordinates in ((ROCK, self.rocks), (FISH, self.fish), (SHRIMP, self.shrimp)):
+            for i, j in coordinates:
+                cells[i * self.cols + j] = value
+        return bytes(cells)
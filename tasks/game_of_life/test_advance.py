@@ -0,0 +1,60 @@
+import pytest
+
+from .game_of_life import ENGINES, GameOfLife
+from .observer import GenerationSummary, OceanObserver
+from .test_public import TESTS, Case
+
+
+@pytest.mark.parametrize("engine", ['python', 'numpy'])
+@pytest.mark.parametrize("test_case", TESTS)
+def test_advance_cases(test_case: Case, engine: str) -> None:
+    game = GameOfLife(test_case.board, engine=engine)
+    assert game.advance(test_case.generation_number) == test_case.expected
+
+
+@pytest.mark.parametrize("n", [0, 1, 2, 3, 10 ** 6, 10 ** 6 + 1])
+def test_advance_blinker_fast_forward(n: int) -> None:
+    blinker = [[0, 2, 0], [0, 2, 0], [0, 2, 0]]
+    expected = blinker if n % 2 == 0 else [[0, 0, 0], [2, 2, 2], [0, 0, 0]]
+    assert GameOfLife([row[:] for row in blinker]).advance(n) == expected
+
+
+def test_advance_skips_steps_after_cycle(monkeypatch: pytest.MonkeyPatch) -> None:
+    game = GameOfLife([[3, 3, 0], [3, 3, 0], [0, 0, 1]])
+    steps = 0
+    original_step = game._step
+
+    def counting_step() -> None:
+        nonlocal steps
+        steps += 1
+        original_step()
+
+    monkeypatch.setattr(game, '_step', counting_step)
+    assert game.advance(10 ** 9) == [[3, 3, 0], [3, 3, 0], [0, 0, 1]]
+    assert steps == 1
+
+
+class SummaryRecorder(OceanObserver):
+    def __init__(self) -> None:
+        self.summaries: list[GenerationSummary] = []
+
+    def on_generation(self, summary: GenerationSummary) -> None:
+        self.summaries.append(summary)
+
+
+@pytest.mark.parametrize("engine", ['python', *sorted(ENGINES)])
+@pytest.mark.parametrize("n", [10, 11])
+def test_advance_reports_generation_reached(engine: str, n: int) -> None:
+    still_life = [[3, 3, 0], [3, 3, 0], [0, 0, 0]]
+    blinker = [[0, 2, 0], [0, 2, 0], [0, 2, 0]]
+    for ocean in (still_life, blinker):
+        observer = SummaryRecorder()
+        game = GameOfLife([row[:] for row in ocean], engine=engine, observer=observer)
+        game.advance(n)
+        assert observer.summaries[-1] == game.stats
+        assert observer.summaries[-1].generation == n
+
+
+def test_advance_negative() -> None:
+    with pytest.raises(ValueError):
+        GameOfLife([[0]]).advance(-1)
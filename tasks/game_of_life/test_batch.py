@@ -0,0 +1,35 @@
+import random
+
+import pytest
+
+from .batch import BatchOcean, simulate_batch
+from .game_of_life import GameOfLife
+from .test_public import TESTS
+
+
+def test_simulate_ragged_batch_matches_cases() -> None:
+    generations = 2
+    boards = [case.board for case in TESTS]
+    expected = [GameOfLife(case.board).advance(generations) for case in TESTS]
+    assert simulate_batch(boards, generations) == expected
+
+
+def test_batch_matches_individual_games() -> None:
+    rng = random.Random(0)
+    oceans = [[[rng.choice([0, 0, 1, 2, 3]) for _ in range(6)] for _ in range(5)] for _ in range(20)]
+    batch = BatchOcean(oceans)
+    for _ in range(4):
+        batch.step()
+    assert batch.to_oceans() == [GameOfLife([row[:] for row in ocean]).advance(4) for ocean in oceans]
+
+
+def test_batch_requires_same_shape() -> None:
+    with pytest.raises(ValueError):
+        BatchOcean([[[0, 0]], [[0], [0]]])
+
+
+def test_batch_on_torus() -> None:
+    rng = random.Random(2)
+    oceans = [[[rng.choice([0, 0, 1, 2, 3]) for _ in range(5)] for _ in range(4)] for _ in range(3)]
+    expected = [GameOfLife([row[:] for row in ocean], boundary='torus').advance(3) for ocean in oceans]
+    assert simulate_batch(oceans, 3, boundary='torus') == expected
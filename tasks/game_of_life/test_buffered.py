@@ -0,0 +1,67 @@
+import random
+
+import pytest
+
+from .buffered import BufferedOcean
+from .game_of_life import GameOfLife
+from .test_public import TESTS, Case
+
+
+@pytest.mark.parametrize("test_case", TESTS)
+def test_buffered_engine_cases(test_case: Case) -> None:
+    game = GameOfLife(test_case.board, engine='buffered')
+    assert game.advance(test_case.generation_number) == test_case.expected
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_buffered_matches_python(seed: int) -> None:
+    rng = random.Random(seed)
+    ocean = [[rng.choice([0, 0, 0, 1, 2, 2, 3, 3]) for _ in range(14)] for _ in range(9)]
+    reference = GameOfLife([row[:] for row in ocean])
+    buffered = BufferedOcean(ocean)
+    for _ in range(6):
+        buffered.step()
+        assert buffered.to_ocean() == reference.get_next_generation()
+
+
+def test_buffers_are_reused() -> None:
+    ocean = BufferedOcean([[0, 2, 0], [0, 2, 0], [0, 2, 0]])
+    buffers = {id(ocean._front), id(ocean._back)}
+    for _ in range(3):
+        ocean.step()
+    assert {id(ocean._front), id(ocean._back)} == buffers
+
+
+def test_view_is_read_only_and_shaped() -> None:
+    ocean = BufferedOcean([[0, 2, 0], [0, 2, 0], [0, 2, 0]])
+    ocean.step()
+    view = ocean.view()
+    assert view.readonly
+    assert view.shape == (3, 3)
+    assert view[1, 0] == 2 and view[0, 1] == 0
+    assert view.tolist() == [[0, 0, 0], [2, 2, 2], [0, 0, 0]]
+    with pytest.raises(TypeError):
+        view[0, 0] = 1
+
+
+def test_game_lends_views(monkeypatch: pytest.MonkeyPatch) -> None:
+    rng = random.Random(5)
+    ocean = [[rng.choice([0, 0, 1, 2, 3]) for _ in range(8)] for _ in range(6)]
+    reference = GameOfLife([row[:] for row in ocean])
+    game = GameOfLife([row[:] for row in ocean], engine='buffered')
+
+    def fail() -> list[list[int]]:
+        raise AssertionError("to_ocean called")
+
+    monkeypatch.setattr(game._stepper, 'to_ocean', fail)
+    for _ in range(5):
+        view = game.next_view()
+        assert view.readonly
+        assert view.tolist() == reference.get_next_generation()
+        assert game.stats == reference.stats
+    assert game.generation == 5
+
+
+def test_next_view_needs_a_lending_engine() -> None:
+    with pytest.raises(TypeError, match='buffered'):
+        GameOfLife([[0, 2], [2, 2]], engine='numpy').next_view()
@@ -0,0 +1,56 @@
+import itertools
+
+import pytest
+
+from .game_of_life import GameOfLife
+from .observer import GenerationSummary
+
+
+BLINKER = [[0, 2, 0], [0, 2, 0], [0, 2, 0]]
+HORIZONTAL = [[0, 0, 0], [2, 2, 2], [0, 0, 0]]
+
+
+@pytest.mark.parametrize("engine", ['python', 'numpy', 'incremental'])
+def test_generations_states(engine: str) -> None:
+    game = GameOfLife([row[:] for row in BLINKER], engine=engine)
+    states = list(game.generations(limit=3))
+    assert states == [HORIZONTAL, BLINKER, HORIZONTAL]
+    assert game.generation == 3
+
+
+def test_generations_snapshots_are_independent() -> None:
+    game = GameOfLife([row[:] for row in BLINKER])
+    first, second = itertools.islice(game.generations(), 2)
+    assert first == HORIZONTAL and second == BLINKER
+    assert first is not second
+
+
+def test_generations_every() -> None:
+    game = GameOfLife([row[:] for row in BLINKER])
+    assert list(game.generations(every=2, limit=2)) == [BLINKER, BLINKER]
+    assert game.generation == 4
+
+
+@pytest.mark.parametrize("engine", ['python', 'numpy'])
+def test_generations_diffs(engine: str) -> None:
+    game = GameOfLife([row[:] for row in BLINKER], engine=engine)
+    diffs = list(game.generations(mode='diff', limit=2))
+    assert diffs == [
+        [(0, 1, 0), (1, 0, 2), (1, 2, 2), (2, 1, 0)],
+        [(0, 1, 2), (1, 0, 0), (1, 2, 0), (2, 1, 2)],
+    ]
+
+
+def test_generations_stats() -> None:
+    game = GameOfLife([[2, 2, 1], [2, 0, 0]])
+    assert next(game.generations(mode='stats')) == GenerationSummary(
+        generation=1, empty=1, rocks=1, fish=4, shrimp=0, births=1, deaths=0
+    )
+
+
+def test_generations_validation() -> None:
+    game = GameOfLife([[0]])
+    with pytest.raises(ValueError):
+        next(game.generations(every=0))
+    with pytest.raises(ValueError):
+        next(game.generations(mode='history'))  # type: ignore[call-overload]
@@ -0,0 +1,106 @@
+import random
+
+import pytest
+
+from .game_of_life import GameOfLife
+from .hashlife import HashLifeOcean, Node
+from .test_public import TESTS, Case
+
+
+@pytest.mark.parametrize("test_case", TESTS)
+def test_hashlife_engine_cases(test_case: Case) -> None:
+    game = GameOfLife(test_case.board, engine='hashlife')
+    assert game.advance(test_case.generation_number) == test_case.expected
+
+
+@pytest.mark.parametrize("test_case", TESTS)
+def test_hashlife_single_steps(test_case: Case) -> None:
+    game = GameOfLife(test_case.board, engine='hashlife')
+    generation = None
+    for _ in range(min(test_case.generation_number, 12)):
+        generation = game.get_next_generation()
+    if test_case.generation_number <= 12:
+        assert generation == test_case.expected
+
+
+@pytest.mark.parametrize("seed", range(6))
+@pytest.mark.parametrize("max_nodes", [None, 40])
+def test_hashlife_matches_python(seed: int, max_nodes: int | None) -> None:
+    rng = random.Random(seed)
+    rows, cols = rng.randint(1, 21), rng.randint(1, 21)
+    ocean = [[rng.choice([0, 0, 0, 1, 2, 2, 3, 3]) for _ in range(cols)] for _ in range(rows)]
+    for n in (1, 3, 6, 13, 31):
+        reference = GameOfLife([row[:] for row in ocean], engine='numpy')
+        for _ in range(n):
+            reference.get_next_generation()
+        hashlife = HashLifeOcean(ocean, max_nodes=max_nodes)
+        hashlife.advance(n)
+        assert hashlife.to_ocean() == reference.ocean
+
+
+def test_hashlife_huge_jump() -> None:
+    blinker = [[0] * 5, [0, 0, 2, 0, 0], [0, 0, 2, 0, 1], [0, 0, 2, 0, 0], [0] * 5]
+    hashlife = HashLifeOcean(blinker)
+    hashlife.advance(10 ** 15 + 1)
+    assert hashlife.to_ocean() == [[0] * 5, [0] * 5, [0, 2, 2, 2, 1], [0] * 5, [0] * 5]
+
+
+def test_hashlife_eviction() -> None:
+    ocean = [[2, 2, 0, 3], [2, 0, 3, 3], [0, 1, 0, 0]]
+    hashlife = HashLifeOcean(ocean, max_nodes=10)
+    hashlife.advance(5)
+    info = hashlife.cache_info()
+    assert info['evictions'] > 0
+    assert info['results'] == 0
+    hashlife.clear_cache()
+    hashlife.advance(5)
+    assert hashlife.to_ocean() == GameOfLife(ocean, engine='numpy').advance(10)
+
+
+@pytest.mark.parametrize("seed", range(4))
+@pytest.mark.parametrize("max_nodes", [None, 40])
+def test_hashlife_census_matches_numpy(seed: int, max_nodes: int | None) -> None:
+    rng = random.Random(seed)
+    rows, cols = rng.randint(1, 21), rng.randint(1, 21)
+    ocean = [[rng.choice([0, 0, 0, 1, 2, 2, 3, 3]) for _ in range(cols)] for _ in range(rows)]
+    reference = GameOfLife([row[:] for row in ocean], engine='numpy')
+    hashlife = GameOfLife(ocean, engine=lambda board: HashLifeOcean(board, max_nodes=max_nodes))
+    assert hashlife.stats == reference.stats
+    for _ in range(8):
+        reference.get_next_generation()
+        hashlife.get_next_generation()
+        assert hashlife.stats == reference.stats
+
+
+def test_hashlife_steps_without_serializing(monkeypatch: pytest.MonkeyPatch) -> None:
+    game = GameOfLife([[0, 0, 0], [2, 2, 2], [0, 0, 0]], engine='hashlife')
+    monkeypatch.setattr(HashLifeOcean, 'to_bytes', lambda self: pytest.fail("state serialized"))
+    for _ in game.advancing(5):
+        pass
+    stats = list(game.generations(mode='stats', limit=3))
+    assert [(summary.fish, summary.births, summary.deaths) for summary in stats] == [(3, 2, 2)] * 3
+
+
+def test_hashlife_bound_holds_during_a_jump() -> None:
+    class Tracked(HashLifeOcean):
+        peak = 0
+
+        def _join(self, nw: Node, ne: Node, sw: Node, se: Node) -> Node:
+            self.peak = max(self.peak, self.cache_info()['nodes'])
+            return super()._join(nw, ne, sw, se)
+
+    rng = random.Random(9)
+    ocean = [[rng.choice([0, 0, 0, 1, 2, 3]) for _ in range(16)] for _ in range(16)]
+    unbounded, bounded = Tracked(ocean, max_nodes=None), Tracked(ocean, max_nodes=600)
+    unbounded.advance(1 << 10)
+    bounded.advance(1 << 10)
+    assert bounded.to_ocean() == unbounded.to_ocean()
+    assert unbounded.peak > 900
+    assert bounded.peak < 650 and bounded.evictions > 0
+
+
+def test_hashlife_options_through_game() -> None:
+    game = GameOfLife([[0, 2, 0], [0, 2, 0], [0, 2, 0]], engine='hashlife', engine_options={'max_nodes': None})
+    assert game.advance(7) == [[0, 0, 0], [2, 2, 2], [0, 0, 0]]
+    with pytest.raises(TypeError):
+        GameOfLife([[0]], engine='numpy', engine_options={'max_nodes': 10})
@@ -0,0 +1,98 @@
+import random
+from pathlib import Path
+
+import pytest
+
+from .game_of_life import GameOfLife
+from .history import History, HistoryRecorder, HistoryReplayer
+
+
+def random_ocean(rows: int, cols: int, seed: int) -> list[list[int]]:
+    rng = random.Random(seed)
+    return [[rng.choice([0, 0, 1, 2, 3]) for _ in range(cols)] for _ in range(rows)]
+
+
+def reference_run(ocean: list[list[int]], generations: int) -> list[list[list[int]]]:
+    game = GameOfLife([row[:] for row in ocean])
+    return [[row[:] for row in ocean]] + [game.get_next_generation() for _ in range(generations)]
+
+
+@pytest.mark.parametrize("engine", ['python', 'numpy', 'incremental'])
+def test_seek_matches_simulation(engine: str) -> None:
+    ocean = random_ocean(9, 11, seed=3)
+    expected = reference_run(ocean, 20)
+
+    history = HistoryRecorder(GameOfLife([row[:] for row in ocean], engine=engine), keyframe_every=4).record(20)
+    assert history.generations == 20
+    assert len(history.keyframes) == 6
+
+    replayer = HistoryReplayer(history)
+    for generation in (0, 1, 4, 7, 20, 13):
+        assert replayer.seek(generation) == expected[generation]
+
+
+def test_replay_from_seek() -> None:
+    ocean = random_ocean(6, 6, seed=5)
+    expected = reference_run(ocean, 10)
+    history = HistoryRecorder(GameOfLife([row[:] for row in ocean]), keyframe_every=3).record(10)
+
+    replayer = HistoryReplayer(history)
+    replayer.seek(6)
+    assert list(replayer.replay()) == expected[6:]
+
+
+def test_record_in_several_calls() -> None:
+    ocean = random_ocean(5, 7, seed=1)
+    recorder = HistoryRecorder(GameOfLife([row[:] for row in ocean]), keyframe_every=2)
+    recorder.record(3)
+    history = recorder.record(4)
+    assert history.generations == 7
+    assert HistoryReplayer(history).seek(7) == reference_run(ocean, 7)[7]
+
+
+@pytest.mark.parametrize("engine", ['numpy', 'buffered'])
+def test_record_after_lazy_stepping(engine: str) -> None:
+    ocean = random_ocean(8, 8, seed=2)
+    expected = reference_run(ocean, 9)
+    game = GameOfLife([row[:] for row in ocean], engine=engine)
+    list(game.generations(mode='stats', limit=3))
+    for _ in game.advancing(2):
+        pass
+    history = HistoryRecorder(game).record(4)
+    replayer = HistoryReplayer(history)
+    assert [replayer.seek(generation) for generation in range(5)] == expected[5:]
+
+
+def test_delta_is_the_change_list() -> None:
+    blinker = [[0, 2, 0], [0, 2, 0], [0, 2, 0]]
+    history = HistoryRecorder(GameOfLife(blinker)).record(1)
+    assert sorted(history.delta(1)) == [(0, 1, 0), (1, 0, 2), (1, 2, 2), (2, 1, 0)]
+    assert list(history.changes) == [1 << 2 | 0, 3 << 2 | 2, 5 << 2 | 2, 7 << 2 | 0]
+
+
+def test_save_and_load(tmp_path: Path) -> None:
+    ocean = random_ocean(8, 5, seed=9)
+    history = HistoryRecorder(GameOfLife([row[:] for row in ocean]), keyframe_every=5).record(12)
+    path = tmp_path / 'run.history'
+    history.save(path)
+
+    loaded = History.load(path)
+    assert (loaded.rows, loaded.cols, loaded.generations) == (8, 5, 12)
+    assert loaded.changes == history.changes
+    assert loaded.keyframes == history.keyframes
+    assert all(loaded.state(g) == history.state(g) for g in range(13))
+
+
+def test_load_rejects_other_files(tmp_path: Path) -> None:
+    path = tmp_path / 'other'
+    path.write_bytes(b'x' * 64)
+    with pytest.raises(ValueError, match="not a history file"):
+        History.load(path)
+
+
+def test_out_of_range() -> None:
+    history = HistoryRecorder(GameOfLife([[2, 2], [2, 0]])).record(2)
+    with pytest.raises(IndexError):
+        history.state(3)
+    with pytest.raises(IndexError):
+        history.delta(0)
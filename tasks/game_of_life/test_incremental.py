@@ -0,0 +1,37 @@
+import random
+
+import pytest
+
+from .game_of_life import GameOfLife
+from .incremental import IncrementalOcean
+from .test_public import TESTS, Case
+
+
+@pytest.mark.parametrize("test_case", TESTS)
+def test_incremental_engine_cases(test_case: Case) -> None:
+    game = GameOfLife(test_case.board, engine='incremental')
+    assert game.advance(test_case.generation_number) == test_case.expected
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_incremental_engine_matches_python(seed: int) -> None:
+    rng = random.Random(seed)
+    ocean = [[rng.choice([0] * 6 + [1, 2, 2, 3, 3]) for _ in range(19)] for _ in range(13)]
+    reference = GameOfLife([row[:] for row in ocean])
+    incremental = GameOfLife([row[:] for row in ocean], engine='incremental')
+    for _ in range(8):
+        assert incremental.get_next_generation() == reference.get_next_generation()
+
+
+def test_incremental_work_scales_with_activity() -> None:
+    ocean = [[0] * 300 for _ in range(300)]
+    for i in range(0, 300, 7):
+        ocean[i][150] = 1
+    ocean[10][10] = ocean[10][11] = ocean[10][12] = 2
+
+    stepper = IncrementalOcean(ocean)
+    assert len(stepper.active) == 15
+    stepper.step()
+    stepper.step()
+    assert len(stepper.active) <= 25
+    assert stepper.to_ocean()[10][10:13] == [2, 2, 2]
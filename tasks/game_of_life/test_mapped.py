@@ -0,0 +1,93 @@
+import functools
+import random
+from pathlib import Path
+
+import pytest
+
+from .game_of_life import GameOfLife
+from .mapped import MappedOcean, load_ocean, save_ocean
+from .neighbourhood import Boundary
+
+
+def _random_ocean(rows: int, cols: int, seed: int) -> list[list[int]]:
+    rng = random.Random(seed)
+    return [[rng.choice([0, 0, 0, 1, 2, 2, 3, 3]) for _ in range(cols)] for _ in range(rows)]
+
+
+def test_save_and_load(tmp_path: Path) -> None:
+    ocean = _random_ocean(5, 7, 0)
+    save_ocean(tmp_path / 'board.ocean', ocean)
+    assert load_ocean(tmp_path / 'board.ocean') == ocean
+    assert (tmp_path / 'board.ocean').stat().st_size == 32 + 5 * 7
+
+
+def test_load_rejects_other_files(tmp_path: Path) -> None:
+    (tmp_path / 'notes.txt').write_bytes(b'x' * 64)
+    with pytest.raises(ValueError):
+        load_ocean(tmp_path / 'notes.txt')
+
+
+@pytest.mark.parametrize("stripe_rows", [1, 3, 1024])
+def test_striped_steps_match_python(tmp_path: Path, stripe_rows: int) -> None:
+    ocean = _random_ocean(16, 11, stripe_rows)
+    reference = GameOfLife([row[:] for row in ocean])
+    mapped = MappedOcean.create(tmp_path / 'board.ocean', ocean, stripe_rows=stripe_rows)
+    for _ in range(5):
+        mapped.step()
+        assert mapped.to_ocean() == reference.get_next_generation()
+    assert MappedOcean(tmp_path / 'board.ocean').generation == 5
+
+
+@pytest.mark.parametrize("boundary", ['torus', 'reflect'])
+def test_striped_steps_follow_boundary(tmp_path: Path, boundary: Boundary) -> None:
+    ocean = _random_ocean(10, 8, 2)
+    reference = GameOfLife([row[:] for row in ocean], boundary=boundary)
+    mapped = MappedOcean.create(tmp_path / 'board.ocean', ocean, stripe_rows=3, boundary=boundary)
+    for _ in range(5):
+        mapped.step()
+        assert mapped.to_ocean() == reference.get_next_generation()
+
+
+def test_checkpoints_resume(tmp_path: Path) -> None:
+    ocean = _random_ocean(9, 9, 1)
+    mapped = MappedOcean.create(tmp_path / 'board.ocean', ocean)
+    mapped.run(6, checkpoint_every=3, checkpoint_dir=tmp_path)
+
+    resumed = MappedOcean(tmp_path / 'generation-000000000003.ocean')
+    assert resumed.generation == 3
+    resumed.run(3)
+    assert resumed.to_bytes() == mapped.to_bytes()
+    assert (tmp_path / 'generation-000000000006.ocean').exists()
+
+
+def test_mapped_engine(tmp_path: Path) -> None:
+    engine = functools.partial(MappedOcean.create, tmp_path / 'board.ocean')
+    game = GameOfLife([[0, 2, 0], [0, 2, 0], [0, 2, 0]], engine=engine)
+    assert game.get_next_generation() == [[0, 0, 0], [2, 2, 2], [0, 0, 0]]
+    assert load_ocean(tmp_path / 'board.ocean') == [[0, 0, 0], [2, 2, 2], [0, 0, 0]]
+
+
+def test_game_counts_without_copying(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    ocean = _random_ocean(12, 9, 4)
+    save_ocean(tmp_path / 'board.ocean', ocean)
+    reference = GameOfLife([row[:] for row in ocean])
+    game = GameOfLife(load_ocean(tmp_path / 'board.ocean'), engine=MappedOcean.opener(tmp_path / 'board.ocean', 4))
+
+    def fail() -> bytes:
+        raise AssertionError("to_bytes called")
+
+    monkeypatch.setattr(game._stepper, 'to_bytes', fail)
+    assert game.stats == reference.stats
+    for _ in range(4):
+        assert game.get_next_generation() == reference.get_next_generation()
+        assert game.stats == reference.stats
+    assert game.advance(20) == reference.advance(20)
+    assert game.stats == reference.stats
+
+
+def test_opener_keeps_the_file(tmp_path: Path) -> None:
+    save_ocean(tmp_path / 'board.ocean', _random_ocean(4, 5, 5), generation=7)
+    opener = MappedOcean.opener(tmp_path / 'board.ocean')
+    assert opener(load_ocean(tmp_path / 'board.ocean')).generation == 7
+    with pytest.raises(ValueError, match='4x5'):
+        opener(_random_ocean(5, 4, 5))
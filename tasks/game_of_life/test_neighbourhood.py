@@ -0,0 +1,99 @@
+import random
+from collections import Counter
+
+import pytest
+
+from .game_of_life import ENGINES, GameOfLife
+from .hashlife import HashLifeOcean
+from .neighbourhood import BOUNDARIES, Boundary, Neighbourhood, axis_steps, neighbourhood
+
+
+def _neighbours(hood: Neighbourhood, i: int, j: int) -> set[tuple[int, int]]:
+    index = i * hood.cols + j
+    return {divmod(index + offset, hood.cols) for offset in hood.offsets(index)}
+
+
+def _resolve(position: int, length: int, boundary: Boundary) -> int:
+    if boundary == 'torus':
+        return position % length
+    return min(max(position, 0), length - 1)
+
+
+@pytest.mark.parametrize("rows, cols", [(1, 1), (1, 4), (4, 1), (2, 2), (5, 7)])
+def test_offsets_match_bounded_window(rows: int, cols: int) -> None:
+    hood = Neighbourhood(rows, cols)
+    for i in range(rows):
+        for j in range(cols):
+            expected = {
+                (x, y) for x in range(i - 1, i + 2) for y in range(j - 1, j + 2)
+                if 0 <= x < rows and 0 <= y < cols and (x, y) != (i, j)
+            }
+            assert _neighbours(hood, i, j) == expected
+
+
+def test_offsets_are_shared() -> None:
+    hood = neighbourhood(50, 60)
+    assert hood is neighbourhood(50, 60)
+    assert len({id(offsets) for row in hood.by_row for offsets in row}) == 9
+
+
+def test_get_neighbours_includes_east() -> None:
+    game = GameOfLife([[0] * 3 for _ in range(3)])
+    assert sorted(game._get_neighbours(1, 1)) == [
+        (0, 0), (0, 1), (0, 2), (1, 0), (1, 2), (2, 0), (2, 1), (2, 2)
+    ]
+    assert sorted(game._get_neighbours(0, 0)) == [(0, 1), (1, 0), (1, 1)]
+
+
+def test_axis_steps() -> None:
+    assert axis_steps(0, 5, 'fixed') == ((0, 0), (1, 1))
+    assert axis_steps(0, 5, 'torus') == ((-1, 4), (0, 0), (1, 1))
+    assert axis_steps(4, 5, 'torus') == ((-1, 3), (0, 4), (1, 0))
+    assert axis_steps(0, 5, 'reflect') == ((-1, 0), (0, 0), (1, 1))
+    assert axis_steps(2, 5, 'reflect') == ((-1, 1), (0, 2), (1, 3))
+
+
+@pytest.mark.parametrize("boundary", ['torus', 'reflect'])
+@pytest.mark.parametrize("rows, cols", [(1, 1), (1, 4), (2, 2), (3, 3), (5, 7)])
+def test_offsets_match_ghost_border(boundary: Boundary, rows: int, cols: int) -> None:
+    hood = Neighbourhood(rows, cols, boundary)
+    for i in range(rows):
+        for j in range(cols):
+            index = i * cols + j
+            expected = Counter(
+                _resolve(i + di, rows, boundary) * cols + _resolve(j + dj, cols, boundary)
+                for di in (-1, 0, 1) for dj in (-1, 0, 1) if di or dj
+            )
+            assert Counter(index + offset for offset in hood.offsets(index)) == expected
+
+
+def test_unknown_boundary() -> None:
+    with pytest.raises(ValueError, match="Unknown boundary"):
+        GameOfLife([[0]], boundary='sphere')  # type: ignore[arg-type]
+
+
+def test_glider_wraps_around_torus() -> None:
+    ocean = [[0] * 6 for _ in range(6)]
+    for i, j in [(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)]:
+        ocean[i][j] = 2
+    game = GameOfLife([row[:] for row in ocean], boundary='torus')
+    # A glider moves one cell diagonally every four generations
+    assert game.advance(24) == ocean
+
+
+@pytest.mark.parametrize("engine", sorted(set(ENGINES) - {'hashlife'}))
+@pytest.mark.parametrize("boundary", BOUNDARIES)
+@pytest.mark.parametrize("rows, cols", [(7, 9), (3, 16)])
+def test_engines_follow_boundary(engine: str, boundary: Boundary, rows: int, cols: int) -> None:
+    rng = random.Random(11)
+    ocean = [[rng.choice([0, 0, 1, 2, 3]) for _ in range(cols)] for _ in range(rows)]
+    reference = GameOfLife([row[:] for row in ocean], boundary=boundary)
+    game = GameOfLife([row[:] for row in ocean], engine=engine, boundary=boundary)
+    for _ in range(6):
+        assert game.get_next_generation() == reference.get_next_generation()
+        assert game.stats == reference.stats
+
+
+def test_hashlife_needs_fixed_boundary() -> None:
+    with pytest.raises(ValueError, match="fixed boundary"):
+        HashLifeOcean([[0, 2], [2, 2]], boundary='torus')
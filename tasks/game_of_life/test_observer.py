@@ -0,0 +1,127 @@
+import random
+
+import pytest
+
+from .game_of_life import ENGINES, GameOfLife
+from .observer import Census, CellEvent, GenerationSummary, OceanObserver, PrintObserver
+
+
+class RecordingObserver(OceanObserver):
+    def __init__(self, trace_cells: bool) -> None:
+        self.trace_cells = trace_cells
+        self.summaries: list[GenerationSummary] = []
+        self.events: list[CellEvent] = []
+
+    def on_generation(self, summary: GenerationSummary) -> None:
+        self.summaries.append(summary)
+
+    def on_cell(self, event: CellEvent) -> None:
+        self.events.append(event)
+
+
+BOARD = [
+    [0, 2, 0, 1],
+    [0, 2, 0, 3],
+    [0, 2, 3, 3],
+]
+
+
+@pytest.mark.parametrize("engine", ['python', 'numpy'])
+def test_step_is_silent(engine: str, capsys: pytest.CaptureFixture[str]) -> None:
+    GameOfLife([row[:] for row in BOARD], engine=engine).get_next_generation()
+    assert capsys.readouterr().out == ''
+
+
+@pytest.mark.parametrize("engine", ['python', 'numpy'])
+def test_generation_summaries(engine: str) -> None:
+    observer = RecordingObserver(trace_cells=False)
+    game = GameOfLife([row[:] for row in BOARD], engine=engine, observer=observer)
+    game.get_next_generation()
+    game.get_next_generation()
+
+    assert observer.events == []
+    assert observer.summaries == [
+        GenerationSummary(generation=1, empty=5, rocks=1, fish=3, shrimp=3, births=2, deaths=2),
+        GenerationSummary(generation=2, empty=5, rocks=1, fish=3, shrimp=3, births=2, deaths=2),
+    ]
+
+
+@pytest.mark.parametrize("engine", ['python', 'numpy'])
+def test_cell_tracing(engine: str) -> None:
+    observer = RecordingObserver(trace_cells=True)
+    GameOfLife([row[:] for row in BOARD], engine=engine, observer=observer).get_next_generation()
+
+    assert len(observer.events) == 12
+    assert observer.events[4] == CellEvent(
+        generation=1, i=1, j=0, cell=0, fish_count=3, shrimp_count=0, new_cell=2
+    )
+
+
+def test_print_observer(capsys: pytest.CaptureFixture[str]) -> None:
+    GameOfLife([[2]], observer=PrintObserver()).get_next_generation()
+    assert capsys.readouterr().out.splitlines() == [
+        "Cell (0, 0): Current=2, FishCount=0, ShrimpCount=0, NewValue=0",
+        "Generation 1: Fish=0, Shrimp=0, Rocks=0, Empty=1, Births=0, Deaths=1",
+    ]
+
+
+def test_census_next() -> None:
+    census = Census.of(bytes([0, 1, 2, 2, 3]))
+    assert census == Census(empty=1, rocks=1, fish=2, shrimp=1, births=0, deaths=0)
+    assert census.next(fish_born=1, fish_died=2, shrimp_born=0, shrimp_died=1) == Census(
+        empty=3, rocks=1, fish=1, shrimp=0, births=1, deaths=3
+    )
+    assert census.next_from_survivors(1, 0, 0, 0) == census.next(1, 2, 0, 1)
+
+
+def test_stats_before_stepping() -> None:
+    game = GameOfLife([row[:] for row in BOARD])
+    assert game.stats == GenerationSummary(generation=0, empty=5, rocks=1, fish=3, shrimp=3)
+
+
+@pytest.mark.parametrize("engine", sorted(ENGINES))
+def test_stats_match_reference(engine: str) -> None:
+    rng = random.Random(7)
+    ocean = [[rng.choice([0, 0, 1, 2, 3]) for _ in range(12)] for _ in range(10)]
+    reference = GameOfLife([row[:] for row in ocean])
+    game = GameOfLife([row[:] for row in ocean], engine=engine)
+    for _ in range(6):
+        reference.get_next_generation()
+        game.get_next_generation()
+        assert game.stats == reference.stats
+
+    for n in (1, 2, 5):
+        game.advance(n)
+        reference.advance(n)
+        assert game.stats == reference.stats
+
+
+@pytest.mark.parametrize("engine", ['python', *sorted(ENGINES)])
+def test_stats_after_advance_cover_one_generation(engine: str) -> None:
+    game = GameOfLife([[0, 2, 0], [0, 2, 0], [0, 2, 0]], engine=engine)
+    game.advance(2)
+    assert game.stats == GenerationSummary(generation=2, empty=6, rocks=0, fish=3, shrimp=0, births=2, deaths=2)
+
+
+class PlainStepper(object):
+    """
+    Engine without a census, so GameOfLife has to scan for the stats
+    """
+    def __init__(self, ocean: list[list[int]]) -> None:
+        self.game = GameOfLife(ocean)
+
+    def step(self) -> None:
+        self.game.get_next_generation()
+
+    def to_ocean(self) -> list[list[int]]:
+        return [row[:] for row in self.game.ocean]
+
+    def to_bytes(self) -> bytes:
+        return b''.join(bytes(row) for row in self.game.ocean)
+
+
+def test_stats_without_native_counts() -> None:
+    game = GameOfLife([row[:] for row in BOARD], engine=PlainStepper)
+    assert game.stats == GenerationSummary(generation=0, empty=5, rocks=1, fish=3, shrimp=3)
+    game.get_next_generation()
+    assert game.stats == GenerationSummary(generation=1, empty=5, rocks=1, fish=3, shrimp=3, births=2, deaths=2)
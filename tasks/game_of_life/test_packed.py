@@ -0,0 +1,38 @@
+import random
+
+import pytest
+
+from .game_of_life import GameOfLife
+from .packed import PackedOcean
+from .test_public import TESTS, Case
+
+
+@pytest.mark.parametrize("test_case", TESTS)
+def test_packed_engine_cases(test_case: Case) -> None:
+    game = GameOfLife(test_case.board, engine='packed')
+    assert game.advance(test_case.generation_number) == test_case.expected
+
+
+@pytest.mark.parametrize("cols", [1, 7, 8, 9, 17, 33])
+def test_packed_matches_python(cols: int) -> None:
+    rng = random.Random(cols)
+    ocean = [[rng.choice([0, 0, 0, 1, 2, 2, 3, 3]) for _ in range(cols)] for _ in range(12)]
+    reference = GameOfLife([row[:] for row in ocean])
+    packed = PackedOcean(ocean)
+    for _ in range(8):
+        packed.step()
+        assert packed.to_ocean() == reference.get_next_generation()
+
+
+def test_packed_accessors() -> None:
+    ocean = [[0, 1, 2, 3, 0, 1, 2, 3, 3, 2]]
+    packed = PackedOcean(ocean)
+    assert [packed[0, j] for j in range(10)] == ocean[0]
+    packed[0, 9] = 1
+    packed[0, 2] = 0
+    assert packed.to_ocean() == [[0, 1, 0, 3, 0, 1, 2, 3, 3, 1]]
+
+
+def test_packed_size() -> None:
+    packed = PackedOcean([[0] * 64 for _ in range(64)])
+    assert packed.nbytes == 64 * 64 * 2 // 8
@@ -0,0 +1,32 @@
+import random
+
+import pytest
+
+from .game_of_life import GameOfLife
+from .parallel import ParallelOcean
+from .test_public import TESTS, Case
+
+
+@pytest.mark.parametrize("test_case", TESTS[:8])
+def test_parallel_engine_cases(test_case: Case) -> None:
+    with ParallelOcean(test_case.board, workers=3) as ocean:
+        for _ in range(test_case.generation_number):
+            ocean.step()
+        assert ocean.to_ocean() == test_case.expected
+
+
+@pytest.mark.parametrize("workers", [1, 2, 5])
+def test_parallel_matches_serial(workers: int) -> None:
+    rng = random.Random(workers)
+    ocean = [[rng.choice([0, 0, 0, 1, 2, 2, 3, 3]) for _ in range(31)] for _ in range(23)]
+    reference = GameOfLife([row[:] for row in ocean])
+    with ParallelOcean(ocean, workers=workers) as parallel:
+        for _ in range(5):
+            reference.get_next_generation()
+            parallel.step()
+            assert parallel.to_bytes() == b''.join(bytes(row) for row in reference.ocean)
+
+
+def test_parallel_engine_name() -> None:
+    game = GameOfLife([[2, 2, 0], [2, 2, 0], [0, 0, 0]], engine='parallel')
+    assert game.advance(3) == [[2, 2, 0], [2, 2, 0], [0, 0, 0]]
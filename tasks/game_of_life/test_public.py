@@ -266,7 +266,7 @@ def test_methods() -> None:
     methods_names = [x for x, y in GameOfLife.__dict__.items() if isinstance(y, FunctionType)]
     private_methods = {x for x in methods_names if x.startswith('_')}
     public_methods = {x for x in methods_names if not x.startswith('_')}
-    assert public_methods == {'get_next_generation'}
+    assert public_methods == {'get_next_generation', 'advance', 'advancing', 'generations', 'next_view'}
     assert len(private_methods - {'__init__'}) > 0
 
 
@@ -0,0 +1,80 @@
+import random
+
+import pytest
+
+from .batch import simulate_batch
+from .game_of_life import ENGINES, GameOfLife
+from .rules import CLASSIC, EMPTY, FISH, ROCK, SHRIMP, RuleSpec, compile_rules
+from .sparse import SparseOcean
+from .test_public import TESTS, Case
+
+
+HIGH_LIFE = RuleSpec(fish_birth=frozenset({3, 6}), shrimp_survive=frozenset({1, 2, 3, 4}))
+FROM_NOTHING = RuleSpec(fish_birth=frozenset({0}), fish_survive=frozenset({0, 1, 2, 3}))
+
+
+def random_ocean(rows: int, cols: int, seed: int) -> list[list[int]]:
+    rng = random.Random(seed)
+    return [[rng.choice([0, 0, 1, 2, 3]) for _ in range(cols)] for _ in range(rows)]
+
+
+def test_classic_table() -> None:
+    table = compile_rules(CLASSIC)
+    assert len(table) == 4 * 256
+    assert table[FISH << 8 | 0x02] == FISH
+    assert table[FISH << 8 | 0x04] == EMPTY
+    assert table[SHRIMP << 8 | 0x30] == SHRIMP
+    assert table[EMPTY << 8 | 0x33] == FISH
+    assert table[EMPTY << 8 | 0x30] == SHRIMP
+    assert table[ROCK << 8 | 0x33] == ROCK
+    assert compile_rules(RuleSpec()) is table
+
+
+def test_table_matches_spec() -> None:
+    table = compile_rules(HIGH_LIFE)
+    for cell in (EMPTY, ROCK, FISH, SHRIMP):
+        for fish_count in range(9):
+            for shrimp_count in range(9 - fish_count):
+                expected = HIGH_LIFE.next_state(cell, fish_count, shrimp_count)
+                assert table[cell << 8 | shrimp_count << 4 | fish_count] == expected
+
+
+def test_invalid_counts() -> None:
+    with pytest.raises(ValueError, match="fish_birth"):
+        RuleSpec(fish_birth=frozenset({9}))
+
+
+@pytest.mark.parametrize("test_case", TESTS)
+def test_classic_rules_explicitly(test_case: Case) -> None:
+    game = GameOfLife([row[:] for row in test_case.board], rules=RuleSpec())
+    assert game.advance(test_case.generation_number) == test_case.expected
+
+
+@pytest.mark.parametrize("engine", sorted(ENGINES))
+@pytest.mark.parametrize("rules", [HIGH_LIFE, FROM_NOTHING], ids=['high_life', 'from_nothing'])
+def test_engines_follow_rules(engine: str, rules: RuleSpec) -> None:
+    if engine == 'sparse' and rules.births_from_nothing:
+        pytest.skip("SparseOcean only visits cells next to creatures")
+    ocean = random_ocean(11, 13, seed=4)
+    reference = GameOfLife([row[:] for row in ocean], rules=rules)
+    game = GameOfLife([row[:] for row in ocean], engine=engine, rules=rules)
+    for _ in range(5):
+        assert game.get_next_generation() == reference.get_next_generation()
+        assert game.stats == reference.stats
+
+
+def test_rules_change_the_outcome() -> None:
+    ocean = random_ocean(11, 13, seed=4)
+    classic = GameOfLife([row[:] for row in ocean]).advance(3)
+    assert GameOfLife([row[:] for row in ocean], rules=HIGH_LIFE).advance(3) != classic
+
+
+def test_batch_follows_rules() -> None:
+    oceans = [random_ocean(6, 7, seed) for seed in range(3)]
+    expected = [GameOfLife([row[:] for row in ocean], rules=HIGH_LIFE).advance(4) for ocean in oceans]
+    assert simulate_batch(oceans, 4, HIGH_LIFE) == expected
+
+
+def test_sparse_rejects_births_from_nothing() -> None:
+    with pytest.raises(ValueError, match="no creature neighbours"):
+        SparseOcean(3, 3, rules=FROM_NOTHING)
@@ -0,0 +1,116 @@
+import asyncio
+import random
+
+import pytest
+
+from .game_of_life import GameOfLife
+from .service import SimulationService
+
+
+def random_ocean(rows: int, cols: int, seed: int) -> list[list[int]]:
+    rng = random.Random(seed)
+    return [[rng.choice([0, 0, 1, 2, 3]) for _ in range(cols)] for _ in range(rows)]
+
+
+@pytest.mark.parametrize("offload", [True, False])
+def test_advance_matches_game(offload: bool) -> None:
+    ocean = random_ocean(12, 12, seed=1)
+    expected = GameOfLife([row[:] for row in ocean]).advance(25)
+    service = SimulationService(chunk=4, offload=offload)
+    game = GameOfLife([row[:] for row in ocean])
+    assert asyncio.run(service.advance(game, 25)) == expected
+    assert game.generation == 25
+
+
+def test_step_and_zero_generations() -> None:
+    ocean = random_ocean(5, 5, seed=2)
+    expected = GameOfLife([row[:] for row in ocean]).get_next_generation()
+    service = SimulationService()
+    game = GameOfLife([row[:] for row in ocean], engine='numpy')
+    assert asyncio.run(service.advance(game, 0)) == ocean
+    assert asyncio.run(service.step(game)) == expected
+
+
+def test_progress_reports_every_chunk() -> None:
+    reports: list[tuple[int, int]] = []
+    service = SimulationService(chunk=4)
+    game = GameOfLife(random_ocean(12, 12, seed=3))  # no repeated state within 10 generations
+    asyncio.run(service.advance(game, 10, lambda done, total: reports.append((done, total))))
+    assert reports == [(4, 10), (8, 10), (10, 10)]
+
+
+def test_cancellation_stops_at_a_whole_generation() -> None:
+    game = GameOfLife(random_ocean(30, 30, seed=4))
+    service = SimulationService(chunk=1)
+
+    async def main() -> None:
+        started = asyncio.Event()
+        task = asyncio.create_task(service.advance(game, 10 ** 6, lambda done, total: started.set()))
+        await started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+    assert 1 <= game.generation < 10 ** 6
+    assert service.running == 0
+    reference = GameOfLife(random_ocean(30, 30, seed=4))
+    assert game.ocean == reference.advance(game.generation)
+
+
+def test_concurrency_is_capped() -> None:
+    service = SimulationService(max_concurrent=2, chunk=1)
+    peak = 0
+
+    def track(done: int, total: int) -> None:
+        nonlocal peak
+        peak = max(peak, service.running)
+
+    async def main() -> list[list[list[int]]]:
+        games = [GameOfLife(random_ocean(8, 8, seed)) for seed in range(5)]
+        return await asyncio.gather(*(service.advance(game, 5, track) for game in games))
+
+    results = asyncio.run(main())
+    assert peak == 2
+    assert results == [GameOfLife(random_ocean(8, 8, seed)).advance(5) for seed in range(5)]
+
+
+def test_loop_stays_responsive() -> None:
+    service = SimulationService(chunk=1, offload=False)
+    ticks = 0
+
+    async def ticker(stop: asyncio.Event) -> None:
+        nonlocal ticks
+        while not stop.is_set():
+            ticks += 1
+            await asyncio.sleep(0)
+
+    async def main() -> None:
+        stop = asyncio.Event()
+        ticking = asyncio.create_task(ticker(stop))
+        await service.advance(GameOfLife(random_ocean(20, 20, seed=5)), 10)
+        stop.set()
+        await ticking
+
+    asyncio.run(main())
+    assert ticks >= 10
+
+
+@pytest.mark.parametrize("offload", [True, False])
+def test_cycles_are_skipped_across_chunks(offload: bool) -> None:
+    blinker = [[0, 2, 0], [0, 2, 0], [0, 2, 0]]
+    reports: list[tuple[int, int]] = []
+    service = SimulationService(chunk=1, offload=offload)
+    game = GameOfLife([row[:] for row in blinker])
+    result = asyncio.run(service.advance(game, 10 ** 6 + 1, lambda done, total: reports.append((done, total))))
+    assert result == [[0, 0, 0], [2, 2, 2], [0, 0, 0]]
+    assert game.generation == 10 ** 6 + 1
+    assert len(reports) < 10
+    assert reports[-1] == (10 ** 6 + 1, 10 ** 6 + 1)
+
+
+def test_invalid_arguments() -> None:
+    with pytest.raises(ValueError):
+        SimulationService(max_concurrent=0)
+    with pytest.raises(ValueError):
+        asyncio.run(SimulationService().advance(GameOfLife([[0]]), -1))
@@ -0,0 +1,95 @@
+import random
+
+import pytest
+
+from .game_of_life import GameOfLife
+from .sparse import SparseOcean
+from .test_public import TESTS, Case
+
+
+@pytest.mark.parametrize("test_case", TESTS)
+def test_sparse_engine_cases(test_case: Case) -> None:
+    game = GameOfLife(test_case.board, engine='sparse')
+    assert game.advance(test_case.generation_number) == test_case.expected
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_sparse_matches_python(seed: int) -> None:
+    rng = random.Random(seed)
+    ocean = [[rng.choice([0] * 4 + [1, 2, 2, 3, 3]) for _ in range(11)] for _ in range(16)]
+    reference = GameOfLife([row[:] for row in ocean])
+    sparse = SparseOcean.from_dense(ocean)
+    for _ in range(8):
+        sparse.step()
+        assert sparse.to_dense() == reference.get_next_generation()
+
+
+def test_sparse_round_trip() -> None:
+    ocean = [[0, 1, 2], [3, 0, 0]]
+    sparse = SparseOcean.from_dense(ocean)
+    assert sparse.to_dense() == ocean
+    assert (sparse[0, 1], sparse[0, 2], sparse[1, 0], sparse[1, 1]) == (1, 2, 3, 0)
+
+
+def test_sparse_huge_board() -> None:
+    size = 100_000
+    ocean = SparseOcean(size, size, rocks=[(0, 0)], fish=[(size - 1, 5), (size - 1, 6), (size - 1, 7)])
+    ocean.step()
+    assert ocean.fish == {(size - 2, 6), (size - 1, 6)}
+    ocean.step()
+    assert ocean.fish == set()
+
+
+def test_sparse_validation() -> None:
+    with pytest.raises(ValueError):
+        SparseOcean(2, 2, fish=[(2, 0)])
+    with pytest.raises(ValueError):
+        SparseOcean(2, 2, fish=[(0, 0)], shrimp=[(0, 0)])
+
+
+def test_sparse_state_key() -> None:
+    ocean = SparseOcean(3, 3, rocks=[(2, 2)], fish=[(0, 0), (0, 1)], shrimp=[(1, 1)])
+    assert ocean.state_key() == SparseOcean(3, 3, rocks=[(2, 2)], fish=[(0, 1), (0, 0)], shrimp=[(1, 1)]).state_key()
+    assert ocean.state_key() != SparseOcean(3, 3, fish=[(0, 0)], shrimp=[(0, 1), (1, 1)]).state_key()
+    assert ocean.state_key() != SparseOcean(3, 3, fish=[(0, 0), (0, 1), (1, 1)]).state_key()
+
+
+def test_sparse_advance_does_not_materialize(monkeypatch: pytest.MonkeyPatch) -> None:
+    blinker = [[0] * 5 for _ in range(5)]
+    for j in (1, 2, 3):
+        blinker[2][j] = 2
+    game = GameOfLife([row[:] for row in blinker], engine='sparse')
+
+    def fail() -> bytes:
+        raise AssertionError("to_bytes called")
+
+    monkeypatch.setattr(game._stepper, 'to_bytes', fail)
+    assert game.advance(10 ** 6) == blinker
+
+
+def test_game_from_cells_on_a_huge_board() -> None:
+    size = 100_000
+    game = GameOfLife.from_cells(size, size, rocks=[(0, 0)], fish=[(size - 1, 5), (size - 1, 6), (size - 1, 7)])
+    stats = list(game.generations(mode='stats', limit=2))
+    assert [(summary.generation, summary.fish, summary.births, summary.deaths) for summary in stats] == [
+        (1, 2, 1, 2),
+        (2, 0, 0, 2),
+    ]
+    assert stats[-1].rocks == 1 and stats[-1].empty == size * size - 1
+    for _ in game.advancing(10 ** 6):
+        pass
+    assert game.generation == 10 ** 6 + 2
+
+
+def test_game_from_cells_matches_dense() -> None:
+    ocean = [[0, 2, 0, 3], [0, 2, 1, 3], [0, 2, 0, 3]]
+    game = GameOfLife.from_cells(3, 4, rocks=[(1, 2)], fish=[(0, 1), (1, 1), (2, 1)], shrimp=[(0, 3), (1, 3), (2, 3)],
+                                 boundary='torus')
+    assert game.advance(5) == GameOfLife(ocean, engine='numpy', boundary='torus').advance(5)
+
+
+def test_sparse_ocean_needs_the_sparse_engine() -> None:
+    with pytest.raises(ValueError, match='sparse'):
+        GameOfLife(SparseOcean(2, 2), engine='numpy')
+    with pytest.raises(ValueError, match='boundary'):
+        GameOfLife(SparseOcean(2, 2, boundary='torus'), engine='sparse')
@@ -0,0 +1,53 @@
+import random
+
+import numpy as np
+import pytest
+
+from .game_of_life import GameOfLife
+from .test_public import TESTS, Case
+from .vectorized import VectorizedOcean, count_neighbours, neighbour_histogram
+
+
+def _random_ocean(rows: int, cols: int, seed: int) -> list[list[int]]:
+    rng = random.Random(seed)
+    return [[rng.choice([0, 0, 0, 1, 2, 2, 3, 3]) for _ in range(cols)] for _ in range(rows)]
+
+
+@pytest.mark.parametrize("test_case", TESTS)
+def test_numpy_engine_cases(test_case: Case) -> None:
+    game = GameOfLife(test_case.board, engine='numpy')
+    generation = None
+    for _ in range(test_case.generation_number):
+        generation = game.get_next_generation()
+    assert generation == test_case.expected
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_numpy_engine_matches_python(seed: int) -> None:
+    ocean = _random_ocean(17, 23, seed)
+    reference = GameOfLife([row[:] for row in ocean])
+    vectorized = GameOfLife([row[:] for row in ocean], engine='numpy')
+    for _ in range(6):
+        assert vectorized.get_next_generation() == reference.get_next_generation()
+
+
+def test_count_neighbours_edges() -> None:
+    mask = np.ones((3, 3), dtype=np.uint8)
+    assert count_neighbours(mask).tolist() == [[3, 5, 3], [5, 8, 5], [3, 5, 3]]
+
+
+def test_engine_factory_and_unknown_engine() -> None:
+    game = GameOfLife([[2, 2], [2, 2]], engine=VectorizedOcean)
+    assert game.get_next_generation() == [[2, 2], [2, 2]]
+    with pytest.raises(ValueError):
+        GameOfLife([[0]], engine='abacus')
+
+
+def test_neighbour_histogram() -> None:
+    grid = np.array([[1, 2, 3], [2, 0, 3], [1, 1, 2]], dtype=np.uint8)
+    histogram = neighbour_histogram(grid)
+    assert histogram[1, 1] & 0xF == 3 and histogram[1, 1] >> 4 == 2
+    with_rocks = neighbour_histogram(grid, with_rocks=True)
+    assert with_rocks.dtype == np.uint16
+    assert (with_rocks[1, 1] & 0xF, with_rocks[1, 1] >> 4 & 0xF, with_rocks[1, 1] >> 8) == (3, 2, 3)
+    assert (with_rocks & 0xFF).tolist() == histogram.tolist()
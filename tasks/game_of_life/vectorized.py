@@ -0,0 +1,197 @@
+import functools
+import typing as tp
+
+import numpy as np
+import numpy.typing as npt
+
+from .neighbourhood import CELL_WEIGHTS, Boundary, check_boundary
+from .observer import Census
+from .rules import CLASSIC, EMPTY, FISH, SHRIMP, RuleSpec, compile_rules
+
+
+Grid = npt.NDArray[np.uint8]
+Counts = tp.TypeVar('Counts', np.uint8, np.uint16)
+
+# Fish and shrimp weights share one byte: fish count in bits 0-3, shrimp count in bits 4-7
+# (the rock weight, 1 << 8, wraps to zero in uint8)
+_WEIGHTS: Grid = np.array(CELL_WEIGHTS, dtype=np.uint16).astype(np.uint8)
+_WEIGHTS_WITH_ROCKS: npt.NDArray[np.uint16] = np.array(CELL_WEIGHTS, dtype=np.uint16)
+_TWO = np.uint8(2)
+
+# np.pad modes filling the ghost border of each boundary
+_PAD_MODES: dict[Boundary, tp.Literal['constant', 'wrap', 'symmetric']] = {
+    'fixed': 'constant',
+    'torus': 'wrap',
+    'reflect': 'symmetric',
+}
+
+
+def count_neighbours(mask: npt.NDArray[Counts], boundary: Boundary = 'fixed',
+                     ghost_rows: bool = False) -> npt.NDArray[Counts]:
+    """
+    Sums the values of the neighbours of every cell at once using shifted-slice sums
+    over a copy of the mask with a one-cell ghost border, so no cell needs a bounds check.
+    Works on the last two axes, so stacks of boards are counted in one call.
+    :param mask: An array of per-cell values, e.g. zeros and ones.
+    :param boundary: Fills the ghost border: zeros ('fixed'), the opposite edge ('torus')
+                     or the edge itself ('reflect').
+    :param ghost_rows: The first and last rows of `mask` already are the ghost rows (see `with_ghost_rows`),
+                       so only columns are padded and the result has two rows fewer.
+    :return: An array with the sum over the neighbours of each cell.
+    """
+    rows, cols = mask.shape[-2:]
+    if ghost_rows:
+        rows -= 2
+    counts = np.zeros(mask.shape[:-2] + (rows, cols), dtype=mask.dtype)
+    if counts.size == 0:
+        return counts
+
+    padding = [(0, 0)] * (mask.ndim - 2) + [(0, 0) if ghost_rows else (1, 1), (1, 1)]
+    padded = np.pad(mask, padding, mode=_PAD_MODES[check_boundary(boundary)])
+
+    for di in range(3):
+        for dj in range(3):
+            if di == 1 and dj == 1:
+                continue
+            counts += padded[..., di:di + rows, dj:dj + cols]
+    return counts
+
+
+def neighbour_histogram(grid: Grid, with_rocks: bool = False, boundary: Boundary = 'fixed') -> npt.NDArray[tp.Any]:
+    """
+    Counts fish, shrimp and optionally rock neighbours in a single pass over the grid.
+    :param grid: A uint8 array, 0 = empty cell, 1 = rock, 2 = fish, 3 = shrimp.
+    :param with_rocks: Also count rocks, in bits 8-11 of a uint16 result.
+    :param boundary: What lies beyond the edges.
+    :return: Per-cell histograms: fish count in bits 0-3, shrimp count in bits 4-7.
+    """
+    if with_rocks:
+        return count_neighbours(_WEIGHTS_WITH_ROCKS[grid], boundary)
+    return count_neighbours(_WEIGHTS[grid], boundary)
+
+
+def with_ghost_rows(grid: Grid, start: int, stop: int, boundary: Boundary = 'fixed') -> Grid:
+    """
+    Copies a band of rows together with the row above and below it, as seen through the boundary,
+    so the band can be stepped on its own with `ghost_rows=True`.
+    :param grid: A uint8 array, rows on the second-to-last axis.
+    :param start: First row of the band.
+    :param stop: Row after the last one of the band.
+    :param boundary: What lies beyond the edges; past a fixed edge the ghost row is empty.
+    :return: An array of stop - start + 2 rows.
+    """
+    rows = grid.shape[-2]
+    indices = np.arange(start - 1, stop + 1)
+    if check_boundary(boundary) == 'torus':
+        return grid[..., indices % rows, :]
+    if boundary == 'reflect':
+        return grid[..., np.clip(indices, 0, rows - 1), :]
+
+    band = np.zeros(grid.shape[:-2] + (len(indices), grid.shape[-1]), dtype=np.uint8)
+    inside = max(start - 1, 0), min(stop + 1, rows)
+    band[..., inside[0] - (start - 1):inside[1] - (start - 1), :] = grid[..., inside[0]:inside[1], :]
+    return band
+
+
+@functools.lru_cache(maxsize=32)
+def rule_table(rules: RuleSpec = CLASSIC) -> Grid:
+    """
+    :param rules: The rules to compile.
+    :return: A read-only (4, 256) array giving the next state for [cell, histogram byte].
+    """
+    table = np.frombuffer(compile_rules(rules), dtype=np.uint8).reshape(4, 256)
+    table.flags.writeable = False
+    return table
+
+
+class Transitions(object):
+    """
+    Per-cell `old state << 2 | new state` codes left over from applying the rules,
+    from which births and deaths are counted
+    """
+    def __init__(self, codes: Grid) -> None:
+        self.codes = codes
+
+    def tally(self, start: int = 0, stop: int | None = None) -> tuple[int, int, int, int]:
+        """
+        :param start: First row to count (rows are the second-to-last axis).
+        :param stop: Row after the last one to count; None for all remaining rows.
+        :return: Fish born, fish died, shrimp born and shrimp died within the rows.
+        """
+        counts = np.bincount(self.codes[..., start:stop, :].ravel(), minlength=16)
+        return (
+            int(counts[EMPTY << 2 | FISH]),
+            int(counts[FISH << 2 | EMPTY]),
+            int(counts[EMPTY << 2 | SHRIMP]),
+            int(counts[SHRIMP << 2 | EMPTY]),
+        )
+
+
+def next_generation(grid: Grid, rules: RuleSpec = CLASSIC, boundary: Boundary = 'fixed',
+                    ghost_rows: bool = False) -> Grid:
+    """
+    Calculates the next generation of a whole ocean grid.
+    :param grid: A uint8 array, 0 = empty cell, 1 = rock, 2 = fish, 3 = shrimp.
+    :param rules: The rules to apply.
+    :param boundary: What lies beyond the edges.
+    :param ghost_rows: The first and last rows of `grid` are ghost rows from `with_ghost_rows`;
+                       only the rows between them are computed.
+    :return: A new uint8 array with the next generation.
+    """
+    cells = grid[..., 1:-1, :] if ghost_rows else grid
+    return rule_table(rules)[cells, count_neighbours(_WEIGHTS[grid], boundary, ghost_rows)]
+
+
+def apply_rules(grid: Grid, rules: RuleSpec = CLASSIC, boundary: Boundary = 'fixed',
+                ghost_rows: bool = False) -> tuple[Grid, Transitions]:
+    """
+    Calculates the next generation of a whole ocean grid, keeping what each cell turned into.
+    Takes the same arguments as next_generation.
+    :return: A new uint8 array with the next generation and the transitions that produced it.
+    """
+    cells = grid[..., 1:-1, :] if ghost_rows else grid
+    new_grid = next_generation(grid, rules, boundary, ghost_rows)
+    return new_grid, Transitions(cells << _TWO | new_grid)
+
+
+class VectorizedOcean(object):
+    """
+    Ocean stored as a NumPy uint8 array and stepped with whole-grid neighbour counts
+    """
+    def __init__(self, ocean: list[list[int]], rules: RuleSpec = CLASSIC, boundary: Boundary = 'fixed') -> None:
+        """
+        :param ocean: A 2D list representing the initial state of the ocean.
+        :param rules: The rules to apply.
+        :param boundary: What lies beyond the edges.
+        """
+        self.rules = rules
+        self.boundary = check_boundary(boundary)
+        rows = len(ocean)
+        cols = len(ocean[0]) if ocean else 0
+        self.grid: Grid = np.array(ocean, dtype=np.uint8).reshape(rows, cols)
+        self._census = Census.of(self.grid.tobytes())
+
+    def step(self) -> None:
+        """
+        Replaces the grid with the next generation.
+        """
+        self.grid, transitions = apply_rules(self.grid, self.rules, self.boundary)
+        self._census = self._census.next(*transitions.tally())
+
+    def census(self) -> Census:
+        """
+        :return: Population of the current generation and its births and deaths.
+        """
+        return self._census
+
+    def to_ocean(self) -> list[list[int]]:
+        """
+        :return: The current state as a 2D list.
+        """
+        return self.grid.tolist()
+
+    def to_bytes(self) -> bytes:
+        """
+        :return: The current state serialized row by row, one byte per cell.
+        """
+        return self.grid.tobytes()
@@ -0,0 +1,61 @@
+from collections import OrderedDict
+
+from .orders import Item
+
+
+class ItemCatalog(object):
+    """
+    Interns items by item_id, so that every position of the same item shares one Item instance
+    (and so one title string). Items are validated once, by Item itself, when they enter the catalog.
+    With max_items set, the least recently used items are evicted once the catalog is full;
+    an evicted item is simply created again the next time it is asked for.
+    """
+    def __init__(self, max_items: int | None = None) -> None:
+        """
+        :param max_items: Maximum number of items kept; None for no bound.
+        """
+        if max_items is not None and max_items < 1:
+            raise ValueError(f"max_items must be positive, got {max_items}")
+        self.max_items = max_items
+        self._items: OrderedDict[int, Item] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, item_id: object) -> bool:
+        return item_id in self._items
+
+    def get(self, item_id: int) -> Item | None:
+        """
+        :return: The interned item with this id, or None if the catalog does not hold it.
+        """
+        item = self._items.get(item_id)
+        if item is not None:
+            self._items.move_to_end(item_id)
+        return item
+
+    def intern(self, item_id: int, title: str, cost: int) -> Item:
+        """
+        Returns the shared item with these fields, creating it if needed.
+        :raises AssertionError: if the fields are not a valid Item.
+        :raises ValueError: if the catalog holds a different item with the same id.
+        """
+        item = self.get(item_id)
+        if item is None:
+            return self._insert(Item(item_id=item_id, title=title, cost=cost))
+        if item.title != title or item.cost != cost:
+            raise ValueError(f"Item {item_id} is already {item}, cannot intern title={title!r}, cost={cost}")
+        return item
+
+    def add(self, item: Item) -> Item:
+        """
+        Interns an existing item.
+        :return: The shared instance equal to `item`.
+        """
+        return self.intern(item.item_id, item.title, item.cost)
+
+    def _insert(self, item: Item) -> Item:
+        self._items[item.item_id] = item
+        if self.max_items is not None and len(self._items) > self.max_items:
+            self._items.popitem(last=False)
+        return item
@@ -0,0 +1,102 @@
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+from .orders import DISCOUNT_PERCENTS, Order, Position
+
+
+@dataclass
+class IncrementalOrder:
+    """
+    An order whose positions can be edited, keeping its cost up to date in O(1) per edit.
+    Positions are addressed by the handle `add` returns. Counted positions are summed as ints, exactly.
+    A float sum depends on the order of its terms, though, so no running total of weighted positions matches
+    Order's left-to-right `sum` (an exact total of 1 + 2 * 0.05 + 7 * 0.7 is just below 6, the float sum is 6.0).
+    While the order has weighted positions, the first read of the cost after an edit sums the positions again
+    in O(n), as Order does, and the result is cached until the next edit.
+    Positions must be changed through `update`; mutating one in place does not change the totals.
+    """
+    order_id: int
+    have_promo: bool = False
+    _positions: Dict[int, Position] = field(default_factory=dict, init=False, repr=False)
+    _next_handle: int = field(default=0, init=False, repr=False)
+    _integral: int = field(default=0, init=False, repr=False)
+    _weighted: int = field(default=0, init=False, repr=False)
+    _summed: int | None = field(default=None, init=False, repr=False)
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    @property
+    def positions(self) -> List[Position]:
+        """
+        :return: The positions in the order they were added.
+        """
+        return list(self._positions.values())
+
+    @property
+    def subtotal(self) -> int:
+        """
+        :return: The cost before the promo discount.
+        """
+        if not self._weighted:
+            return self._integral
+        if self._summed is None:
+            self._summed = int(sum(position.cost for position in self._positions.values()))
+        return self._summed
+
+    @property
+    def cost(self) -> int:
+        """
+        :return: The cost after the promo discount, if any, computed the way Order does.
+        """
+        if self.have_promo:
+            return int(self.subtotal * (1 - DISCOUNT_PERCENTS / 100))
+        return self.subtotal
+
+    def add(self, position: Position) -> int:
+        """
+        :return: The handle of the new position.
+        """
+        handle = self._next_handle
+        self._next_handle += 1
+        self._positions[handle] = position
+        self._charge(position, 1)
+        return handle
+
+    def remove(self, handle: int) -> Position:
+        """
+        :return: The removed position.
+        :raises KeyError: if no position has this handle.
+        """
+        position = self._positions.pop(handle)
+        self._charge(position, -1)
+        return position
+
+    def update(self, handle: int, position: Position) -> Position:
+        """
+        Replaces a position, keeping its place in the order.
+        :return: The replaced position.
+        :raises KeyError: if no position has this handle.
+        """
+        old = self._positions[handle]
+        self._charge(old, -1)
+        self._positions[handle] = position
+        self._charge(position, 1)
+        return old
+
+    def to_order(self) -> Order:
+        """
+        :return: An Order with the current positions; Order prices them again from scratch.
+        """
+        return Order(self.order_id, self.positions, have_promo=self.have_promo)
+
+    def _charge(self, position: Position, sign: int) -> None:
+        """
+        Adds a position to the running totals, or takes it back with `sign` -1.
+        """
+        self._summed = None
+        cost = position.cost
+        if isinstance(cost, int):
+            self._integral += sign * cost
+        else:
+            self._weighted += sign
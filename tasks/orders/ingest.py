@@ -0,0 +1,224 @@
+"""
+Streaming readers for order dumps too big to hold in memory.
+
+CSV dumps have a header and one row per position, with the rows of an order next to each other:
+    order_id,have_promo,item_id,title,cost,count,weight
+    1,true,10,Spoon,25,4,
+    1,true,11,Cheese,300,,0.25
+Every position has either a count or a weight. An order without positions cannot be written in CSV.
+
+JSON Lines dumps have one order per line:
+    {"order_id": 1, "have_promo": true, "positions": [
+        {"item_id": 10, "title": "Spoon", "cost": 25, "count": 4},
+        {"item_id": 11, "title": "Cheese", "cost": 300, "weight": 0.25}]}
+(written on a single line). have_promo is optional. Fields follow the CSV rules: ids, costs and counts
+must be integral, and have_promo may also be one of the strings CSV accepts.
+
+The readers yield (order_id, positions, have_promo) records one order at a time, reading the file in chunks;
+`to_orders` turns them into Order objects and `to_costs` prices them in NumPy batches.
+"""
+import csv
+import itertools
+import json
+import os
+from contextlib import ExitStack
+from typing import IO, Any, Iterable, Iterator, NamedTuple
+
+from .catalog import ItemCatalog
+from .orders import CountedPosition, Item, Order, Position, WeightedPosition
+from .pricing import OrderRecord, price_orders
+
+
+Source = str | os.PathLike[str] | IO[str]
+
+CHUNK_SIZE = 1 << 16
+CSV_COLUMNS = ('order_id', 'have_promo', 'item_id', 'title', 'cost', 'count', 'weight')
+
+
+class OrderCost(NamedTuple):
+    order_id: int
+    cost: int
+
+
+def _lines(stream: IO[str], chunk_size: int) -> Iterator[str]:
+    """
+    Splits a text stream read `chunk_size` characters at a time into lines, keeping their line ends.
+    """
+    pending = ''
+    while chunk := stream.read(chunk_size):
+        lines = (pending + chunk).split('\n')
+        pending = lines.pop()
+        for line in lines:
+            yield line + '\n'
+    if pending:
+        yield pending
+
+
+def _open(source: Source, stack: ExitStack) -> IO[str]:
+    if isinstance(source, (str, os.PathLike)):
+        return stack.enter_context(open(source, newline='', encoding='utf-8'))
+    return source
+
+
+def _flag(text: str) -> bool:
+    value = text.strip().lower()
+    if value in ('', '0', 'false', 'no'):
+        return False
+    if value in ('1', 'true', 'yes'):
+        return True
+    raise ValueError(f"Not a boolean: {text!r}")
+
+
+def _json_flag(value: Any) -> bool:
+    """
+    Reads a JSON boolean, also accepting 0, 1 and the strings CSV dumps use.
+    """
+    if isinstance(value, str):
+        return _flag(value)
+    if isinstance(value, bool) or value in (0, 1):
+        return bool(value)
+    raise ValueError(f"Not a boolean: {value!r}")
+
+
+def _json_int(value: Any) -> int:
+    """
+    Reads a JSON integer; strings are parsed like CSV fields, and floats must be integral.
+    """
+    if isinstance(value, str):
+        return int(value)
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    raise ValueError(f"Not an integer: {value!r}")
+
+
+def _json_float(value: Any) -> float:
+    if isinstance(value, (str, int, float)) and not isinstance(value, bool):
+        return float(value)
+    raise ValueError(f"Not a number: {value!r}")
+
+
+def _json_title(value: Any) -> str:
+    if not isinstance(value, str):
+        raise ValueError(f"Not a title: {value!r}")
+    return value
+
+
+def _position(item: Item, count: Any, weight: Any) -> Position:
+    """
+    :param count: Count of a counted position, or None.
+    :param weight: Weight of a weighted position, or None.
+    """
+    if count is not None and weight is None:
+        return CountedPosition(item, int(count))
+    if weight is not None and count is None:
+        return WeightedPosition(item, float(weight))
+    raise ValueError("A position needs either a count or a weight")
+
+
+def _item(item_id: int, title: str, cost: int, catalog: ItemCatalog | None) -> Item:
+    if catalog is None:
+        return Item(item_id=item_id, title=title, cost=cost)
+    return catalog.intern(item_id, title, cost)
+
+
+def _json_position(entry: dict[str, Any], catalog: ItemCatalog | None) -> Position:
+    """
+    Reads a position with the same rules as a CSV row: integral ids, costs and counts, a string title
+    and a numeric weight.
+    """
+    item = _item(_json_int(entry['item_id']), _json_title(entry['title']), _json_int(entry['cost']), catalog)
+    count, weight = entry.get('count'), entry.get('weight')
+    return _position(
+        item, None if count is None else _json_int(count), None if weight is None else _json_float(weight)
+    )
+
+
+def read_csv(
+        source: Source,
+        catalog: ItemCatalog | None = None,
+        chunk_size: int = CHUNK_SIZE
+) -> Iterator[OrderRecord]:
+    """
+    Reads a CSV dump order by order. The ids of the orders read so far are kept to reject an order
+    whose rows are split up; all rows of an order must agree on have_promo.
+    :param source: Path or open text file of the dump.
+    :param catalog: Catalog the items are interned in; None to create an Item per position.
+    :param chunk_size: Number of characters read at a time.
+    :return: A generator of (order_id, positions, have_promo) records.
+    """
+    with ExitStack() as stack:
+        reader = csv.DictReader(_lines(_open(source, stack), chunk_size))
+        missing = set(CSV_COLUMNS) - set(reader.fieldnames or ())
+        if missing:
+            raise ValueError(f"CSV dump lacks columns: {', '.join(sorted(missing))}")
+
+        def parse(row: dict[str, str]) -> tuple[int, bool, Position]:
+            try:
+                item = _item(int(row['item_id']), row['title'], int(row['cost']), catalog)
+                position = _position(item, row['count'] or None, row['weight'] or None)
+                return int(row['order_id']), _flag(row['have_promo']), position
+            except (ValueError, AssertionError) as error:
+                raise ValueError(f"Bad position on line {reader.line_num}: {error}") from error
+
+        emitted: set[int] = set()
+        rows = (parse(row) for row in reader)
+        for order_id, group in itertools.groupby(rows, key=lambda row: row[0]):
+            if order_id in emitted:
+                raise ValueError(f"Order {order_id} on line {reader.line_num} is not next to its other rows")
+            emitted.add(order_id)
+            _, have_promo, first = next(group)
+            positions = [first]
+            for _, flag, position in group:
+                if flag != have_promo:
+                    raise ValueError(f"Order {order_id} changes have_promo on line {reader.line_num}")
+                positions.append(position)
+            yield order_id, positions, have_promo
+
+
+def read_jsonl(
+        source: Source,
+        catalog: ItemCatalog | None = None,
+        chunk_size: int = CHUNK_SIZE
+) -> Iterator[OrderRecord]:
+    """
+    Reads a JSON Lines dump order by order; blank lines are skipped.
+    :param source: Path or open text file of the dump.
+    :param catalog: Catalog the items are interned in; None to create an Item per position.
+    :param chunk_size: Number of characters read at a time.
+    :return: A generator of (order_id, positions, have_promo) records.
+    """
+    with ExitStack() as stack:
+        for number, line in enumerate(_lines(_open(source, stack), chunk_size), start=1):
+            if not line.strip():
+                continue
+            try:
+                order = json.loads(line)
+                positions = [_json_position(entry, catalog) for entry in order['positions']]
+                record = _json_int(order['order_id']), positions, _json_flag(order.get('have_promo', False))
+            except (ValueError, KeyError, TypeError, AssertionError) as error:
+                raise ValueError(f"Bad order on line {number}: {error!r}") from error
+            yield record
+
+
+def to_orders(records: Iterable[OrderRecord]) -> Iterator[Order]:
+    """
+    :return: A generator of the priced orders.
+    """
+    for order_id, positions, have_promo in records:
+        yield Order(order_id, list(positions), have_promo=have_promo)
+
+
+def to_costs(records: Iterable[OrderRecord], batch_size: int = 4096) -> Iterator[OrderCost]:
+    """
+    Prices the orders `batch_size` at a time with the columnar pricer, keeping only their costs.
+    :return: A generator of (order_id, cost) records, in the order of `records`.
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be positive, got {batch_size}")
+    iterator = iter(records)
+    while batch := list(itertools.islice(iterator, batch_size)):
+        costs = price_orders(batch)
+        for (order_id, _, _), cost in zip(batch, costs.tolist()):
+            yield OrderCost(order_id, cost)
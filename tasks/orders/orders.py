@@ -6,7 +6,7 @@ from typing import List
 DISCOUNT_PERCENTS = 15
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Item:
     item_id: int
     title: str
@@ -23,6 +23,7 @@ class Item:
 
 
 class Position(ABC):
+    __slots__ = ()  # subclasses declare their own slots
     item: Item
 
     @property
@@ -31,7 +32,7 @@ class Position(ABC):
         pass
 
 
-@dataclass
+@dataclass(slots=True)
 class CountedPosition(Position):
     item: Item
     count: int = 1
@@ -41,7 +42,7 @@ class CountedPosition(Position):
         return self.item.cost * self.count
 
 
-@dataclass
+@dataclass(slots=True)
 class WeightedPosition(Position):
     item: Item
     weight: float = 1.0
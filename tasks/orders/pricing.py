@@ -0,0 +1,170 @@
+import sys
+from dataclasses import dataclass
+from typing import Iterable, Sequence, Tuple, TypeVar
+
+import numpy as np
+import numpy.typing as npt
+
+from .orders import DISCOUNT_PERCENTS, CountedPosition, Position, WeightedPosition
+
+
+OrderRecord = Tuple[int, Sequence[Position], bool]  # order_id, positions, have_promo
+
+Ints = npt.NDArray[np.int64]
+Floats = npt.NDArray[np.float64]
+Flags = npt.NDArray[np.bool_]
+Column = TypeVar('Column', Ints, Floats)
+
+# Totals of counted positions are kept exact in int64, so they must stay well inside its range
+_INT_LIMIT = 2.0 ** 62
+# Since 3.12 the builtin sum adds floats with Neumaier's compensated summation
+_COMPENSATED = sys.version_info >= (3, 12)
+
+
+def _per_order(values: Column, offsets: Ints) -> Column:
+    """
+    Sums the position column `values` order by order; works for orders without positions too.
+    """
+    running = np.concatenate([np.zeros(1, dtype=values.dtype), np.cumsum(values)])
+    return running[offsets[1:]] - running[offsets[:-1]]
+
+
+@dataclass
+class OrderBatch:
+    """
+    Orders laid out as NumPy columns. Order columns have one row per order; position columns have
+    one row per position, the positions of order k being rows offsets[k]:offsets[k + 1] in their original order.
+    Counted positions use `counts` and weighted ones (weighted == True) use `weights`.
+    """
+    order_ids: Ints
+    have_promo: Flags
+    offsets: Ints
+    item_costs: Ints
+    counts: Ints
+    weights: Floats
+    weighted: Flags
+
+    @classmethod
+    def from_records(cls, records: Iterable[OrderRecord]) -> 'OrderBatch':
+        """
+        :param records: (order_id, positions, have_promo) of every order, as they would be given to Order.
+        :return: The orders as columns.
+        """
+        order_ids: list[int] = []
+        have_promo: list[bool] = []
+        offsets = [0]
+        item_costs: list[int] = []
+        counts: list[int] = []
+        weights: list[float] = []
+        weighted: list[bool] = []
+        for order_id, positions, promo in records:
+            order_ids.append(order_id)
+            have_promo.append(promo)
+            for position in positions:
+                if isinstance(position, CountedPosition):
+                    counts.append(position.count)
+                    weights.append(0.0)
+                    weighted.append(False)
+                elif isinstance(position, WeightedPosition):
+                    counts.append(0)
+                    weights.append(position.weight)
+                    weighted.append(True)
+                else:
+                    raise TypeError(f"Cannot price {type(position).__name__} in bulk")
+                item_costs.append(position.item.cost)
+            offsets.append(len(item_costs))
+
+        return cls(
+            order_ids=np.array(order_ids, dtype=np.int64),
+            have_promo=np.array(have_promo, dtype=np.bool_),
+            offsets=np.array(offsets, dtype=np.int64),
+            item_costs=np.array(item_costs, dtype=np.int64),
+            counts=np.array(counts, dtype=np.int64),
+            weights=np.array(weights, dtype=np.float64),
+            weighted=np.array(weighted, dtype=np.bool_),
+        )
+
+    def __len__(self) -> int:
+        return len(self.order_ids)
+
+    def costs(self) -> Ints:
+        """
+        Prices every order the way Order does: position costs are summed left to right (exactly while they are
+        integers, in floating point from the first weighted position on), the total is truncated with int()
+        and promo orders get DISCOUNT_PERCENTS off, truncated again.
+        :return: The cost of every order, in the batch order.
+        """
+        magnitude = _per_order(np.abs(self.item_costs.astype(np.float64) * self.counts), self.offsets)
+        if np.any(magnitude >= _INT_LIMIT):
+            raise OverflowError("Order costs are too large to be priced in bulk")
+
+        counted_costs = self.item_costs * self.counts
+        weighted_costs = self.item_costs * self.weights
+        # Without weighted positions the total is an exact integer whatever the summation order
+        totals = _per_order(counted_costs, self.offsets)
+        mixed = np.flatnonzero(_per_order(self.weighted.astype(np.int64), self.offsets))
+        if len(mixed):
+            totals[mixed] = self._sum_in_order(mixed, counted_costs, weighted_costs)
+
+        promo = self.have_promo
+        totals[promo] = np.trunc(totals[promo] * (1 - DISCOUNT_PERCENTS / 100))
+        return totals
+
+    def _sum_in_order(self, orders: Ints, counted_costs: Ints, weighted_costs: Floats) -> Ints:
+        """
+        Replays the builtin sum over the positions of `orders`, one position rank at a time for all of them at once.
+        :return: The truncated totals of `orders`.
+        """
+        lengths = self.offsets[orders + 1] - self.offsets[orders]
+        # Longest orders first, so that the orders having a position at any rank are a prefix
+        by_length = np.argsort(-lengths, kind='stable')
+        lengths = lengths[by_length]
+        starts = self.offsets[orders[by_length]]
+
+        exact = np.zeros(len(orders), dtype=np.int64)
+        inexact = np.zeros(len(orders), dtype=np.float64)
+        compensation = np.zeros(len(orders), dtype=np.float64)
+        is_float = np.zeros(len(orders), dtype=np.bool_)
+        for rank in range(int(lengths[0])):
+            active = int(np.count_nonzero(lengths > rank))
+            rows = starts[:active] + rank
+            weighted = self.weighted[rows]
+            was_float = is_float[:active]
+            total = inexact[:active]
+
+            # int + float: the integer total is converted, and the sum continues in floating point
+            switching = weighted & ~was_float
+            total[switching] = exact[:active][switching] + weighted_costs[rows[switching]]
+            # float + int: the position cost is converted and added without compensation
+            widened = was_float & ~weighted
+            total[widened] += counted_costs[rows[widened]]
+            # float + float
+            adding = was_float & weighted
+            x = weighted_costs[rows[adding]]
+            before = total[adding]
+            after = before + x
+            if _COMPENSATED:
+                compensation[:active][adding] += np.where(
+                    np.abs(before) >= np.abs(x), (before - after) + x, (x - after) + before
+                )
+            total[adding] = after
+
+            exact[:active] += np.where(was_float | weighted, 0, counted_costs[rows])
+            is_float[:active] |= weighted
+
+        if _COMPENSATED:
+            finite = (compensation != 0) & np.isfinite(compensation)
+            inexact[finite] += compensation[finite]
+        summed = np.where(is_float, np.trunc(inexact), exact).astype(np.int64)
+        totals = np.empty_like(summed)
+        totals[by_length] = summed
+        return totals
+
+
+def price_orders(records: Iterable[OrderRecord]) -> Ints:
+    """
+    Computes the costs of many orders at once.
+    :param records: (order_id, positions, have_promo) of every order, as they would be given to Order.
+    :return: The cost of every order; the same as Order(order_id, positions, have_promo=have_promo).cost.
+    """
+    return OrderBatch.from_records(records).costs()
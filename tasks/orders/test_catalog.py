@@ -0,0 +1,47 @@
+import pytest
+
+from .catalog import ItemCatalog
+from .orders import Item
+
+
+def test_items_are_shared() -> None:
+    catalog = ItemCatalog()
+    spoon = catalog.intern(1, 'Spoon', 25)
+    assert catalog.intern(1, 'Spoon', 25) is spoon
+    assert catalog.add(Item(1, 'Spoon', 25)) is spoon
+    assert catalog.get(1) is spoon
+    assert catalog.get(2) is None
+    assert 1 in catalog and 2 not in catalog
+    assert len(catalog) == 1
+
+
+def test_items_are_validated() -> None:
+    catalog = ItemCatalog()
+    with pytest.raises(AssertionError):
+        catalog.intern(1, '', 25)
+    with pytest.raises(AssertionError):
+        catalog.intern(1, 'Spoon', 0)
+    assert len(catalog) == 0
+
+
+def test_conflicting_item() -> None:
+    catalog = ItemCatalog()
+    catalog.intern(1, 'Spoon', 25)
+    with pytest.raises(ValueError, match='already'):
+        catalog.intern(1, 'Spoon', 30)
+
+
+def test_least_recently_used_is_evicted() -> None:
+    catalog = ItemCatalog(max_items=2)
+    spoon = catalog.intern(1, 'Spoon', 25)
+    catalog.intern(2, 'Fork', 10)
+    assert catalog.get(1) is spoon
+    catalog.intern(3, 'Knife', 30)
+    assert 1 in catalog and 3 in catalog
+    assert 2 not in catalog
+    assert len(catalog) == 2
+
+
+def test_invalid_bound() -> None:
+    with pytest.raises(ValueError):
+        ItemCatalog(max_items=0)
@@ -0,0 +1,100 @@
+import random
+import pytest
+
+from .incremental import IncrementalOrder
+from .orders import Item, Position, CountedPosition, WeightedPosition, Order
+
+
+def random_position(rng: random.Random) -> Position:
+    item = Item(rng.randint(0, 100), 'Thing', rng.randint(1, 1000))
+    if rng.random() < 0.5:
+        return CountedPosition(item, rng.randint(1, 20))
+    return WeightedPosition(item, rng.uniform(0, 3))
+
+
+def recomputed_cost(positions: list[Position], have_promo: bool) -> int:
+    return Order(0, list(positions), have_promo=have_promo).cost
+
+
+@pytest.mark.parametrize('have_promo', [False, True])
+def test_totals_follow_random_edits(have_promo: bool) -> None:
+    rng = random.Random(7)
+    order = IncrementalOrder(order_id=1, have_promo=have_promo)
+    handles: list[int] = []
+    for _ in range(500):
+        action = rng.random()
+        if action < 0.5 or not handles:
+            handles.append(order.add(random_position(rng)))
+        elif action < 0.75:
+            order.remove(handles.pop(rng.randrange(len(handles))))
+        else:
+            order.update(rng.choice(handles), random_position(rng))
+        assert order.cost == recomputed_cost(order.positions, have_promo)
+    assert len(order) == len(handles)
+
+
+def test_random_carts_match_order() -> None:
+    rng = random.Random(11)
+    for _ in range(2000):
+        positions = [random_position(rng) for _ in range(rng.randint(1, 6))]
+        order = IncrementalOrder(order_id=1)
+        for position in positions:
+            order.add(position)
+        assert order.cost == Order(1, positions).cost
+
+
+def test_matches_order() -> None:
+    order = IncrementalOrder(order_id=3, have_promo=True)
+    spoon = order.add(CountedPosition(Item(0, 'Spoon', 256), 2))
+    order.add(WeightedPosition(Item(1, 'Cheese', 300), 0.25))
+    assert order.subtotal == 587
+    assert order.cost == Order(3, order.positions, have_promo=True).cost == 498
+    assert order.update(spoon, CountedPosition(Item(0, 'Spoon', 256), 1)) == CountedPosition(Item(0, 'Spoon', 256), 2)
+    assert order.positions[0].cost == 256
+    assert order.to_order().cost == order.cost == 281
+
+
+@pytest.mark.parametrize('weights, cost', [
+    ([(2, 0.3), (2, 0.1), (10, 0.1), (4, 0.2), (2, 0.7)], 4),
+    ([(2, 0.3), (2, 0.1), (6, 0.15), (1, 0.3)], 2),
+])
+def test_float_sum_just_reaching_an_integer(weights: list[tuple[int, float]], cost: int) -> None:
+    order = IncrementalOrder(order_id=1)
+    for item_cost, weight in weights:
+        order.add(WeightedPosition(Item(0, 'Cheese', item_cost), weight))
+    assert order.cost == order.to_order().cost == cost
+
+
+def test_float_sum_above_the_exact_sum() -> None:
+    positions: list[Position] = [
+        CountedPosition(Item(0, 'Spoon', 1), 1),
+        WeightedPosition(Item(1, 'Cheese', 2), 0.05),
+        WeightedPosition(Item(2, 'Fish', 7), 0.7),
+    ]
+    order = IncrementalOrder(order_id=1)
+    for position in positions:
+        order.add(position)
+    assert order.cost == Order(1, positions).cost == 6
+
+
+def test_cost_follows_position_order() -> None:
+    order = IncrementalOrder(order_id=1)
+    spoon = order.add(CountedPosition(Item(0, 'Spoon', 1), 1))
+    order.add(WeightedPosition(Item(1, 'Cheese', 2), 0.05))
+    order.add(WeightedPosition(Item(2, 'Fish', 7), 0.7))
+    order.remove(spoon)
+    order.add(CountedPosition(Item(0, 'Spoon', 1), 1))
+    assert order.cost == order.to_order().cost
+
+
+def test_remove() -> None:
+    order = IncrementalOrder(order_id=1)
+    position = WeightedPosition(Item(0, 'Cheese', 10), 0.1)
+    handle = order.add(position)
+    assert order.remove(handle) is position
+    assert order.cost == 0
+    assert order.positions == []
+    with pytest.raises(KeyError):
+        order.remove(handle)
+    with pytest.raises(KeyError):
+        order.update(handle, position)
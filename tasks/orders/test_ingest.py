@@ -0,0 +1,145 @@
+import io
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+from .catalog import ItemCatalog
+from .ingest import OrderCost, read_csv, read_jsonl, to_costs, to_orders
+from .orders import Item, Order, CountedPosition, WeightedPosition
+from .pricing import OrderRecord
+
+
+def random_records(count: int, seed: int) -> list[OrderRecord]:
+    rng = random.Random(seed)
+    items = [Item(i, f'Item, "{i}"', rng.randint(1, 1000)) for i in range(20)]
+    return [
+        (
+            order_id,
+            [
+                CountedPosition(item, rng.randint(1, 9)) if rng.random() < 0.5 else WeightedPosition(item, rng.uniform(0, 2))
+                for item in rng.choices(items, k=rng.randint(1, 6))
+            ],
+            rng.random() < 0.5,
+        )
+        for order_id in range(count)
+    ]
+
+
+def to_csv(records: list[OrderRecord]) -> str:
+    lines = ['order_id,have_promo,item_id,title,cost,count,weight']
+    for order_id, positions, have_promo in records:
+        for position in positions:
+            title = '"' + position.item.title.replace('"', '""') + '"'
+            count = position.count if isinstance(position, CountedPosition) else ''
+            weight = repr(position.weight) if isinstance(position, WeightedPosition) else ''
+            lines.append(f'{order_id},{have_promo},{position.item.item_id},{title},{position.item.cost},{count},{weight}')
+    return '\r\n'.join(lines) + '\r\n'
+
+
+def to_jsonl(records: list[OrderRecord]) -> str:
+    return ''.join(
+        json.dumps({
+            'order_id': order_id,
+            'have_promo': have_promo,
+            'positions': [
+                {'item_id': p.item.item_id, 'title': p.item.title, 'cost': p.item.cost, 'count': p.count}
+                if isinstance(p, CountedPosition) else
+                {'item_id': p.item.item_id, 'title': p.item.title, 'cost': p.item.cost, 'weight': p.weight}  # type: ignore
+                for p in positions
+            ],
+        }) + '\n'
+        for order_id, positions, have_promo in records
+    )
+
+
+def priced(records: list[OrderRecord]) -> list[Order]:
+    return [Order(order_id, list(positions), have_promo=have_promo) for order_id, positions, have_promo in records]
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 1 << 16])
+def test_csv_round_trip(chunk_size: int) -> None:
+    records = random_records(50, seed=1)
+    assert list(to_orders(read_csv(io.StringIO(to_csv(records)), chunk_size=chunk_size))) == priced(records)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 1 << 16])
+def test_jsonl_round_trip(chunk_size: int) -> None:
+    records = random_records(50, seed=2)
+    assert list(to_orders(read_jsonl(io.StringIO(to_jsonl(records)), chunk_size=chunk_size))) == priced(records)
+
+
+def test_files_and_costs(tmp_path: Path) -> None:
+    records = random_records(30, seed=3)
+    (tmp_path / 'orders.csv').write_text(to_csv(records), encoding='utf-8')
+    (tmp_path / 'orders.jsonl').write_text(to_jsonl(records), encoding='utf-8')
+    expected = [OrderCost(order.order_id, order.cost) for order in priced(records)]
+    assert list(to_costs(read_csv(tmp_path / 'orders.csv'), batch_size=7)) == expected
+    assert list(to_costs(read_jsonl(str(tmp_path / 'orders.jsonl')), batch_size=7)) == expected
+
+
+def test_reading_is_lazy() -> None:
+    stream = io.StringIO(to_jsonl(random_records(1000, seed=4)))
+    reader = read_jsonl(stream, chunk_size=256)
+    next(reader)
+    assert stream.tell() <= 256 * 4
+
+
+def test_items_are_interned() -> None:
+    catalog = ItemCatalog()
+    records = list(read_csv(io.StringIO(to_csv(random_records(20, seed=5))), catalog=catalog))
+    items = {position.item.item_id: position.item for _, positions, _ in records for position in positions}
+    for _, positions, _ in records:
+        for position in positions:
+            assert position.item is items[position.item.item_id] is catalog.get(position.item.item_id)
+
+
+def test_jsonl_fields_follow_csv_rules() -> None:
+    dump = (
+        '{"order_id": "1", "have_promo": "false", "positions": '
+        '[{"item_id": 1, "title": "Spoon", "cost": "25", "count": 2.0}]}\n'
+        '{"order_id": 2, "have_promo": "true", "positions": [{"item_id": 2, "title": "Fish", "cost": 10, "weight": "0.5"}]}'
+    )
+    assert list(read_jsonl(io.StringIO(dump))) == [
+        (1, [CountedPosition(Item(1, 'Spoon', 25), 2)], False),
+        (2, [WeightedPosition(Item(2, 'Fish', 10), 0.5)], True),
+    ]
+
+
+def test_jsonl_orders_without_positions() -> None:
+    dump = '{"order_id": 1, "positions": []}\n\n{"order_id": 2, "have_promo": true, "positions": []}'
+    assert list(read_jsonl(io.StringIO(dump))) == [(1, [], False), (2, [], True)]
+
+
+@pytest.mark.parametrize('dump, match', [
+    ('order_id,have_promo,item_id,title,cost,count\n', 'lacks columns: weight'),
+    ('order_id,have_promo,item_id,title,cost,count,weight\n1,0,1,Spoon,25,2,0.5\n', 'line 2'),
+    ('order_id,have_promo,item_id,title,cost,count,weight\n1,0,1,Spoon,25,2,\n1,0,1,,25,2,\n', 'line 3'),
+    ('order_id,have_promo,item_id,title,cost,count,weight\n1,maybe,1,Spoon,25,2,\n', 'boolean'),
+    ('order_id,have_promo,item_id,title,cost,count,weight\n1,1,1,Spoon,25,2,\n2,0,1,Spoon,25,1,\n'
+     '1,0,1,Spoon,25,3,\n', 'Order 1 on line 4 is not next to its other rows'),
+    ('order_id,have_promo,item_id,title,cost,count,weight\n1,1,1,Spoon,25,2,\n1,1,1,Spoon,25,1,\n'
+     '1,0,1,Spoon,25,3,\n', 'Order 1 changes have_promo on line 4'),
+])
+def test_bad_csv(dump: str, match: str) -> None:
+    with pytest.raises(ValueError, match=match):
+        list(read_csv(io.StringIO(dump)))
+
+
+@pytest.mark.parametrize('dump', [
+    '{"order_id": 1, "positions": [{"item_id": 1, "title": "Spoon", "cost": 25}]}',
+    '{"order_id": 1, "positions": [{"item_id": 1, "title": "Spoon", "cost": -25, "count": 1}]}',
+    '{"order_id": 1}',
+    '{"order_id": 1, "have_promo": "maybe", "positions": []}',
+    '{"order_id": 1, "have_promo": [], "positions": []}',
+    '{"order_id": 1, "positions": [{"item_id": 1, "title": "Spoon", "cost": 2.5, "count": 1}]}',
+    '{"order_id": 1, "positions": [{"item_id": 1, "title": "Spoon", "cost": 25, "count": 1.5}]}',
+    '{"order_id": 1, "positions": [{"item_id": 1, "title": "Spoon", "cost": true, "count": 1}]}',
+    '{"order_id": 1, "positions": [{"item_id": 1, "title": 7, "cost": 25, "count": 1}]}',
+    '{"order_id": 1, "positions": [{"item_id": 1, "title": "Spoon", "cost": 25, "weight": "heavy"}]}',
+    '{"order_id": 1, "positions": [',
+])
+def test_bad_jsonl(dump: str) -> None:
+    with pytest.raises(ValueError, match='line 2'):
+        list(read_jsonl(io.StringIO('{"order_id": 0, "positions": []}\n' + dump)))
@@ -0,0 +1,32 @@
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from .orders import Item, Position, CountedPosition, WeightedPosition
+
+
+@pytest.mark.parametrize('obj', [
+    Item(0, 'Spoon', 25),
+    CountedPosition(Item(0, 'Spoon', 25), 2),
+    WeightedPosition(Item(0, 'Spoon', 25), 0.5),
+])
+def test_objects_have_no_dict(obj: object) -> None:
+    assert not hasattr(obj, '__dict__')
+    with pytest.raises((AttributeError, TypeError)):
+        obj.colour = 'red'  # type: ignore[attr-defined]
+
+
+def test_slotted_item_keeps_its_semantics() -> None:
+    item = Item(0, 'Spoon', 25)
+    with pytest.raises(FrozenInstanceError):
+        item.cost = 30  # type: ignore[misc]
+    assert item == Item(0, 'Spoon', 25)
+    assert hash(item) == hash(Item(0, 'Spoon', 25))
+    assert Item(1, 'Fork', 25) < item < Item(2, 'Knife', 30)
+
+
+def test_slotted_positions_are_positions() -> None:
+    position = CountedPosition(Item(0, 'Spoon', 25), 2)
+    assert isinstance(position, Position)
+    position.count = 3
+    assert position.cost == 75
@@ -0,0 +1,96 @@
+import random
+from typing import Any
+
+import numpy as np
+import pytest
+
+from .orders import Item, Position, CountedPosition, WeightedPosition, Order
+from .pricing import OrderBatch, OrderRecord, price_orders
+
+
+def random_records(count: int, seed: int) -> list[OrderRecord]:
+    rng = random.Random(seed)
+    items = [Item(item_id=i, title=f'Item {i}', cost=rng.randint(1, 10 ** 6)) for i in range(50)]
+    records: list[OrderRecord] = []
+    for order_id in range(count):
+        positions: list[Position] = []
+        for _ in range(rng.randint(0, 12)):
+            item = rng.choice(items)
+            if rng.random() < 0.4:
+                positions.append(WeightedPosition(item, weight=rng.uniform(0, 5)))
+            else:
+                positions.append(CountedPosition(item, count=rng.randint(1, 30)))
+        records.append((order_id, positions, rng.random() < 0.5))
+    return records
+
+
+def expected_costs(records: list[OrderRecord]) -> list[int]:
+    return [Order(order_id, list(positions), have_promo=promo).cost for order_id, positions, promo in records]
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_random_orders_match_order_cost(seed: int) -> None:
+    records = random_records(500, seed)
+    assert price_orders(records).tolist() == expected_costs(records)
+
+
+@pytest.mark.parametrize('positions, have_promo, cost', [
+    ([], False, 0),
+    ([], True, 0),
+    ([CountedPosition(Item(1, 'Spoon', 256), 2)], True, 435),
+    ([CountedPosition(Item(1, 'Spoon', 3), 1), WeightedPosition(Item(2, 'Fish', 3), 0.1)], False, 3),
+    ([WeightedPosition(Item(2, 'Fish', 10), 0.3), CountedPosition(Item(1, 'Spoon', 7), 3)], True, 20),
+])
+def test_small_orders(positions: list[Position], have_promo: bool, cost: int) -> None:
+    assert price_orders([(1, positions, have_promo)]).tolist() == [cost]
+    assert Order(1, positions, have_promo=have_promo).cost == cost
+
+
+def test_float_summation_order_is_kept() -> None:
+    # 0.1 + 0.2 + 0.7 and 0.7 + 0.2 + 0.1 differ in floating point, and so do their truncations
+    fish = Item(1, 'Fish', 10)
+    records: list[OrderRecord] = [
+        (i, [WeightedPosition(fish, weight) for weight in weights], False)
+        for i, weights in enumerate([(0.01, 0.02, 0.07), (0.07, 0.02, 0.01), (0.1, 0.2, 0.3, 0.4)])
+    ]
+    assert price_orders(records).tolist() == expected_costs(records)
+
+
+def test_batch_columns() -> None:
+    spoon, fish = Item(1, 'Spoon', 5), Item(2, 'Fish', 7)
+    batch = OrderBatch.from_records([
+        (10, [CountedPosition(spoon, 3), WeightedPosition(fish, 0.5)], True),
+        (11, [], False),
+        (12, [CountedPosition(fish)], False),
+    ])
+    assert len(batch) == 3
+    assert batch.order_ids.tolist() == [10, 11, 12]
+    assert batch.have_promo.tolist() == [True, False, False]
+    assert batch.offsets.tolist() == [0, 2, 2, 3]
+    assert batch.item_costs.tolist() == [5, 7, 7]
+    assert batch.counts.tolist() == [3, 0, 1]
+    assert batch.weights.tolist() == [0.0, 0.5, 0.0]
+    assert batch.weighted.tolist() == [False, True, False]
+
+
+def test_empty_batch() -> None:
+    costs = price_orders([])
+    assert costs.dtype == np.int64
+    assert len(costs) == 0
+
+
+def test_unknown_position() -> None:
+    class FreePosition(Position):
+        @property
+        def cost(self) -> float:
+            return 0
+
+    with pytest.raises(TypeError, match='FreePosition'):
+        price_orders([(1, [FreePosition()], False)])
+
+
+def test_overflow() -> None:
+    item = Item(1, 'Yacht', 10 ** 12)
+    positions: Any = [CountedPosition(item, 10 ** 7)] * 1000
+    with pytest.raises(OverflowError):
+        price_orders([(1, positions, False)])